@@ -29,8 +29,11 @@ import asyncio
 import collections
 import collections.abc
 import copy
+import hashlib
 import inspect
+import json
 import logging
+import os
 import sys
 import traceback
 from abc import ABC, abstractmethod
@@ -80,6 +83,108 @@ __all__ = (
 _log = logging.getLogger(__name__)
 
 
+class _CommandSyncManifest:
+    # A record of the commands last pushed to each scope ("global" or a guild
+    # ID), kept in a JSON file. Each scope stores a hash of its commands'
+    # payloads along with the commands the API returned, so a scope whose
+    # commands haven't changed since the last sync can be skipped without
+    # fetching anything.
+
+    VERSION = 1
+
+    def __init__(self, path: str, application_id: int) -> None:
+        self.path = path
+        self.application_id = application_id
+        self.scopes: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, application_id: int) -> _CommandSyncManifest:
+        manifest = cls(os.fspath(path), application_id)
+        try:
+            with open(manifest.path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as exc:
+            _log.warning(
+                "Ignoring unreadable command sync manifest %s: %s", manifest.path, exc
+            )
+            return manifest
+
+        if (
+            isinstance(data, dict)
+            and data.get("version") == cls.VERSION
+            and data.get("application_id") == str(application_id)
+        ):
+            manifest.scopes = data.get("scopes", {})
+        return manifest
+
+    @staticmethod
+    def digest(commands: list[ApplicationCommand]) -> str:
+        payload = sorted(
+            (cmd.to_dict() for cmd in commands),
+            key=lambda data: (data.get("type", 1), data["name"]),
+        )
+        encoded = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    @staticmethod
+    def _key(guild_id: int | None) -> str:
+        return "global" if guild_id is None else str(guild_id)
+
+    def guild_ids(self) -> list[int]:
+        # Guilds that had commands pushed to them on the last sync.
+        return [
+            int(key)
+            for key, entry in self.scopes.items()
+            if key != "global" and entry.get("commands")
+        ]
+
+    def get(
+        self, guild_id: int | None, digest: str
+    ) -> list[interactions.ApplicationCommand] | None:
+        entry = self.scopes.get(self._key(guild_id))
+        if entry is not None and entry.get("hash") == digest:
+            return entry["commands"]
+        return None
+
+    def set(
+        self,
+        guild_id: int | None,
+        digest: str,
+        registered: list[interactions.ApplicationCommand],
+    ) -> None:
+        self.scopes[self._key(guild_id)] = {
+            "hash": digest,
+            "commands": [
+                {
+                    key: cmd[key]
+                    for key in ("id", "name", "type", "guild_id")
+                    if key in cmd
+                }
+                for cmd in registered
+            ],
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        data = {
+            "version": self.VERSION,
+            "application_id": str(self.application_id),
+            "scopes": self.scopes,
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
 class ApplicationCommandMixin(ABC):
     """A mixin that implements common functionality for classes that need
     application command compatibility.
@@ -93,10 +198,20 @@ class ApplicationCommandMixin(ABC):
         methods.
     """
 
+    #: The amount of scopes :meth:`sync_commands` registers commands for at once.
+    COMMAND_SYNC_CONCURRENCY = 8
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
         self._application_commands = {}
+        # (name, guild_id) -> command, for interactions with an unknown command ID
+        self._command_table: dict[tuple[str, int | None], ApplicationCommand] | None = (
+            None
+        )
+        # user ID (or interaction ID without a user) -> the task answering
+        # their latest autocomplete interaction
+        self._autocomplete_tasks: dict[int, asyncio.Task] = {}
 
     @property
     def all_commands(self):
@@ -151,6 +266,7 @@ class ApplicationCommandMixin(ABC):
                 self._application_commands[command.id] = command
                 break
         self._pending_application_commands.append(command)
+        self._command_table = None
 
     def remove_application_command(
         self, command: ApplicationCommand
@@ -173,6 +289,7 @@ class ApplicationCommandMixin(ABC):
         """
         if command.id:
             self._application_commands.pop(command.id, None)
+        self._command_table = None
 
         if command in self._pending_application_commands:
             self._pending_application_commands.remove(command)
@@ -683,6 +800,7 @@ class ApplicationCommandMixin(ABC):
                 )
             cmd.id = i["id"]
             self._application_commands[cmd.id] = cmd
+        self._command_table = None
 
         return registered
 
@@ -719,6 +837,9 @@ class ApplicationCommandMixin(ABC):
             the commands accordingly, as it would have to individually check for each guild. To force the library to
             unregister a guild's commands, call this function with ``commands=[]`` and ``guild_ids=[guild_id]``.
 
+        If :attr:`.Bot.command_sync_manifest` is set, the commands pushed to each scope are recorded in that file, and
+        scopes whose commands haven't changed since are skipped entirely. Guild scopes are synced concurrently.
+
         .. versionadded:: 2.0
 
         Parameters
@@ -755,34 +876,83 @@ class ApplicationCommandMixin(ABC):
             for cmd in commands:
                 cmd.guild_ids = guild_ids
 
-        global_commands = [cmd for cmd in commands if cmd.guild_ids is None]
-        registered_commands = await self.register_commands(
-            global_commands, method=method, force=force, delete_existing=delete_existing
-        )
+        manifest = None
+        path = getattr(self._bot, "command_sync_manifest", None)
+        if path is not None and self._bot.user:
+            manifest = _CommandSyncManifest.load(path, self._bot.user.id)
 
-        registered_guild_commands: dict[int, list[interactions.ApplicationCommand]] = {}
+        semaphore = asyncio.Semaphore(self.COMMAND_SYNC_CONCURRENCY)
 
-        if register_guild_commands:
-            cmd_guild_ids: list[int] = []
-            for cmd in commands:
-                if cmd.guild_ids is not None:
-                    cmd_guild_ids.extend(cmd.guild_ids)
-            if check_guilds is not None:
-                cmd_guild_ids.extend(check_guilds)
-            for guild_id in set(cmd_guild_ids):
-                guild_commands = [
-                    cmd
-                    for cmd in commands
-                    if cmd.guild_ids is not None and guild_id in cmd.guild_ids
-                ]
-                app_cmds = await self.register_commands(
-                    guild_commands,
+        async def sync_scope(
+            scope_commands: list[ApplicationCommand], guild_id: int | None = None
+        ) -> list[interactions.ApplicationCommand]:
+            digest = None
+            if manifest is not None:
+                digest = _CommandSyncManifest.digest(scope_commands)
+                if not force and (cached := manifest.get(guild_id, digest)) is not None:
+                    _log.debug(
+                        "Skipping command sync for guild %s: commands are unchanged",
+                        guild_id,
+                    )
+                    return cached
+
+            async with semaphore:
+                registered = await self.register_commands(
+                    scope_commands,
                     guild_id=guild_id,
                     method=method,
                     force=force,
                     delete_existing=delete_existing,
                 )
-                registered_guild_commands[guild_id] = app_cmds
+            if manifest is not None:
+                manifest.set(guild_id, digest, registered)
+            return registered
+
+        try:
+            global_commands = [cmd for cmd in commands if cmd.guild_ids is None]
+            registered_commands = await sync_scope(global_commands)
+
+            registered_guild_commands: dict[
+                int, list[interactions.ApplicationCommand]
+            ] = {}
+
+            if register_guild_commands:
+                cmd_guild_ids: list[int] = []
+                for cmd in commands:
+                    if cmd.guild_ids is not None:
+                        cmd_guild_ids.extend(cmd.guild_ids)
+                if check_guilds is not None:
+                    cmd_guild_ids.extend(check_guilds)
+                if manifest is not None and delete_existing:
+                    # Guilds we pushed commands to last time, which may need
+                    # them removed now.
+                    cmd_guild_ids.extend(manifest.guild_ids())
+
+                scopes = list(dict.fromkeys(cmd_guild_ids))
+                results = await asyncio.gather(
+                    *(
+                        sync_scope(
+                            [
+                                cmd
+                                for cmd in commands
+                                if cmd.guild_ids is not None
+                                and guild_id in cmd.guild_ids
+                            ],
+                            guild_id,
+                        )
+                        for guild_id in scopes
+                    ),
+                    return_exceptions=True,
+                )
+                # Only raise once every scope is done, so the manifest also
+                # records the scopes that were still syncing when one failed.
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+                registered_guild_commands = dict(zip(scopes, results))
+        finally:
+            if manifest is not None:
+                manifest.save()
 
         for i in registered_commands:
             cmd = get(
@@ -803,7 +973,7 @@ class ApplicationCommandMixin(ABC):
                         and cmd.type == i.get("type")
                         and cmd.guild_ids is not None
                         and (guild_id := i.get("guild_id"))
-                        and guild_id in cmd.guild_ids,
+                        and int(guild_id) in cmd.guild_ids,
                         self.pending_application_commands,
                     )
                     if not cmd:
@@ -811,6 +981,29 @@ class ApplicationCommandMixin(ABC):
                         continue
                     cmd.id = i["id"]
                     self._application_commands[cmd.id] = cmd
+        self._command_table = None
+
+    def _get_command_for(
+        self, name: str, guild_id: int | None
+    ) -> ApplicationCommand | None:
+        # Looks up a command by its name and the guild it was registered in, or
+        # None for global commands. Only the first command for each key is kept,
+        # matching the order of the linear search this replaces. The table is
+        # rebuilt whenever commands are added, removed or registered, and on a
+        # miss, in case it went stale in some other way.
+        table = self._command_table
+        if table is not None and (command := table.get((name, guild_id))):
+            return command
+
+        table = {}
+        for cmd in self.application_commands + self.pending_application_commands:
+            if isinstance(cmd.guild_ids, list):
+                for cmd_guild_id in cmd.guild_ids:
+                    table.setdefault((cmd.name, cmd_guild_id), cmd)
+            elif cmd.guild_ids is None:
+                table.setdefault((cmd.name, None), cmd)
+        self._command_table = table
+        return table.get((name, guild_id))
 
     async def process_application_commands(
         self, interaction: Interaction, auto_sync: bool | None = None
@@ -854,21 +1047,11 @@ class ApplicationCommandMixin(ABC):
             if interaction.data:
                 command = self._application_commands[interaction.data["id"]]  # type: ignore
         except KeyError:
-            for cmd in self.application_commands + self.pending_application_commands:
-                if interaction.data:
-                    guild_id = interaction.data.get("guild_id")
-                    if guild_id:
-                        guild_id = int(guild_id)
-                    if cmd.name == interaction.data["name"] and (  # type: ignore
-                        guild_id == cmd.guild_ids
-                        or (
-                            isinstance(cmd.guild_ids, list)
-                            and guild_id in cmd.guild_ids
-                        )
-                    ):
-                        command = cmd
-                        break
-            else:
+            guild_id = interaction.data.get("guild_id")
+            if guild_id:
+                guild_id = int(guild_id)
+            command = self._get_command_for(interaction.data["name"], guild_id)  # type: ignore
+            if command is None:
                 if auto_sync and interaction.data:
                     guild_id = interaction.data.get("guild_id")
                     if guild_id is None:
@@ -895,18 +1078,23 @@ class ApplicationCommandMixin(ABC):
             ctx.command = command
             return await command.invoke_autocomplete_callback(ctx)
 
+        # A user can only be typing in one option at a time, so a newer
+        # keystroke makes their previous autocomplete stale. Interactions
+        # without a user are never replaced.
+        key = interaction.user.id if interaction.user else interaction.id
+        if (previous := self._autocomplete_tasks.get(key)) is not None:
+            previous.cancel()
+
         autocomplete_task = self._bot.loop.create_task(callback())
+        self._autocomplete_tasks[key] = autocomplete_task
         try:
-            await self._bot.wait_for(
-                "application_command_auto_complete",
-                check=lambda i, c: c == command,
-                timeout=3,
-            )
-        except asyncio.TimeoutError:
-            return
-        else:
-            if not autocomplete_task.done():
-                autocomplete_task.cancel()
+            await autocomplete_task
+        except asyncio.CancelledError:
+            if self._autocomplete_tasks.get(key) is autocomplete_task:
+                raise
+        finally:
+            if self._autocomplete_tasks.get(key) is autocomplete_task:
+                del self._autocomplete_tasks[key]
 
     def slash_command(self, **kwargs):
         """A shortcut decorator that invokes :func:`command` and adds it to
@@ -1179,6 +1367,9 @@ class BotBase(ApplicationCommandMixin, CogMixin, ABC):
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
         self.auto_sync_commands = options.get("auto_sync_commands", True)
+        self.command_sync_manifest: str | os.PathLike | None = options.get(
+            "command_sync_manifest"
+        )
 
         self.debug_guilds = options.pop("debug_guilds", None)
         self.default_command_contexts = options.pop(
@@ -1500,6 +1691,14 @@ class Bot(BotBase, Client):
         :attr:`.process_application_commands` if the command is not found. Defaults to ``True``.
 
         .. versionadded:: 2.0
+    command_sync_manifest: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        The path of a file used to record the commands last pushed to each scope by
+        :meth:`~.Bot.sync_commands`, which then skips the scopes whose commands haven't
+        changed without making any requests. The file is created if it doesn't exist.
+        If the commands are changed by anything else, delete the file or sync with
+        ``force=True``. Defaults to ``None``, which always checks the commands over the API.
+
+        .. versionadded:: 2.7
     default_command_contexts: Collection[:class:`InteractionContextType`]
         The default context types that the bot will use for commands.
         Defaults to a set containing :attr:`InteractionContextType.guild`, :attr:`InteractionContextType.bot_dm`, and
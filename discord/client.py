@@ -47,7 +47,7 @@ from .errors import *
 from .flags import ApplicationFlags, Intents
 from .gateway import *
 from .guild import Guild
-from .http import HTTPClient
+from .http import HTTPClient, HTTPPoolStats, HTTPTransportConfig
 from .invite import Invite
 from .iterators import EntitlementIterator, GuildIterator
 from .mentions import AllowedMentions
@@ -136,6 +136,22 @@ class Client:
         :func:`asyncio.get_event_loop()`.
     connector: Optional[:class:`aiohttp.BaseConnector`]
         The connector to use for connection pooling.
+    transport: Optional[:class:`HTTPTransportConfig`]
+        The configuration of the connection pool used for HTTP requests.
+        This can't be used together with ``connector``.
+
+        .. versionadded:: 2.7
+    coalesce_requests: :class:`bool`
+        Whether concurrent identical ``GET`` requests to the API share a single
+        request, instead of each using up the rate limit. Defaults to ``True``.
+
+        .. versionadded:: 2.7
+    http_cache_ttl: :class:`float`
+        The amount of seconds the responses of ``GET`` requests to the API are
+        cached for, so that identical requests in quick succession are only sent once.
+        Defaults to ``0``, which disables the cache.
+
+        .. versionadded:: 2.7
     proxy: Optional[:class:`str`]
         Proxy URL.
     proxy_auth: Optional[:class:`aiohttp.BasicAuth`]
@@ -158,6 +174,14 @@ class Client:
         currently selected intents.
 
         .. versionadded:: 1.5
+    index_member_names: :class:`bool`
+        Whether guilds keep an index of the names of their cached members, which is
+        filled in as members are cached. This makes :meth:`Guild.get_member_named`
+        and :meth:`Guild.get_members_by_prefix` fast in large guilds, at the cost of
+        memory and of some work whenever a member is cached or renamed.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.7
     chunk_guilds_at_startup: :class:`bool`
         Indicates if :func:`.on_ready` should be delayed to chunk all guilds
         at start-up if necessary. This operation is incredibly slow for large
@@ -239,12 +263,18 @@ class Client:
         proxy: str | None = options.pop("proxy", None)
         proxy_auth: aiohttp.BasicAuth | None = options.pop("proxy_auth", None)
         unsync_clock: bool = options.pop("assume_unsync_clock", True)
+        transport: HTTPTransportConfig | None = options.pop("transport", None)
+        if connector is not None and transport is not None:
+            raise TypeError("connector and transport are mutually exclusive")
         self.http: HTTPClient = HTTPClient(
             connector,
             proxy=proxy,
             proxy_auth=proxy_auth,
             unsync_clock=unsync_clock,
             loop=self.loop,
+            transport=transport,
+            coalesce_requests=options.pop("coalesce_requests", True),
+            cache_ttl=options.pop("http_cache_ttl", 0.0),
         )
 
         self._handlers: dict[str, Callable] = {"ready": self._handle_ready}
@@ -318,6 +348,18 @@ class Client:
         ws = self.ws
         return float("nan") if not ws else ws.latency
 
+    def http_pool_stats(self) -> HTTPPoolStats:
+        """Gets the state of the connection pool used for HTTP requests.
+
+        .. versionadded:: 2.7
+
+        Returns
+        -------
+        :class:`HTTPPoolStats`
+            The state of the connection pool.
+        """
+        return self.http.pool_stats()
+
     def is_ws_ratelimited(self) -> bool:
         """Whether the WebSocket is currently rate limited.
 
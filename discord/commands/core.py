@@ -41,6 +41,7 @@ from typing import (
     Coroutine,
     Generator,
     Generic,
+    Literal,
     TypeVar,
     Union,
 )
@@ -90,6 +91,7 @@ __all__ = (
     "ContextMenuCommand",
     "UserCommand",
     "MessageCommand",
+    "LazyResolved",
 )
 
 if TYPE_CHECKING:
@@ -181,6 +183,188 @@ def _validate_descriptions(obj):
             validate_chat_input_description(string, locale=locale)
 
 
+class _NameIndex:
+    # A name -> item map over a command's options or subcommands. It's built
+    # on first use and again whenever the list is replaced or resized, and
+    # like utils.find, the first item with a name wins.
+
+    __slots__ = ("_items", "_length", "_map")
+
+    def __init__(self) -> None:
+        self._items: list | None = None
+        self._length: int = 0
+        self._map: dict[str, Any] = {}
+
+    def get(self, items: list, name: str) -> Any:
+        if items is not self._items or len(items) != self._length:
+            self._map = {}
+            for item in items:
+                self._map.setdefault(item.name, item)
+            self._items = items
+            self._length = len(items)
+        return self._map.get(name)
+
+
+def _resolve_member(ctx: ApplicationContext, resolved: dict, arg: str) -> Member | None:
+    if (_data := resolved.get("members", {}).get(arg)) is None:
+        return None
+    # we resolved a member from the snowflake
+    if (_user_data := resolved.get("users", {}).get(arg)) is not None:
+        # We resolved the user from the user id
+        _data["user"] = _user_data
+    cache_flag = ctx.interaction._state.member_cache_flags.interaction
+    return ctx.guild._get_and_update_member(_data, int(arg), cache_flag)
+
+
+def _resolve_user_option(ctx: ApplicationContext, resolved: dict, arg: str) -> Any:
+    if (member := _resolve_member(ctx, resolved, arg)) is not None:
+        return member
+    if (_data := resolved.get("users", {}).get(arg)) is not None:
+        return User(state=ctx.interaction._state, data=_data)
+    # We couldn't resolve the object, so we just return an empty object
+    return Object(id=int(arg))
+
+
+def _resolve_mentionable_option(
+    ctx: ApplicationContext, resolved: dict, arg: str
+) -> Any:
+    if (member := _resolve_member(ctx, resolved, arg)) is not None:
+        return member
+    if (_data := resolved.get("users", {}).get(arg)) is not None:
+        return User(state=ctx.interaction._state, data=_data)
+    if (_data := resolved.get("roles", {}).get(arg)) is not None:
+        return Role(state=ctx.interaction._state, data=_data, guild=ctx.guild)
+    return Object(id=int(arg))
+
+
+def _resolve_role_option(ctx: ApplicationContext, resolved: dict, arg: str) -> Any:
+    if (_data := resolved.get("roles", {}).get(arg)) is not None:
+        return Role(state=ctx.interaction._state, data=_data, guild=ctx.guild)
+    return Object(id=int(arg))
+
+
+def _resolve_attachment_option(
+    ctx: ApplicationContext, resolved: dict, arg: str
+) -> Any:
+    if (_data := resolved.get("attachments", {}).get(arg)) is not None:
+        return Attachment(state=ctx.interaction._state, data=_data)
+    return Object(id=int(arg))
+
+
+def _resolve_channel_option(ctx: ApplicationContext, resolved: dict, arg: str) -> Any:
+    if (_data := resolved.get("channels", {}).get(arg)) is None:
+        return Object(id=int(arg))
+
+    if int(arg) in ctx.guild._channels or int(arg) in ctx.guild._threads:
+        channel = ctx.guild.get_channel_or_thread(int(arg))
+        _data["_invoke_flag"] = True
+        (
+            channel._update(_data)
+            if isinstance(channel, Thread)
+            else channel._update(ctx.guild, _data)
+        )
+        return channel
+
+    # NOTE:
+    # This is a fallback in case the channel/thread is not found in the
+    # guild's channels/threads. For channels, if this fallback occurs, at the very minimum,
+    # permissions will be incorrect due to a lack of permission_overwrite data.
+    # For threads, if this fallback occurs, info like thread owner id, message count,
+    # flags, and more will be missing due to a lack of data sent by Discord.
+    obj_type = _threaded_guild_channel_factory(_data["type"])[0]
+    return obj_type(state=ctx.interaction._state, data=_data, guild=ctx.guild)
+
+
+# Builds the object for a user, role, channel, attachment or mentionable option
+# from the interaction's resolved data.
+_OPTION_RESOLVERS: dict[
+    SlashCommandOptionType, Callable[[ApplicationContext, dict, str], Any]
+] = {
+    SlashCommandOptionType.user: _resolve_user_option,
+    SlashCommandOptionType.mentionable: _resolve_mentionable_option,
+    SlashCommandOptionType.role: _resolve_role_option,
+    SlashCommandOptionType.channel: _resolve_channel_option,
+    SlashCommandOptionType.attachment: _resolve_attachment_option,
+}
+
+
+class LazyResolved:
+    """A stand-in for the value of a user, role, channel, attachment or mentionable
+    option, passed to slash commands created with ``resolve="lazy"``.
+
+    The object is only built from the interaction's resolved data the first time
+    an attribute other than :attr:`id` is accessed; attribute access, equality,
+    hashing and :func:`str` are forwarded to it from then on.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The ID of the selected object.
+    """
+
+    __slots__ = ("id", "_resolver", "_object")
+
+    def __init__(self, id: int, resolver: Callable[[], Any]) -> None:
+        self.id: int = id
+        self._resolver: Callable[[], Any] | None = resolver
+        self._object: Any = MISSING
+
+    def __repr__(self) -> str:
+        if self._object is MISSING:
+            return f"<LazyResolved id={self.id}>"
+        return f"<LazyResolved object={self._object!r}>"
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyResolved):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    @property
+    def resolved(self) -> bool:
+        """:class:`bool`: Whether the object has been built yet."""
+        return self._object is not MISSING
+
+    def resolve(self) -> Any:
+        """Builds the object if needed and returns it.
+
+        Returns
+        -------
+        Union[:class:`Member`, :class:`User`, :class:`Role`, :class:`abc.GuildChannel`, :class:`Thread`, :class:`Attachment`, :class:`Object`]
+            The object the option resolved to, as it would have been passed without
+            ``resolve="lazy"``.
+        """
+        if self._object is MISSING:
+            self._object = self._resolver()
+            self._resolver = None
+        return self._object
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_arity(func: Callable) -> int:
+    return len(inspect.signature(func).parameters)
+
+
+def _autocomplete_arity(func: Callable) -> int:
+    # Autocomplete callbacks run on every keystroke, so their signature is only
+    # inspected once.
+    try:
+        return _cached_arity(func)
+    except TypeError:
+        # bound to an unhashable instance
+        return len(inspect.signature(func).parameters)
+
+
 class _BaseCommand:
     __slots__ = ()
 
@@ -333,18 +517,15 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
                 InteractionContextType.private_channel,
             }
 
-    def _prepare_cooldowns(self, ctx: ApplicationContext):
+    async def _prepare_cooldowns(self, ctx: ApplicationContext):
         if self._buckets.valid:
             current = datetime.datetime.now().timestamp()
-            bucket = self._buckets.get_bucket(ctx, current)  # type: ignore # ctx instead of non-existent message
+            bucket, retry_after = await self._buckets._consume(ctx, current)  # type: ignore # ctx instead of non-existent message
 
-            if bucket is not None:
-                retry_after = bucket.update_rate_limit(current)
+            if retry_after:
+                from ..ext.commands.errors import CommandOnCooldown
 
-                if retry_after:
-                    from ..ext.commands.errors import CommandOnCooldown
-
-                    raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+                raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
     async def prepare(self, ctx: ApplicationContext) -> None:
         # This should be same across all 3 types
@@ -360,7 +541,7 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
             await self._max_concurrency.acquire(ctx)  # type: ignore # ctx instead of non-existent message
 
         try:
-            self._prepare_cooldowns(ctx)
+            await self._prepare_cooldowns(ctx)
             await self.call_before_hooks(ctx)
         except:
             if self._max_concurrency is not None:
@@ -400,8 +581,7 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
             The invocation context to reset the cooldown under.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx)  # type: ignore # ctx instead of non-existent message
-            bucket.reset()
+            self._buckets._reset_bucket(ctx)  # type: ignore # ctx instead of non-existent message
 
     def get_cooldown_retry_after(self, ctx: ApplicationContext) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
@@ -722,6 +902,13 @@ class SlashCommand(ApplicationCommand):
         the application installed on their account. Unapplicable for guild commands.
     contexts: Set[:class:`InteractionContextType`]
         The location where this command can be used. Cannot be set if this is a guild command.
+    resolve: :class:`str`
+        How user, role, channel, attachment and mentionable options are passed to the
+        callback. ``"eager"`` (the default) builds the objects before the callback is
+        invoked, while ``"lazy"`` passes a :class:`LazyResolved` that only builds its
+        object once an attribute other than ``id`` is accessed.
+
+        .. versionadded:: 2.7
     """
 
     type = 1
@@ -757,8 +944,16 @@ class SlashCommand(ApplicationCommand):
 
         self.attached_to_group: bool = False
 
+        resolve = kwargs.get("resolve", "eager")
+        if resolve not in ("eager", "lazy"):
+            raise ValueError(
+                f'resolve must be either "eager" or "lazy", not {resolve!r}'
+            )
+        self.resolve: Literal["eager", "lazy"] = resolve
+
         self._options_kwargs = kwargs.get("options", [])
         self.options: list[Option] = []
+        self._option_index = _NameIndex()
         self._validate_parameters()
 
         try:
@@ -967,77 +1162,20 @@ class SlashCommand(ApplicationCommand):
         # TODO: Parse the args better
         kwargs = {}
         for arg in ctx.interaction.data.get("options", []):
-            op = find(lambda x: x.name == arg["name"], self.options)
+            op = self._option_index.get(self.options, arg["name"])
             if op is None:
                 continue
             arg = arg["value"]
 
-            # Checks if input_type is user, role or channel
-            if op.input_type in (
-                SlashCommandOptionType.user,
-                SlashCommandOptionType.role,
-                SlashCommandOptionType.channel,
-                SlashCommandOptionType.attachment,
-                SlashCommandOptionType.mentionable,
-            ):
+            # Checks if input_type is user, role, channel, attachment or mentionable
+            if (resolve := _OPTION_RESOLVERS.get(op.input_type)) is not None:
                 resolved = ctx.interaction.data.get("resolved", {})
-                if (
-                    op.input_type
-                    in (SlashCommandOptionType.user, SlashCommandOptionType.mentionable)
-                    and (_data := resolved.get("members", {}).get(arg)) is not None
-                ):
-                    # The option type is a user, we resolved a member from the snowflake and assigned it to _data
-                    if (_user_data := resolved.get("users", {}).get(arg)) is not None:
-                        # We resolved the user from the user id
-                        _data["user"] = _user_data
-                    cache_flag = ctx.interaction._state.member_cache_flags.interaction
-                    arg = ctx.guild._get_and_update_member(_data, int(arg), cache_flag)
-                elif op.input_type is SlashCommandOptionType.mentionable:
-                    if (_data := resolved.get("users", {}).get(arg)) is not None:
-                        arg = User(state=ctx.interaction._state, data=_data)
-                    elif (_data := resolved.get("roles", {}).get(arg)) is not None:
-                        arg = Role(
-                            state=ctx.interaction._state, data=_data, guild=ctx.guild
-                        )
-                    else:
-                        arg = Object(id=int(arg))
-                elif (
-                    _data := resolved.get(f"{op.input_type.name}s", {}).get(arg)
-                ) is not None:
-                    if op.input_type is SlashCommandOptionType.channel and (
-                        int(arg) in ctx.guild._channels
-                        or int(arg) in ctx.guild._threads
-                    ):
-                        arg = ctx.guild.get_channel_or_thread(int(arg))
-                        _data["_invoke_flag"] = True
-                        (
-                            arg._update(_data)
-                            if isinstance(arg, Thread)
-                            else arg._update(ctx.guild, _data)
-                        )
-                    else:
-                        obj_type = None
-                        kw = {}
-                        if op.input_type is SlashCommandOptionType.user:
-                            obj_type = User
-                        elif op.input_type is SlashCommandOptionType.role:
-                            obj_type = Role
-                            kw["guild"] = ctx.guild
-                        elif op.input_type is SlashCommandOptionType.channel:
-                            # NOTE:
-                            # This is a fallback in case the channel/thread is not found in the
-                            # guild's channels/threads. For channels, if this fallback occurs, at the very minimum,
-                            # permissions will be incorrect due to a lack of permission_overwrite data.
-                            # For threads, if this fallback occurs, info like thread owner id, message count,
-                            # flags, and more will be missing due to a lack of data sent by Discord.
-                            obj_type = _threaded_guild_channel_factory(_data["type"])[0]
-                            kw["guild"] = ctx.guild
-                        elif op.input_type is SlashCommandOptionType.attachment:
-                            obj_type = Attachment
-                        arg = obj_type(state=ctx.interaction._state, data=_data, **kw)
+                if self.resolve == "lazy":
+                    arg = LazyResolved(
+                        int(arg), functools.partial(resolve, ctx, resolved, arg)
+                    )
                 else:
-                    # We couldn't resolve the object, so we just return an empty object
-                    arg = Object(id=int(arg))
+                    arg = resolve(ctx, resolved, arg)
 
             elif (
                 op.input_type == SlashCommandOptionType.string
@@ -1086,7 +1224,7 @@ class SlashCommand(ApplicationCommand):
 
         for op in ctx.interaction.data.get("options", []):
             if op.get("focused", False):
-                option = find(lambda o: o.name == op["name"], self.options)
+                option = self._option_index.get(self.options, op["name"])
                 values.update(
                     {i["name"]: i["value"] for i in ctx.interaction.data["options"]}
                 )
@@ -1095,7 +1233,7 @@ class SlashCommand(ApplicationCommand):
                 ctx.value = op.get("value")
                 ctx.options = values
 
-                if len(inspect.signature(option.autocomplete).parameters) == 2:
+                if _autocomplete_arity(option.autocomplete) == 2:
                     instance = getattr(option.autocomplete, "__self__", ctx.cog)
                     result = option.autocomplete(instance, ctx)
                 else:
@@ -1241,6 +1379,7 @@ class SlashCommandGroup(ApplicationCommand):
         self.subcommands: list[SlashCommand | SlashCommandGroup] = (
             self.__initial_commands__
         )
+        self._subcommand_index = _NameIndex()
         self.guild_ids = guild_ids
         self.parent = parent
         self.attached_to_group: bool = False
@@ -1480,14 +1619,14 @@ class SlashCommandGroup(ApplicationCommand):
     async def _invoke(self, ctx: ApplicationContext) -> None:
         option = ctx.interaction.data["options"][0]
         resolved = ctx.interaction.data.get("resolved", None)
-        command = find(lambda x: x.name == option["name"], self.subcommands)
+        command = self._subcommand_index.get(self.subcommands, option["name"])
         option["resolved"] = resolved
         ctx.interaction.data = option
         await command.invoke(ctx)
 
     async def invoke_autocomplete_callback(self, ctx: AutocompleteContext) -> None:
         option = ctx.interaction.data["options"][0]
-        command = find(lambda x: x.name == option["name"], self.subcommands)
+        command = self._subcommand_index.get(self.subcommands, option["name"])
         ctx.interaction.data = option
         await command.invoke_autocomplete_callback(ctx)
 
@@ -27,7 +27,10 @@ from __future__ import annotations
 
 import collections
 import collections.abc
+import functools
+import re
 import sys
+import time
 import traceback
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, TypeVar
 
@@ -109,6 +112,84 @@ def _is_submodule(parent: str, child: str) -> bool:
     return parent == child or child.startswith(f"{parent}.")
 
 
+def _compile_prefixes(prefixes: tuple[str, ...]) -> Callable[[str], str | None]:
+    # Returns a function giving the first of the prefixes that the content
+    # starts with, or None. The prefixes are checked here rather than in the
+    # cached function, which can't hash anything that isn't a string.
+    for value in prefixes:
+        if not isinstance(value, str):
+            raise TypeError(
+                "Iterable command_prefix or list returned from get_prefix"
+                f" must contain only strings, not {value.__class__.__name__}"
+            )
+    return _prefix_matcher(prefixes)
+
+
+def _no_prefix(content: str) -> None:
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _prefix_matcher(prefixes: tuple[str, ...]) -> Callable[[str], str | None]:
+    # A regex alternation tries its branches in order, so this matches the
+    # first prefix in one pass over the content.
+    if not prefixes:
+        return _no_prefix
+
+    if len(prefixes) == 1:
+        prefix = prefixes[0]
+        return lambda content: prefix if content.startswith(prefix) else None
+
+    match = re.compile("|".join(map(re.escape, prefixes))).match
+
+    def matcher(content: str) -> str | None:
+        result = match(content)
+        return None if result is None else result.group()
+
+    return matcher
+
+
+class _PrefixCache:
+    # An LRU cache of compiled prefix matchers by guild ID, where every entry
+    # expires ttl seconds after it was stored.
+
+    __slots__ = ("ttl", "maxsize", "_entries")
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        self._entries: collections.OrderedDict[
+            int | None, tuple[float, Callable[[str], str | None]]
+        ] = collections.OrderedDict()
+
+    def get(self, key: int | None) -> Callable[[str], str | None] | None:
+        try:
+            expires, matcher = self._entries[key]
+        except KeyError:
+            return None
+
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return matcher
+
+    def set(self, key: int | None, matcher: Callable[[str], str | None]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, matcher)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[int | None] | None = None) -> None:
+        if keys is None:
+            self._entries.clear()
+            return
+
+        for key in keys:
+            self._entries.pop(key, None)
+
+
 class BotBase(GroupMixin, discord.cog.CogMixin):
     _help_command = None
     _supports_prefixed_commands = True
@@ -127,12 +208,36 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
         **options,
     ):
         super().__init__(**options)
+        prefix_cache_ttl: float | None = options.get("prefix_cache_ttl")
+        self._prefix_cache: _PrefixCache | None = None
+        if prefix_cache_ttl:
+            self._prefix_cache = _PrefixCache(
+                prefix_cache_ttl, options.get("prefix_cache_size", 1000)
+            )
         self.command_prefix = command_prefix
         self.help_command = (
             DefaultHelpCommand() if help_command is MISSING else help_command
         )
         self.strip_after_prefix = options.get("strip_after_prefix", False)
 
+    @property
+    def command_prefix(
+        self,
+    ) -> (
+        str
+        | Iterable[str]
+        | Callable[
+            [Bot | AutoShardedBot, Message],
+            str | Iterable[str] | Coroutine[Any, Any, str | Iterable[str]],
+        ]
+    ):
+        return self._command_prefix
+
+    @command_prefix.setter
+    def command_prefix(self, value) -> None:
+        self._command_prefix = value
+        self.invalidate_prefix_cache()
+
     @discord.utils.copy_doc(discord.Client.close)
     async def close(self) -> None:
         for extension in tuple(self.__extensions):
@@ -251,6 +356,75 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
 
         return ret
 
+    def invalidate_prefix_cache(self, *guilds: discord.abc.Snowflake | None) -> None:
+        r"""Removes the cached prefixes of the given guilds, so the next message
+        in them calls :meth:`.get_prefix` again. Passing ``None`` removes the cached
+        prefix for direct messages. Without any arguments, the whole cache is cleared.
+
+        This does nothing if ``prefix_cache_ttl`` isn't set. The cache is cleared
+        automatically when :attr:`.command_prefix` is changed.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        \*guilds: Optional[:class:`~discord.abc.Snowflake`]
+            The guilds to remove the cached prefixes of.
+        """
+        if self._prefix_cache is None:
+            return
+
+        if not guilds:
+            self._prefix_cache.invalidate()
+        else:
+            self._prefix_cache.invalidate(
+                None if guild is None else guild.id for guild in guilds
+            )
+
+    async def _match_prefix(self, message: Message) -> str | None:
+        # Returns the prefix the message starts with, or None if it starts
+        # with none of them.
+        cache = self._prefix_cache
+        key = message.guild and message.guild.id
+        matcher = cache and cache.get(key)
+        if matcher is None:
+            prefix = await self.get_prefix(message)
+            if isinstance(prefix, str):
+                prefix = (prefix,)
+            else:
+                try:
+                    prefix = tuple(prefix)
+                except TypeError:
+                    raise TypeError(
+                        "get_prefix must return either a string or a list of string, "
+                        f"not {prefix.__class__.__name__}"
+                    )
+            matcher = _compile_prefixes(prefix)
+            if cache is not None:
+                cache.set(key, matcher)
+
+        return matcher(message.content)
+
+    def _context_for(
+        self, message: Message, invoked_prefix: str | None, cls: type[CXT]
+    ) -> CXT:
+        view = StringView(message.content)
+        # if the context class' __init__ consumes something from the view this
+        # will be wrong.  That seems unreasonable though.
+        ctx = cls(prefix=None, view=view, bot=self, message=message)
+        if invoked_prefix is None:
+            return ctx
+
+        view.skip_string(invoked_prefix)
+        if self.strip_after_prefix:
+            view.skip_ws()
+
+        invoker = view.get_word()
+        ctx.invoked_with = invoker
+        ctx.prefix = invoked_prefix
+        ctx.command = self.prefixed_commands.get(invoker)
+        return ctx
+
     async def get_context(self, message: Message, *, cls: type[CXT] = Context) -> CXT:
         r"""|coro|
 
@@ -281,55 +455,10 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
             ``cls`` parameter.
         """
 
-        view = StringView(message.content)
-        ctx = cls(prefix=None, view=view, bot=self, message=message)
-
         if message.author.id == self.user.id:  # type: ignore
-            return ctx
-
-        prefix = await self.get_prefix(message)
-        invoked_prefix = prefix
-
-        if isinstance(prefix, str):
-            if not view.skip_string(prefix):
-                return ctx
-        else:
-            try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong.  That seems unreasonable though.
-                if message.content.startswith(tuple(prefix)):
-                    invoked_prefix = discord.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
-
-            except TypeError:
-                if not isinstance(prefix, list):
-                    raise TypeError(
-                        "get_prefix must return either a string or a list of string, "
-                        f"not {prefix.__class__.__name__}"
-                    )
-
-                # It's possible a bad command_prefix got us here.
-                for value in prefix:
-                    if not isinstance(value, str):
-                        raise TypeError(
-                            "Iterable command_prefix or list returned from get_prefix"
-                            " must contain only strings, not"
-                            f" {value.__class__.__name__}"
-                        )
+            return self._context_for(message, None, cls)
 
-                # Getting here shouldn't happen
-                raise
-
-        if self.strip_after_prefix:
-            view.skip_ws()
-
-        invoker = view.get_word()
-        ctx.invoked_with = invoker
-        # type-checker fails to narrow invoked_prefix type.
-        ctx.prefix = invoked_prefix  # type: ignore
-        ctx.command = self.prefixed_commands.get(invoker)
-        return ctx
+        return self._context_for(message, await self._match_prefix(message), cls)
 
     async def invoke(self, ctx: Context) -> None:
         """|coro|
@@ -382,7 +511,18 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
         if message.author.bot:
             return
 
-        ctx = await self.get_context(message)
+        if type(self).get_context is not BotBase.get_context:
+            ctx = await self.get_context(message)
+        else:
+            # messages that can't be commands are dropped before a context
+            # is built for them
+            if message.author.id == self.user.id:  # type: ignore
+                return
+            invoked_prefix = await self._match_prefix(message)
+            if invoked_prefix is None:
+                return
+            ctx = self._context_for(message, invoked_prefix, Context)
+
         await self.invoke(ctx)
 
     async def on_message(self, message):
@@ -448,6 +588,20 @@ class Bot(BotBase, discord.Bot):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    prefix_cache_ttl: Optional[:class:`float`]
+        How long, in seconds, the prefixes returned by :meth:`.get_prefix` are
+        cached for each guild. While a guild's prefixes are cached, messages in
+        it do not call :meth:`.get_prefix`, so this should only be set when the
+        prefixes depend on nothing but the guild. Use
+        :meth:`.invalidate_prefix_cache` when they change. Defaults to ``None``,
+        which disables the cache.
+
+        .. versionadded:: 2.7
+    prefix_cache_size: :class:`int`
+        The maximum number of guilds to cache prefixes for when ``prefix_cache_ttl``
+        is set. The least recently used guilds are dropped first. Defaults to 1000.
+
+        .. versionadded:: 2.7
     """
 
 
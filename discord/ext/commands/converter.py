@@ -1121,12 +1121,29 @@ CONVERTER_MAPPING: dict[type[Any], Any] = {
 }
 
 
-async def _actual_conversion(
-    ctx: Context, converter, argument: str, param: inspect.Parameter
-):
+# How _actual_conversion runs a converter, as worked out by _resolve_converter.
+_CONVERT_BOOL = 0
+_CONVERT_METHOD = 1  # a Converter instance, or a class with a classmethod convert
+_CONVERT_CLASS = 2  # a Converter class that is instantiated for every conversion
+_CONVERT_CALL = 3  # any other callable
+
+# isinstance and issubclass checks against the Converter protocol are slow,
+# so the resolution of classes, which can't change, is remembered.
+_resolved_converters: dict[type, tuple[Any, int]] = {}
+
+
+def _resolve_converter(converter: Any) -> tuple[Any, int]:
     if converter is bool:
-        return _convert_to_bool(argument)
+        return converter, _CONVERT_BOOL
 
+    is_class = inspect.isclass(converter)
+    if is_class:
+        try:
+            return _resolved_converters[converter]
+        except KeyError:
+            pass
+
+    original = converter
     try:
         module = converter.__module__
     except AttributeError:
@@ -1137,18 +1154,44 @@ async def _actual_conversion(
         ):
             converter = CONVERTER_MAPPING.get(converter, converter)
 
-    try:
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        if inspect.ismethod(converter.convert):
+            kind = _CONVERT_METHOD
+        else:
+            kind = _CONVERT_CLASS
+    elif isinstance(converter, Converter):
+        kind = _CONVERT_METHOD
+    else:
+        kind = _CONVERT_CALL
+
+    if is_class:
+        _resolved_converters[original] = (converter, kind)
+    return converter, kind
+
+
+async def _actual_conversion(
+    ctx: Context,
+    converter,
+    argument: str,
+    param: inspect.Parameter,
+    kind: int | None = None,
+):
+    if kind is None:
+        converter, kind = _resolve_converter(converter)
+
+    if kind == _CONVERT_BOOL:
+        return _convert_to_bool(argument)
+
+    if kind != _CONVERT_CALL:
+        try:
+            if kind == _CONVERT_METHOD:
                 return await converter.convert(ctx, argument)
             else:
                 return await converter().convert(ctx, argument)
-        elif isinstance(converter, Converter):
-            return await converter.convert(ctx, argument)
-    except CommandError:
-        raise
-    except Exception as exc:
-        raise ConversionError(converter, exc) from exc
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise ConversionError(converter, exc) from exc
 
     try:
         return converter(argument)
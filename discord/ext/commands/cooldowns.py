@@ -26,9 +26,14 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
 import time
-from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Deque, TypeVar
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Generic, NamedTuple, TypeVar
 
 import discord.abc
 from discord.enums import Enum
@@ -40,15 +45,204 @@ if TYPE_CHECKING:
     from ...message import Message
 
 __all__ = (
+    "BucketCacheInfo",
     "BucketType",
     "Cooldown",
+    "CooldownBackend",
+    "MemoryCooldownBackend",
+    "SocketCooldownBackend",
     "CooldownMapping",
     "DynamicCooldownMapping",
     "MaxConcurrency",
 )
 
+_log = logging.getLogger(__name__)
+
 C = TypeVar("C", bound="CooldownMapping")
 MC = TypeVar("MC", bound="MaxConcurrency")
+B = TypeVar("B")
+
+# How many buckets are kept by default. Buckets are dropped once their cooldown
+# is over, so this only matters when this many keys are on cooldown at once.
+_DEFAULT_MAX_BUCKETS = 100_000
+
+
+def _cooldown_deadline(bucket: Cooldown) -> float:
+    return bucket._last + bucket.per
+
+
+class BucketCacheInfo(NamedTuple):
+    """Statistics about the buckets kept by a :class:`CooldownMapping` or
+    :class:`MaxConcurrency`, as returned by their ``cache_info`` methods.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    size: :class:`int`
+        The number of buckets currently kept.
+    maxsize: Optional[:class:`int`]
+        The maximum number of buckets kept, or ``None`` if unbounded.
+    hits: :class:`int`
+        How many lookups found an existing bucket.
+    misses: :class:`int`
+        How many lookups had to create a bucket.
+    expired: :class:`int`
+        How many buckets were dropped because they were no longer in use.
+    evicted: :class:`int`
+        How many buckets still in use were dropped to stay within ``maxsize``.
+    """
+
+    size: int
+    maxsize: int | None
+    hits: int
+    misses: int
+    expired: int
+    evicted: int
+
+
+class _BucketCache(Generic[B]):
+    # Buckets by key, ordered from least to most recently used, so the least
+    # recently used ones are evicted once there are more than maxsize. If the
+    # buckets expire, a heap orders their keys by when they were last seen to
+    # expire. Expiring pops from it and re-schedules the buckets that were used
+    # since, so each bucket is checked about once per use instead of every
+    # bucket being scanned on each lookup.
+
+    __slots__ = (
+        "_data",
+        "_deadline",
+        "_heap",
+        "_scheduled",
+        "_counter",
+        "maxsize",
+        "hits",
+        "misses",
+        "expired",
+        "evicted",
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        deadline: Callable[[B], float] | None = None,
+    ) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self._data: OrderedDict[Any, B] = OrderedDict()
+        self._deadline: Callable[[B], float] | None = deadline
+        self._heap: list[tuple[float, int, Any]] = []
+        # the deadline each key is in the heap with, older entries are skipped
+        self._scheduled: dict[Any, float] = {}
+        self._counter = itertools.count()
+        self.maxsize: int | None = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.expired: int = 0
+        self.evicted: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: Any) -> B | None:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._data[key]
+
+    def peek(self, key: Any) -> B | None:
+        return self._data.get(key)
+
+    def _schedule(self, key: Any, when: float) -> None:
+        self._scheduled[key] = when
+        heapq.heappush(self._heap, (when, next(self._counter), key))
+
+    def set(self, key: Any, bucket: B) -> None:
+        self._data[key] = bucket
+        self._data.move_to_end(key)
+        if self._deadline is not None:
+            self._schedule(key, self._deadline(bucket))
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                self._scheduled.pop(evicted, None)
+                self.evicted += 1
+
+    def pop(self, key: Any) -> B | None:
+        self._scheduled.pop(key, None)
+        return self._data.pop(key, None)
+
+    def expire(self, current: float) -> None:
+        # Drops the buckets whose deadline is before ``current``.
+        deadline = self._deadline
+        heap = self._heap
+        data = self._data
+        scheduled = self._scheduled
+        while heap and heap[0][0] < current:
+            when, _, key = heapq.heappop(heap)
+            if scheduled.get(key) != when:
+                # removed, or re-scheduled since
+                continue
+            bucket = data[key]
+            new_deadline = deadline(bucket)  # type: ignore
+            if current > new_deadline:
+                del data[key]
+                del scheduled[key]
+                self.expired += 1
+            else:
+                self._schedule(key, new_deadline)
+
+        # entries of removed keys pile up if their deadline is far away
+        if len(heap) > 2 * len(scheduled) + 64:
+            self._heap = [
+                (when, next(self._counter), key) for key, when in scheduled.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def copy(self) -> _BucketCache[B]:
+        ret = _BucketCache(self.maxsize, self._deadline)
+        ret._data = self._data.copy()
+        ret._heap = self._heap.copy()
+        ret._scheduled = self._scheduled.copy()
+        # keys may not be orderable, so new entries must not tie with old ones
+        ret._counter = itertools.count(next(self._counter))
+        return ret
+
+    def info(self) -> BucketCacheInfo:
+        return BucketCacheInfo(
+            len(self._data),
+            self.maxsize,
+            self.hits,
+            self.misses,
+            self.expired,
+            self.evicted,
+        )
+
+
+def _snowflake_id(obj: Any) -> int:
+    # Objects in bucket keys are identified by their ID, such as the author of
+    # a message returned by a custom bucket type.
+    object_id = getattr(obj, "id", None)
+    if not isinstance(object_id, int):
+        raise TypeError(
+            "Bucket keys used with a cooldown backend must be JSON serializable or"
+            f" have an integer id, not {obj.__class__.__name__}"
+        )
+    return object_id
+
+
+def _backend_key(namespace: str | None, key: Any) -> str:
+    # The key has to be the same in every process sharing the backend, which
+    # repr() doesn't guarantee for arbitrary objects.
+    return f"{namespace}:" + json.dumps(
+        key, separators=(",", ":"), default=_snowflake_id
+    )
 
 
 class BucketType(Enum):
@@ -204,21 +398,430 @@ class Cooldown:
         )
 
 
+class CooldownBackend:
+    """The base class for where the state of cooldowns and maximum concurrency is
+    kept, so that it can be shared by several processes.
+
+    Backends are passed to :func:`.cooldown`, :func:`.dynamic_cooldown` and
+    :func:`.max_concurrency`. Every method is called with a key that is unique to
+    the command and bucket, and each one has to be applied atomically.
+
+    .. versionadded:: 2.7
+    """
+
+    async def update_rate_limit(
+        self, key: str, bucket: Cooldown, current: float
+    ) -> float | None:
+        """|coro|
+
+        Uses a token from the cooldown stored under ``key``, creating it with the
+        rate and period of ``bucket`` if it doesn't exist yet. ``bucket`` is then
+        updated to the stored state.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the cooldown.
+        bucket: :class:`.Cooldown`
+            This process' copy of the cooldown.
+        current: :class:`float`
+            The time in seconds since Unix epoch to update the rate limit at.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The retry-after time in seconds if rate limited.
+        """
+        raise NotImplementedError
+
+    async def reset(self, key: str) -> None:
+        """|coro|
+
+        Resets the cooldown stored under ``key``.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the cooldown.
+        """
+        raise NotImplementedError
+
+    async def acquire(self, key: str, number: int, *, wait: bool = False) -> bool:
+        """|coro|
+
+        Takes one of ``number`` concurrency slots stored under ``key``.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the concurrency bucket.
+        number: :class:`int`
+            The maximum number of slots that can be taken at once.
+        wait: :class:`bool`
+            Whether to wait until a slot is released if all of them are in use.
+            Cancelling the wait must not leave a slot taken.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a slot was taken. ``False`` if all of them are in use
+            and ``wait`` is ``False``.
+        """
+        raise NotImplementedError
+
+    async def release(self, key: str) -> None:
+        """|coro|
+
+        Gives back a slot taken with :meth:`acquire`.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the concurrency bucket.
+        """
+        raise NotImplementedError
+
+
+class MemoryCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that keeps its state in the memory of the
+    current process.
+
+    This is what :class:`SocketCooldownBackend` servers use to store their state,
+    and is also useful to share cooldowns between several commands.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    max_buckets: Optional[:class:`int`]
+        The maximum number of cooldowns to keep track of. Once there are more,
+        the least recently used ones are dropped. Defaults to 100,000, pass
+        ``None`` to keep every cooldown in use.
+    """
+
+    def __init__(self, *, max_buckets: int | None = _DEFAULT_MAX_BUCKETS) -> None:
+        self._cooldowns: _BucketCache[Cooldown] = _BucketCache(
+            max_buckets, deadline=_cooldown_deadline
+        )
+        self._slots: dict[str, int] = {}
+        self._waiters: dict[str, Deque[asyncio.Future]] = {}
+
+    def cache_info(self) -> BucketCacheInfo:
+        """Returns statistics about the cooldowns kept by this backend."""
+        return self._cooldowns.info()
+
+    async def update_rate_limit(
+        self, key: str, bucket: Cooldown, current: float
+    ) -> float | None:
+        cache = self._cooldowns
+        cache.expire(current)
+        stored = cache.get(key)
+        if stored is None:
+            stored = bucket.copy()
+            cache.set(key, stored)
+
+        retry_after = stored.update_rate_limit(current)
+        bucket._tokens = stored._tokens
+        bucket._window = stored._window
+        bucket._last = stored._last
+        return retry_after
+
+    async def reset(self, key: str) -> None:
+        self._cooldowns.pop(key)
+
+    async def acquire(self, key: str, number: int, *, wait: bool = False) -> bool:
+        while (taken := self._slots.get(key, 0)) >= number:
+            if not wait:
+                return False
+
+            future = asyncio.get_running_loop().create_future()
+            waiters = self._waiters.setdefault(key, deque())
+            waiters.append(future)
+            try:
+                await future
+            except BaseException:
+                if future.cancelled():
+                    self._remove_waiter(key, future)
+                else:
+                    # woken up, so another waiter gets the slot instead
+                    self._wake_up(key)
+                raise
+
+        self._slots[key] = taken + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        taken = self._slots.get(key, 0) - 1
+        if taken > 0:
+            self._slots[key] = taken
+        else:
+            self._slots.pop(key, None)
+        self._wake_up(key)
+
+    def _remove_waiter(self, key: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            # already skipped by _wake_up
+            pass
+        if not waiters:
+            del self._waiters[key]
+
+    def _wake_up(self, key: str) -> None:
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                break
+        if not waiters:
+            del self._waiters[key]
+
+
+class SocketCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that keeps its state in a server listening on a
+    Unix domain socket, so that several processes on the same machine can share
+    cooldowns and maximum concurrency.
+
+    One process has to run the server with :meth:`serve`. Every operation is a
+    single request to it, and requests from the same process are pipelined over
+    one connection.
+
+    .. versionadded:: 2.7
+
+    .. note::
+
+        Concurrency slots taken by a process that exits without releasing them are
+        only freed when the server is restarted.
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the server's socket.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path: str = os.fspath(path)
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._connecting: asyncio.Lock | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        # keys of cancelled waiting acquires, which may still take a slot
+        self._abandoned: dict[int, str] = {}
+        self._ids = itertools.count()
+
+    @classmethod
+    async def serve(
+        cls, path: str | os.PathLike, backend: CooldownBackend | None = None
+    ) -> asyncio.AbstractServer:
+        """|coro|
+
+        Starts a server for clients to connect to at ``path``.
+
+        Parameters
+        ----------
+        path: Union[:class:`str`, :class:`os.PathLike`]
+            The path of the socket to listen on.
+        backend: Optional[:class:`CooldownBackend`]
+            Where the server keeps its state. Defaults to a new
+            :class:`MemoryCooldownBackend`.
+
+        Returns
+        -------
+        :class:`asyncio.AbstractServer`
+            The running server.
+        """
+        if backend is None:
+            backend = MemoryCooldownBackend()
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            # acquires waiting for a slot run in their own task, so they
+            # don't hold up the requests pipelined after them
+            waiting: dict[int, asyncio.Task] = {}
+
+            async def wait_for_slot(nonce: int, key: str, number: int) -> None:
+                try:
+                    result = await backend.acquire(key, number, wait=True)
+                except asyncio.CancelledError:
+                    result = False
+                except Exception:
+                    _log.exception("Waiting for a concurrency slot failed.")
+                    writer.close()
+                    return
+                finally:
+                    waiting.pop(nonce, None)
+                if not writer.is_closing():
+                    writer.write(json.dumps([nonce, result]).encode() + b"\n")
+
+            try:
+                while line := await reader.readline():
+                    nonce, op, *args = json.loads(line)
+                    if op == "acquire" and args[2]:
+                        waiting[nonce] = asyncio.create_task(
+                            wait_for_slot(nonce, args[0], args[1])
+                        )
+                        continue
+                    if op == "cancel":
+                        # answered by the cancelled request
+                        task = waiting.get(args[0])
+                        if task is not None:
+                            task.cancel()
+                        continue
+
+                    if op == "hit":
+                        key, rate, per, current = args
+                        bucket = Cooldown(rate, per)
+                        retry_after = await backend.update_rate_limit(
+                            key, bucket, current
+                        )
+                        result = [retry_after, bucket._tokens, bucket._window]
+                    elif op == "reset":
+                        result = await backend.reset(*args)
+                    elif op == "acquire":
+                        result = await backend.acquire(args[0], args[1])
+                    elif op == "release":
+                        result = await backend.release(*args)
+                    else:
+                        raise ValueError(f"unknown cooldown operation {op!r}")
+                    writer.write(json.dumps([nonce, result]).encode() + b"\n")
+            except (ConnectionError, ValueError) as exc:
+                _log.warning("Closing cooldown backend connection: %s", exc)
+            except Exception:
+                _log.exception("Closing cooldown backend connection.")
+            finally:
+                for task in list(waiting.values()):
+                    task.cancel()
+                writer.close()
+
+        return await asyncio.start_unix_server(handle, os.fspath(path))
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+        async with self._connecting:
+            if self._writer is None or self._writer.is_closing():
+                reader, self._writer = await asyncio.open_unix_connection(self.path)
+                self._reader_task = asyncio.create_task(self._read(reader))
+        return self._writer
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                nonce, result = json.loads(line)
+                future = self._pending.pop(nonce, None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+                elif (key := self._abandoned.pop(nonce, None)) and result:
+                    # the slot was taken before the server saw the cancellation
+                    self._send("release", key)
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            self._abandoned.clear()
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionResetError("Lost connection to the cooldown server")
+                    )
+
+    def _send(self, op: str, *args: Any) -> int:
+        nonce = next(self._ids)
+        self._writer.write(json.dumps([nonce, op, *args]).encode() + b"\n")  # type: ignore
+        return nonce
+
+    async def _request(self, op: str, *args: Any) -> Any:
+        await self._connect()
+        nonce = self._send(op, *args)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            return await future
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the connection to the server.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+    async def update_rate_limit(
+        self, key: str, bucket: Cooldown, current: float
+    ) -> float | None:
+        retry_after, bucket._tokens, bucket._window = await self._request(
+            "hit", key, bucket.rate, bucket.per, current
+        )
+        bucket._last = current
+        return retry_after
+
+    async def reset(self, key: str) -> None:
+        await self._request("reset", key)
+
+    async def acquire(self, key: str, number: int, *, wait: bool = False) -> bool:
+        if not wait:
+            return await self._request("acquire", key, number, False)
+
+        await self._connect()
+        nonce = self._send("acquire", key, number, True)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                if future.result():
+                    self._send("release", key)
+            elif self._writer is not None and not self._writer.is_closing():
+                self._abandoned[nonce] = key
+                self._send("cancel", nonce)
+            raise
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def release(self, key: str) -> None:
+        await self._request("release", key)
+
+
 class CooldownMapping:
     def __init__(
         self,
         original: Cooldown | None,
         type: Callable[[Message], Any],
+        *,
+        max_buckets: int | None = _DEFAULT_MAX_BUCKETS,
+        backend: CooldownBackend | None = None,
+        namespace: str | None = None,
     ) -> None:
         if not callable(type):
             raise TypeError("Cooldown type must be a BucketType or callable")
 
-        self._cache: dict[Any, Cooldown] = {}
+        # With a backend, the cache only mirrors the state this process last
+        # saw, for is_on_cooldown and friends.
+        self._cache: _BucketCache[Cooldown] = _BucketCache(
+            max_buckets, deadline=_cooldown_deadline
+        )
         self._cooldown: Cooldown | None = original
         self._type: Callable[[Message], Any] = type
+        self.backend: CooldownBackend | None = backend
+        self.namespace: str | None = namespace
+        self._tasks: set[asyncio.Task] = set()
 
     def copy(self) -> CooldownMapping:
-        ret = CooldownMapping(self._cooldown, self._type)
+        ret = CooldownMapping(
+            self._cooldown, self._type, backend=self.backend, namespace=self.namespace
+        )
         ret._cache = self._cache.copy()
         return ret
 
@@ -230,9 +833,22 @@ class CooldownMapping:
     def type(self) -> Callable[[Message], Any]:
         return self._type
 
+    @property
+    def max_buckets(self) -> int | None:
+        return self._cache.maxsize
+
     @classmethod
-    def from_cooldown(cls: type[C], rate, per, type) -> C:
-        return cls(Cooldown(rate, per), type)
+    def from_cooldown(
+        cls: type[C], rate, per, type, *, max_buckets: int | None = _DEFAULT_MAX_BUCKETS
+    ) -> C:
+        return cls(Cooldown(rate, per), type, max_buckets=max_buckets)
+
+    def cache_info(self) -> BucketCacheInfo:
+        """Returns statistics about the buckets kept by this mapping.
+
+        .. versionadded:: 2.7
+        """
+        return self._cache.info()
 
     def _bucket_key(self, msg: Message) -> Any:
         return self._type(msg)
@@ -242,9 +858,7 @@ class CooldownMapping:
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s, and it has not been used in 60s then that key should be deleted
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        self._cache.expire(current)
 
     def create_bucket(self, message: Message) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
@@ -255,12 +869,11 @@ class CooldownMapping:
 
         self._verify_cache_integrity(current)
         key = self._bucket_key(message)
-        if key not in self._cache:
+        bucket = self._cache.get(key)
+        if bucket is None:
             bucket = self.create_bucket(message)
             if bucket is not None:
-                self._cache[key] = bucket
-        else:
-            bucket = self._cache[key]
+                self._cache.set(key, bucket)
 
         return bucket
 
@@ -270,16 +883,59 @@ class CooldownMapping:
         bucket = self.get_bucket(message, current)
         return bucket.update_rate_limit(current)
 
+    def _backend_key(self, message: Message) -> str:
+        return _backend_key(self.namespace, self._bucket_key(message))
+
+    async def _consume(
+        self, message: Message, current: float
+    ) -> tuple[Cooldown | None, float | None]:
+        # Uses a token from the message's bucket, through the backend if there
+        # is one, and returns the bucket with the retry-after time.
+        bucket = self.get_bucket(message, current)
+        if bucket is None:
+            return None, None
+        if self.backend is None:
+            return bucket, bucket.update_rate_limit(current)
+        retry_after = await self.backend.update_rate_limit(
+            self._backend_key(message), bucket, current
+        )
+        return bucket, retry_after
+
+    def _reset_bucket(self, message: Message) -> None:
+        bucket = self.get_bucket(message)
+        if bucket is not None:
+            bucket.reset()
+        if self.backend is not None:
+            # keep a reference, as the loop only keeps a weak one
+            task = asyncio.ensure_future(self.backend.reset(self._backend_key(message)))
+            self._tasks.add(task)
+            task.add_done_callback(self._reset_done)
+
+    def _reset_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _log.error("Resetting a cooldown in its backend failed.", exc_info=exc)
+
 
 class DynamicCooldownMapping(CooldownMapping):
     def __init__(
-        self, factory: Callable[[Message], Cooldown], type: Callable[[Message], Any]
+        self,
+        factory: Callable[[Message], Cooldown],
+        type: Callable[[Message], Any],
+        *,
+        max_buckets: int | None = _DEFAULT_MAX_BUCKETS,
+        backend: CooldownBackend | None = None,
+        namespace: str | None = None,
     ) -> None:
-        super().__init__(None, type)
+        super().__init__(
+            None, type, max_buckets=max_buckets, backend=backend, namespace=namespace
+        )
         self._factory: Callable[[Message], Cooldown] = factory
 
     def copy(self) -> DynamicCooldownMapping:
-        ret = DynamicCooldownMapping(self._factory, self._type)
+        ret = DynamicCooldownMapping(
+            self._factory, self._type, backend=self.backend, namespace=self.namespace
+        )
         ret._cache = self._cache.copy()
         return ret
 
@@ -352,13 +1008,25 @@ class _Semaphore:
 
 
 class MaxConcurrency:
-    __slots__ = ("number", "per", "wait", "_mapping")
+    __slots__ = ("number", "per", "wait", "backend", "namespace", "_mapping")
 
-    def __init__(self, number: int, *, per: BucketType, wait: bool) -> None:
-        self._mapping: dict[Any, _Semaphore] = {}
+    def __init__(
+        self,
+        number: int,
+        *,
+        per: BucketType,
+        wait: bool,
+        backend: CooldownBackend | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        # Semaphores are removed once nothing holds or waits on them, so
+        # this never needs to expire or evict anything.
+        self._mapping: _BucketCache[_Semaphore] = _BucketCache()
         self.per: BucketType = per
         self.number: int = number
         self.wait: bool = wait
+        self.backend: CooldownBackend | None = backend
+        self.namespace: str | None = namespace
 
         if number <= 0:
             raise ValueError("max_concurrency 'number' cannot be less than 1")
@@ -369,7 +1037,13 @@ class MaxConcurrency:
             )
 
     def copy(self: MC) -> MC:
-        return self.__class__(self.number, per=self.per, wait=self.wait)
+        return self.__class__(
+            self.number,
+            per=self.per,
+            wait=self.wait,
+            backend=self.backend,
+            namespace=self.namespace,
+        )
 
     def __repr__(self) -> str:
         return (
@@ -379,13 +1053,26 @@ class MaxConcurrency:
     def get_key(self, message: Message) -> Any:
         return self.per.get_key(message)
 
+    def cache_info(self) -> BucketCacheInfo:
+        """Returns statistics about the buckets currently in use.
+
+        .. versionadded:: 2.7
+        """
+        return self._mapping.info()
+
     async def acquire(self, message: Message) -> None:
         key = self.get_key(message)
 
-        try:
-            sem = self._mapping[key]
-        except KeyError:
-            self._mapping[key] = sem = _Semaphore(self.number)
+        if self.backend is not None:
+            backend_key = _backend_key(self.namespace, key)
+            if not await self.backend.acquire(backend_key, self.number, wait=self.wait):
+                raise MaxConcurrencyReached(self.number, self.per)
+            return
+
+        sem = self._mapping.get(key)
+        if sem is None:
+            sem = _Semaphore(self.number)
+            self._mapping.set(key, sem)
 
         acquired = await sem.acquire(wait=self.wait)
         if not acquired:
@@ -396,13 +1083,15 @@ class MaxConcurrency:
         # But it might be more useful in the future
         key = self.get_key(message)
 
-        try:
-            sem = self._mapping[key]
-        except KeyError:
+        if self.backend is not None:
+            await self.backend.release(_backend_key(self.namespace, key))
+            return
+
+        sem = self._mapping.peek(key)
+        if sem is None:
             # ...? peculiar
             return
-        else:
-            sem.release()
+        sem.release()
 
         if sem.value >= self.number and not sem.is_active():
-            del self._mapping[key]
+            self._mapping.pop(key)
@@ -56,10 +56,19 @@ from ...enums import ChannelType
 from ...errors import *
 from .cog import Cog
 from .context import Context
-from .converter import Greedy, get_converter, run_converters
+from .converter import (
+    Greedy,
+    _actual_conversion,
+    _resolve_converter,
+    get_converter,
+    is_generic_type,
+    run_converters,
+)
 from .cooldowns import (
+    _DEFAULT_MAX_BUCKETS,
     BucketType,
     Cooldown,
+    CooldownBackend,
     CooldownMapping,
     DynamicCooldownMapping,
     MaxConcurrency,
@@ -197,6 +206,67 @@ def hooked_wrapped_callback(command, ctx, coro):
     return wrapped
 
 
+class _ParameterStep:
+    # A parameter of a command's callback with everything needed to parse it
+    # worked out from its annotation up front, so invoking the command
+    # doesn't have to inspect the annotation again.
+
+    __slots__ = (
+        "name",
+        "param",
+        "converter",
+        "greedy",
+        "default",
+        "required",
+        "optional",
+        "constructible_flags",
+        "kind",
+    )
+
+    def __init__(self, command: Command, param: inspect.Parameter) -> None:
+        self.name: str = param.name
+        self.param: inspect.Parameter = param
+        annotation = param.annotation
+        if isinstance(annotation, Option):
+            self.default: Any = annotation.default
+            self.required: bool = annotation.required
+        else:
+            self.default = param.default
+            self.required = param.default is param.empty
+
+        converter = get_converter(param)
+        self.greedy: Greedy | None = None
+        if isinstance(converter, Greedy):
+            self.greedy = converter
+            converter = converter.converter
+
+        self.optional: bool = command._is_typing_optional(annotation)
+        self.constructible_flags: bool = (
+            hasattr(converter, "__commands_is_flag__")
+            and converter._can_be_constructible()
+        )
+
+        # run_converters only does more than _actual_conversion for Union,
+        # Literal and generic annotations, so for the others the converter is
+        # resolved here and invoking the command skips straight to it
+        self.kind: int | None = None
+        origin = getattr(converter, "__origin__", None)
+        if origin is not None and origin is not Union and origin is not Literal:
+            if is_generic_type(converter):
+                converter = origin
+                origin = None
+        if origin is None:
+            converter, self.kind = _resolve_converter(converter)
+        self.converter: Any = converter
+
+    async def convert(self, ctx: Context, argument: str) -> Any:
+        if self.kind is None:
+            return await run_converters(ctx, self.converter, argument, self.param)
+        return await _actual_conversion(
+            ctx, self.converter, argument, self.param, self.kind
+        )
+
+
 class _CaseInsensitiveDict(dict):
     def __contains__(self, k):
         return super().__contains__(k.casefold())
@@ -443,6 +513,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
 
         self.params = get_signature_parameters(function, globalns)
 
+    @property
+    def _parse_plan(self) -> list[_ParameterStep]:
+        # Built on first use and again whenever params is reassigned, which
+        # includes copies and updates since both go through the callback setter.
+        try:
+            params, plan = self.__parse_plan
+        except AttributeError:
+            params = plan = None
+
+        if params is not self.params:
+            plan = [_ParameterStep(self, param) for param in self.params.values()]
+            self.__parse_plan = (self.params, plan)
+        return plan  # type: ignore
+
     def add_check(self, func: Check) -> None:
         """Adds a check to the command.
 
@@ -565,66 +649,56 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             ctx.bot.dispatch("command_error", ctx, error)
 
     async def transform(self, ctx: Context, param: inspect.Parameter) -> Any:
-        if isinstance(param.annotation, Option):
-            default = param.annotation.default
-            required = param.annotation.required
-        else:
-            default = param.default
-            required = default is param.empty
+        return await self._transform(ctx, _ParameterStep(self, param))
 
-        converter = get_converter(param)
-        consume_rest_is_special = (
-            param.kind == param.KEYWORD_ONLY and not self.rest_is_raw
-        )
+    async def _transform(self, ctx: Context, step: _ParameterStep) -> Any:
+        param = step.param
+        required = step.required
+        converter = step.converter
         view = ctx.view
         view.skip_ws()
 
         # The greedy converter is simple -- it keeps going until it fails in which case,
         # it undoes the view ready for the next parameter to use instead
-        if isinstance(converter, Greedy):
+        if step.greedy is not None:
             if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
                 return await self._transform_greedy_pos(
-                    ctx, param, required, converter.converter
+                    ctx, param, required, step.greedy.converter
                 )
             elif param.kind == param.VAR_POSITIONAL:
                 return await self._transform_greedy_var_pos(
-                    ctx, param, converter.converter
+                    ctx, param, step.greedy.converter
                 )
-            else:
-                # if we're here, then it's a KEYWORD_ONLY param type
-                # since this is mostly useless, we'll helpfully transform Greedy[X]
-                # into just X and do the parsing that way.
-                converter = converter.converter
+            # if we're here, then it's a KEYWORD_ONLY param type
+            # since this is mostly useless, we'll helpfully transform Greedy[X]
+            # into just X and do the parsing that way.
 
         if view.eof:
             if param.kind == param.VAR_POSITIONAL:
                 raise RuntimeError()  # break the loop
             if required:
-                if self._is_typing_optional(param.annotation):
+                if step.optional:
                     return None
-                if (
-                    hasattr(converter, "__commands_is_flag__")
-                    and converter._can_be_constructible()
-                ):
+                if step.constructible_flags:
                     return await converter._construct_default(ctx)
                 raise MissingRequiredArgument(param)
-            return default
+            return step.default
 
         previous = view.index
-        if consume_rest_is_special:
+        if param.kind == param.KEYWORD_ONLY and not self.rest_is_raw:
             argument = view.read_rest().strip()
         else:
             try:
                 argument = view.get_quoted_word()
             except ArgumentParsingError as exc:
-                if not self._is_typing_optional(param.annotation):
+                if not step.optional:
                     raise exc
                 view.index = previous
                 return None
         view.previous = previous
 
         # type-checker fails to narrow argument
-        return await run_converters(ctx, converter, argument, param)  # type: ignore
+        return await step.convert(ctx, argument)  # type: ignore
 
     async def _transform_greedy_pos(
         self, ctx: Context, param: inspect.Parameter, required: bool, converter: Any
@@ -757,46 +831,47 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         kwargs = ctx.kwargs
 
         view = ctx.view
-        iterator = iter(self.params.items())
+        plan = self._parse_plan
+        start = 1
 
         if self.cog is not None:
-            # we have 'self' as the first parameter so just advance
-            # the iterator and resume parsing
-            try:
-                next(iterator)
-            except StopIteration:
+            # we have 'self' as the first parameter so just skip it
+            if not plan:
                 raise discord.ClientException(
                     f'Callback for {self.name} command is missing "self" parameter.'
                 )
+            start = 2
 
         # next we have the 'ctx' as the next parameter
-        try:
-            next(iterator)
-        except StopIteration:
+        if len(plan) < start:
             raise discord.ClientException(
                 f'Callback for {self.name} command is missing "ctx" parameter.'
             )
 
-        for name, param in iterator:
+        for index in range(start, len(plan)):
+            step = plan[index]
+            param = step.param
             ctx.current_parameter = param
             if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                transformed = await self.transform(ctx, param)
+                transformed = await self._transform(ctx, step)
                 args.append(transformed)
             elif param.kind == param.KEYWORD_ONLY:
                 # kwarg only param denotes "consume rest" semantics
                 if self.rest_is_raw:
                     converter = get_converter(param)
                     argument = view.read_rest()
-                    kwargs[name] = await run_converters(ctx, converter, argument, param)
+                    kwargs[step.name] = await run_converters(
+                        ctx, converter, argument, param
+                    )
                 else:
-                    kwargs[name] = await self.transform(ctx, param)
+                    kwargs[step.name] = await self._transform(ctx, step)
                 break
             elif param.kind == param.VAR_POSITIONAL:
                 if view.eof and self.require_var_positional:
                     raise MissingRequiredArgument(param)
                 while not view.eof:
                     try:
-                        transformed = await self.transform(ctx, param)
+                        transformed = await self._transform(ctx, step)
                         args.append(transformed)
                     except RuntimeError:
                         break
@@ -850,15 +925,13 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if hook is not None:
             await hook(ctx)
 
-    def _prepare_cooldowns(self, ctx: Context) -> None:
+    async def _prepare_cooldowns(self, ctx: Context) -> None:
         if self._buckets.valid:
             dt = ctx.message.edited_at or ctx.message.created_at
             current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
-            bucket = self._buckets.get_bucket(ctx.message, current)
-            if bucket is not None:
-                retry_after = bucket.update_rate_limit(current)
-                if retry_after:
-                    raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+            bucket, retry_after = await self._buckets._consume(ctx.message, current)
+            if retry_after:
+                raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
     async def prepare(self, ctx: Context) -> None:
         ctx.command = self
@@ -875,9 +948,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         try:
             if self.cooldown_after_parsing:
                 await self._parse_arguments(ctx)
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
             else:
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns(ctx)
                 await self._parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
@@ -920,8 +993,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             The invocation context to reset the cooldown under.
         """
         if self._buckets.valid:
-            bucket = self._buckets.get_bucket(ctx.message)
-            bucket.reset()
+            self._buckets._reset_bucket(ctx.message)
 
     def get_cooldown_retry_after(self, ctx: Context) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
@@ -2311,10 +2383,21 @@ def is_nsfw() -> Callable[[T], T]:
     return check(pred)
 
 
+def _backend_namespace(func: Command | ApplicationCommand | CoroFunc) -> str:
+    # Tells apart the cooldowns of different commands sharing a backend. It has
+    # to be the same in every process, so it's based on where the callback is
+    # defined.
+    callback = getattr(func, "callback", func)
+    return f"{callback.__module__}.{callback.__qualname__}"
+
+
 def cooldown(
     rate: int,
     per: float,
     type: BucketType | Callable[[Message], Any] = BucketType.default,
+    *,
+    max_buckets: int | None = _DEFAULT_MAX_BUCKETS,
+    backend: CooldownBackend | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a cooldown to a command
 
@@ -2340,13 +2423,33 @@ def cooldown(
 
         .. versionchanged:: 1.7
             Callables are now supported for custom bucket types.
+    max_buckets: Optional[:class:`int`]
+        The maximum number of buckets to keep track of. Once there are more, the least recently
+        used ones are dropped, which resets their cooldown. Unused buckets are always dropped
+        once their cooldown is over. Defaults to 100,000, pass ``None`` to keep every bucket in use.
+
+        .. versionadded:: 2.7
+    backend: Optional[:class:`.CooldownBackend`]
+        Where to keep the state of the cooldown, e.g. a :class:`.SocketCooldownBackend` to share
+        it between several processes. Defaults to ``None``, which keeps it in this process.
+        Keys returned by a callable ``type`` must then be JSON serializable, or objects
+        with an ``id``, so that they are the same in every process.
+
+        .. versionadded:: 2.7
     """
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        buckets = CooldownMapping(
+            Cooldown(rate, per),
+            type,
+            max_buckets=max_buckets,
+            backend=backend,
+            namespace=_backend_namespace(func),
+        )
         if isinstance(func, (Command, ApplicationCommand)):
-            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+            func._buckets = buckets
         else:
-            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)
+            func.__commands_cooldown__ = buckets
         return func
 
     return decorator  # type: ignore
@@ -2355,6 +2458,9 @@ def cooldown(
 def dynamic_cooldown(
     cooldown: BucketType | Callable[[Message], Any],
     type: BucketType = BucketType.default,
+    *,
+    max_buckets: int | None = _DEFAULT_MAX_BUCKETS,
+    backend: CooldownBackend | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a dynamic cooldown to a command
 
@@ -2383,22 +2489,46 @@ def dynamic_cooldown(
         apply to this invocation or ``None`` if the cooldown should be bypassed.
     type: :class:`.BucketType`
         The type of cooldown to have.
+    max_buckets: Optional[:class:`int`]
+        The maximum number of buckets to keep track of. Once there are more, the least recently
+        used ones are dropped, which resets their cooldown. Unused buckets are always dropped
+        once their cooldown is over. Defaults to 100,000, pass ``None`` to keep every bucket in use.
+
+        .. versionadded:: 2.7
+    backend: Optional[:class:`.CooldownBackend`]
+        Where to keep the state of the cooldown, e.g. a :class:`.SocketCooldownBackend` to share
+        it between several processes. Defaults to ``None``, which keeps it in this process.
+        Keys returned by a callable ``type`` must then be JSON serializable, or objects
+        with an ``id``, so that they are the same in every process.
+
+        .. versionadded:: 2.7
     """
     if not callable(cooldown):
         raise TypeError("A callable must be provided")
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        buckets = DynamicCooldownMapping(
+            cooldown,
+            type,
+            max_buckets=max_buckets,
+            backend=backend,
+            namespace=_backend_namespace(func),
+        )
         if isinstance(func, Command):
-            func._buckets = DynamicCooldownMapping(cooldown, type)
+            func._buckets = buckets
         else:
-            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)
+            func.__commands_cooldown__ = buckets
         return func
 
     return decorator  # type: ignore
 
 
 def max_concurrency(
-    number: int, per: BucketType = BucketType.default, *, wait: bool = False
+    number: int,
+    per: BucketType = BucketType.default,
+    *,
+    wait: bool = False,
+    backend: CooldownBackend | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a maximum concurrency to a command
 
@@ -2421,10 +2551,22 @@ def max_concurrency(
         then instead of waiting until the command can run again, the command raises
         :exc:`.MaxConcurrencyReached` to its error handler. If this is set to ``True``
         then the command waits until it can be executed.
+    backend: Optional[:class:`.CooldownBackend`]
+        Where to keep the state of the concurrency, e.g. a :class:`.SocketCooldownBackend` to share
+        it between several processes. Defaults to ``None``, which keeps it in this process.
+        A waiting command is woken up by the backend as soon as a slot is released.
+
+        .. versionadded:: 2.7
     """
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
-        value = MaxConcurrency(number, per=per, wait=wait)
+        value = MaxConcurrency(
+            number,
+            per=per,
+            wait=wait,
+            backend=backend,
+            namespace=_backend_namespace(func),
+        )
         if isinstance(func, (Command, ApplicationCommand)):
             func._max_concurrency = value
         else:
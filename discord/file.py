@@ -25,9 +25,12 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+import aiohttp
 
 __all__ = (
     "File",
@@ -149,6 +152,104 @@ class File:
             self._closer()
 
 
+class _FilePayload(aiohttp.payload.Payload):
+    """An aiohttp payload that streams a :class:`File` in chunks.
+
+    Reads from disk are done in the default executor so large uploads do not
+    block the event loop. Where the platform supports it, the file is read
+    with positional reads (``os.pread``) starting at the position the
+    :class:`File` was created at, which leaves the file object untouched and
+    lets the same payload be reused by every retry of a request without
+    seeking or re-reading anything up front. In-memory buffers are sliced
+    directly without going through the executor.
+    """
+
+    CHUNK_SIZE = 2**18
+
+    def __init__(
+        self, file: File, *, content_type: str | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(
+            file.fp, content_type=content_type, filename=file.filename, **kwargs
+        )
+        fp = file.fp
+        self._start: int = file._original_pos
+        self._fd: int | None = None
+        self.bytes_read: int = 0
+
+        if isinstance(fp, io.BytesIO):
+            end = fp.getbuffer().nbytes
+        else:
+            try:
+                fd = fp.fileno()
+            except (OSError, AttributeError):
+                fd = None
+            if fd is not None and hasattr(os, "pread"):
+                self._fd = fd
+                end = os.fstat(fd).st_size
+            else:
+                pos = fp.tell()
+                end = fp.seek(0, io.SEEK_END)
+                fp.seek(pos)
+        self._size = max(end - self._start, 0)
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        if self._fd is not None:
+            return os.pread(self._fd, size, offset)
+        self._value.seek(offset)
+        return self._value.read(size)
+
+    def _read_memory(self, offset: int, size: int) -> bytes:
+        with self._value.getbuffer() as view:
+            return bytes(view[offset : offset + size])
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self._read_at(self._start, self._size).decode(encoding, errors)
+
+    async def write(self, writer: Any) -> None:
+        await self.write_with_length(writer, None)
+
+    async def write_with_length(self, writer: Any, content_length: int | None) -> None:
+        loop = asyncio.get_running_loop()
+        remaining = self._size
+        if content_length is not None:
+            remaining = min(remaining, content_length)
+
+        offset = self._start
+        in_memory = isinstance(self._value, io.BytesIO)
+        while remaining > 0:
+            size = min(self.CHUNK_SIZE, remaining)
+            if in_memory:
+                chunk = self._read_memory(offset, size)
+            else:
+                chunk = await loop.run_in_executor(None, self._read_at, offset, size)
+            if not chunk:
+                break
+            self.bytes_read += len(chunk)
+            offset += len(chunk)
+            remaining -= len(chunk)
+            await writer.write(chunk)
+
+
+def _streamed_form(
+    form: Iterable[dict[str, Any]], files: Sequence[File]
+) -> list[dict[str, Any]]:
+    # Swaps the file objects in a multipart form for streaming payloads.
+    # The payloads are created once per request and reused between retries,
+    # since every write starts over from the file's original position.
+    by_fp = {id(f.fp): f for f in files}
+    streamed = []
+    for params in form:
+        file = by_fp.get(id(params["value"]))
+        if file is not None:
+            params = dict(params)
+            params["value"] = _FilePayload(
+                file, content_type=params.pop("content_type", None)
+            )
+        streamed.append(params)
+    return streamed
+
+
 class VoiceMessage(File):
     """A special case of the File class that represents a voice message.
 
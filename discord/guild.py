@@ -25,12 +25,16 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import bisect
 import copy
+import heapq
 import unicodedata
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -134,6 +138,86 @@ class _GuildLimit(NamedTuple):
     filesize: int
 
 
+class _MemberNameIndex:
+    # Maps the casefolded usernames, global names and nicknames of a guild's
+    # cached members to their IDs. Lookups return candidates, which callers
+    # check against the member's actual names when case matters. The keys are
+    # also kept in a sorted list for prefix lookups; new keys are merged into
+    # it and removed ones compacted out lazily, on the next prefix lookup.
+
+    __slots__ = ("_folded", "_names", "_sorted", "_pending", "_stale")
+
+    def __init__(self, members: Iterable[Member] = ()) -> None:
+        self._folded: dict[str, dict[int, None]] = {}
+        self._names: dict[int, tuple[str | None, ...]] = {}
+        self._sorted: list[str] = []
+        self._pending: list[str] = []
+        self._stale: int = 0
+        for member in members:
+            self.add(member)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, member: Member) -> None:
+        member_id = member.id
+        names = (member.name, member.global_name, member.nick)
+        old = self._names.get(member_id)
+        if old is not None:
+            if old == names:
+                return
+            self.remove(member_id)
+
+        self._names[member_id] = names
+        folded_names = self._folded
+        for name in names:
+            if not name:
+                continue
+            folded = name.casefold()
+            try:
+                folded_names[folded][member_id] = None
+            except KeyError:
+                folded_names[folded] = {member_id: None}
+                self._pending.append(folded)
+
+    def remove(self, member_id: int) -> None:
+        for name in self._names.pop(member_id, ()):
+            if not name:
+                continue
+            folded = name.casefold()
+            ids = self._folded.get(folded)
+            if ids is not None:
+                ids.pop(member_id, None)
+                if not ids:
+                    del self._folded[folded]
+                    self._stale += 1
+
+    def get(self, name: str) -> Iterable[int]:
+        return self._folded.get(name.casefold(), ())
+
+    def startswith(self, prefix: str) -> Iterator[int]:
+        if self._stale > len(self._folded):
+            self._sorted = sorted(self._folded)
+            self._pending.clear()
+            self._stale = 0
+        elif self._pending:
+            self._sorted.extend(self._pending)
+            self._sorted.sort()
+            self._pending.clear()
+
+        prefix = prefix.casefold()
+        keys = self._sorted
+        seen = set()
+        for index in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix):
+                break
+            for member_id in self._folded.get(key, ()):
+                if member_id not in seen:
+                    seen.add(member_id)
+                    yield member_id
+
+
 class Guild(Hashable):
     """Represents a Discord guild.
 
@@ -268,6 +352,7 @@ class Guild(Hashable):
         "nsfw_level",
         "_scheduled_events",
         "_members",
+        "_member_names",
         "_channels",
         "_icon",
         "_banner",
@@ -304,6 +389,10 @@ class Guild(Hashable):
 
         self._channels: dict[int, GuildChannel] = {}
         self._members: dict[int, Member] = {}
+        # filled in as members are cached, when enabled on the client
+        self._member_names: _MemberNameIndex | None = (
+            _MemberNameIndex() if state.index_member_names else None
+        )
         self._scheduled_events: dict[int, ScheduledEvent] = {}
         self._voice_states: dict[int, VoiceState] = {}
         self._threads: dict[int, Thread] = {}
@@ -321,6 +410,18 @@ class Guild(Hashable):
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        if self._member_names is not None:
+            self._member_names.add(member)
+
+    def _update_member_names(self, member: Member, /) -> None:
+        if self._member_names is not None and member.id in self._members:
+            self._member_names.add(self._members[member.id])
+
+    def _get_member_name_candidates(self, name: str, /) -> Iterable[int]:
+        # the IDs of the members that may have a name, or all of them without an index
+        if self._member_names is None:
+            return self._members
+        return self._member_names.get(name)
 
     def _get_and_update_member(
         self, payload: MemberPayload, user_id: int, cache_flag: bool, /
@@ -329,7 +430,9 @@ class Guild(Hashable):
         # flag should always be MemberCacheFlag.interaction) is set to True
         if user_id in self._members:
             member = self.get_member(user_id)
-            member._update(payload) if cache_flag else None
+            if cache_flag:
+                member._update(payload)
+                self._update_member_names(member)
         else:
             # NOTE:
             # This is a fallback in case the member is not found in the guild's members.
@@ -337,7 +440,7 @@ class Guild(Hashable):
             # class will be incorrect such as status and activities.
             member = Member(guild=self, state=self._state, data=payload)  # type: ignore
             if cache_flag:
-                self._members[user_id] = member
+                self._add_member(member)
         return member
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
@@ -347,6 +450,8 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        if self._member_names is not None:
+            self._member_names.remove(member.id)
 
     def _add_scheduled_event(self, event: ScheduledEvent, /) -> None:
         self._scheduled_events[event.id] = event
@@ -1030,7 +1135,9 @@ class Guild(Hashable):
         """Returns a boolean indicating if the guild invites are disabled."""
         return "INVITES_DISABLED" in self.features
 
-    def get_member_named(self, name: str, /) -> Member | None:
+    def get_member_named(
+        self, name: str, /, *, case_insensitive: bool = False
+    ) -> Member | None:
         """Returns the first member found that matches the name provided.
 
         The name can have an optional discriminator argument, e.g. "Jake#0001"
@@ -1045,10 +1152,18 @@ class Guild(Hashable):
 
         If no member is found, ``None`` is returned.
 
+        .. versionchanged:: 2.7
+            Lookups go through an index of the cached members' names if
+            ``index_member_names`` is passed to the :class:`Client`.
+
         Parameters
         ----------
         name: :class:`str`
             The name of the member to lookup with an optional discriminator.
+        case_insensitive: :class:`bool`
+            Whether to ignore case when comparing names. Defaults to ``False``.
+
+            .. versionadded:: 2.7
 
         Returns
         -------
@@ -1057,23 +1172,92 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        result = None
-        members = self.members
+        fold = str.casefold if case_insensitive else str
         if len(name) > 5 and name[-5] == "#":
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
             # discriminator lookup.
             potential_discriminator = name[-4:]
+            username = fold(name[:-5])
 
             # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
-            result = utils.get(
-                members, name=name[:-5], discriminator=potential_discriminator
-            )
-            if result is not None:
-                return result
+            for member_id in self._get_member_name_candidates(username):
+                member = self._members.get(member_id)
+                if (
+                    member is not None
+                    and fold(member.name) == username
+                    and member.discriminator == potential_discriminator
+                ):
+                    return member
+
+        name = fold(name)
+        for member_id in self._get_member_name_candidates(name):
+            member = self._members.get(member_id)
+            if member is not None and name in (
+                fold(n) for n in (member.nick, member.name, member.global_name) if n
+            ):
+                return member
+        return None
+
+    def get_members_by_prefix(
+        self, prefix: str, /, *, limit: int | None = 25
+    ) -> list[Member]:
+        """Returns the cached members whose username, global name or nickname
+        starts with the prefix provided, ignoring case.
+
+        Unlike :meth:`search_members`, this does not make an API call and only
+        looks at the members in the cache. Every cached member is checked unless
+        ``index_member_names`` is passed to the :class:`Client`.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix to look up.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return. ``None`` returns every
+            match. Defaults to 25.
 
-        return utils.find(lambda m: name in (m.nick, m.name, m.global_name), members)
+        Returns
+        -------
+        List[:class:`Member`]
+            The matching members, ordered by the name that matched.
+        """
+
+        result = []
+        if limit is not None and limit <= 0:
+            return result
+
+        if self._member_names is None:
+            prefix = prefix.casefold()
+            matches = []
+            for member in self._members.values():
+                names = [
+                    folded
+                    for folded in (
+                        n.casefold()
+                        for n in (member.name, member.global_name, member.nick)
+                        if n
+                    )
+                    if folded.startswith(prefix)
+                ]
+                if names:
+                    matches.append((min(names), member))
+            if limit is None:
+                matches.sort(key=lambda match: match[0])
+            else:
+                matches = heapq.nsmallest(limit, matches, key=lambda match: match[0])
+            return [member for _, member in matches]
+
+        for member_id in self._member_names.startswith(prefix):
+            member = self._members.get(member_id)
+            if member is not None:
+                result.append(member)
+                if len(result) == limit:
+                    break
+        return result
 
     def _create_channel(
         self,
@@ -26,9 +26,14 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import copy
+import inspect
 import logging
+import socket
 import sys
+import time
 import weakref
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Coroutine, Iterable, Sequence, TypeVar
 from urllib.parse import quote as _uriquote
 
@@ -44,7 +49,7 @@ from .errors import (
     LoginFailure,
     NotFound,
 )
-from .file import VoiceMessage
+from .file import VoiceMessage, _streamed_form
 from .gateway import DiscordClientWebSocketResponse
 from .utils import MISSING, warn_deprecated
 
@@ -163,6 +168,187 @@ class MaybeUnlock:
 aiohttp.hdrs.WEBSOCKET = "websocket"  # type: ignore
 
 
+class HTTPTransportConfig:
+    """Configures the connection pool used to send HTTP requests.
+
+    This is passed to :class:`Client` as ``transport``. The pool is shared by API
+    requests, webhooks created from the client's state and asset downloads.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The maximum amount of simultaneous connections. ``0`` means no limit.
+        Defaults to ``100``.
+    limit_per_host: :class:`int`
+        The maximum amount of simultaneous connections to a single host.
+        ``0`` means no limit. Defaults to ``0``.
+    use_dns_cache: :class:`bool`
+        Whether to cache DNS lookups. Defaults to ``True``.
+    ttl_dns_cache: Optional[:class:`int`]
+        The amount of seconds DNS lookups are cached for, ``None`` caches them
+        forever. Defaults to ``60``.
+    keepalive_timeout: :class:`float`
+        The amount of seconds idle connections are kept open for reuse.
+        Defaults to ``15``.
+    tcp_keepalive: :class:`bool`
+        Whether to enable TCP keepalive on connections, so that dead connections
+        are noticed instead of hanging. Requires aiohttp 3.12 or newer.
+        Defaults to ``True``.
+    happy_eyeballs_delay: Optional[:class:`float`]
+        The amount of seconds to wait for a connection attempt to succeed before
+        trying the next address in parallel, as described in :rfc:`8305`.
+        ``None`` disables this. Requires aiohttp 3.10 or newer. Defaults to ``0.25``.
+    force_close: :class:`bool`
+        Whether to close connections after each request instead of reusing them.
+        Defaults to ``False``.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        use_dns_cache: bool = True,
+        ttl_dns_cache: int | None = 60,
+        keepalive_timeout: float = 15.0,
+        tcp_keepalive: bool = True,
+        happy_eyeballs_delay: float | None = 0.25,
+        force_close: bool = False,
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.use_dns_cache: bool = use_dns_cache
+        self.ttl_dns_cache: int | None = ttl_dns_cache
+        self.keepalive_timeout: float = keepalive_timeout
+        self.tcp_keepalive: bool = tcp_keepalive
+        self.happy_eyeballs_delay: float | None = happy_eyeballs_delay
+        self.force_close: bool = force_close
+
+    def __repr__(self) -> str:
+        return (
+            f"<HTTPTransportConfig limit={self.limit} limit_per_host={self.limit_per_host} "
+            f"ttl_dns_cache={self.ttl_dns_cache} keepalive_timeout={self.keepalive_timeout}>"
+        )
+
+    @staticmethod
+    def _keepalive_socket(addr_info: tuple[Any, ...]) -> socket.socket:
+        family, type_, proto, _, _ = addr_info
+        sock = socket.socket(family=family, type=type_, proto=proto)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return sock
+
+    def create_connector(self, **kwargs: Any) -> aiohttp.TCPConnector:
+        r"""Creates a connector with this configuration.
+
+        This must be called with an event loop running.
+
+        Parameters
+        ----------
+        \*\*kwargs
+            Additional keyword arguments passed to :class:`aiohttp.TCPConnector`.
+        """
+        options: dict[str, Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "use_dns_cache": self.use_dns_cache,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "force_close": self.force_close,
+        }
+        if not self.force_close:
+            options["keepalive_timeout"] = self.keepalive_timeout
+
+        # these are only supported by newer versions of aiohttp
+        supported = inspect.signature(aiohttp.TCPConnector).parameters
+        if "happy_eyeballs_delay" in supported:
+            options["happy_eyeballs_delay"] = self.happy_eyeballs_delay
+        if self.tcp_keepalive and "socket_factory" in supported:
+            options["socket_factory"] = self._keepalive_socket
+
+        options.update(kwargs)
+        return aiohttp.TCPConnector(**options)
+
+    def create_session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        r"""Creates a session with its own connector using this configuration,
+        e.g. for use with :meth:`Webhook.from_url`.
+
+        This must be called with an event loop running.
+
+        Parameters
+        ----------
+        \*\*kwargs
+            Additional keyword arguments passed to :class:`aiohttp.ClientSession`.
+        """
+        return aiohttp.ClientSession(connector=self.create_connector(), **kwargs)
+
+
+class HTTPPoolStats:
+    """The state of the connection pool of a :class:`Client`, as returned by
+    :meth:`Client.http_pool_stats`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    limit: :class:`int`
+        The maximum amount of simultaneous connections, ``0`` if there's no limit.
+    limit_per_host: :class:`int`
+        The maximum amount of simultaneous connections to a single host,
+        ``0`` if there's no limit.
+    acquired: :class:`int`
+        The amount of connections currently in use.
+    acquired_per_host: Dict[:class:`str`, :class:`int`]
+        The amount of connections currently in use, by host.
+        This is only tracked when ``limit_per_host`` is set.
+    idle: :class:`int`
+        The amount of open connections waiting to be reused.
+    waiting: :class:`int`
+        The amount of requests waiting for a connection because a limit was reached.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "acquired",
+        "acquired_per_host",
+        "idle",
+        "waiting",
+    )
+
+    def __init__(self, connector: aiohttp.BaseConnector | None) -> None:
+        self.limit: int = 0
+        self.limit_per_host: int = 0
+        self.acquired: int = 0
+        self.acquired_per_host: dict[str, int] = {}
+        self.idle: int = 0
+        self.waiting: int = 0
+        if connector is None or connector.closed:
+            return
+
+        self.limit = connector.limit
+        self.limit_per_host = connector.limit_per_host
+        # aiohttp has no public API for these
+        self.acquired = len(getattr(connector, "_acquired", ()))
+        self.acquired_per_host = {
+            key.host: len(conns)
+            for key, conns in getattr(connector, "_acquired_per_host", {}).items()
+            if conns
+        }
+        self.idle = sum(
+            len(conns) for conns in getattr(connector, "_conns", {}).values()
+        )
+        self.waiting = sum(
+            len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<HTTPPoolStats acquired={self.acquired} idle={self.idle} "
+            f"waiting={self.waiting} limit={self.limit}>"
+        )
+
+
 class HTTPClient:
     """Represents an HTTP client sending HTTP requests to the Discord API."""
 
@@ -174,11 +360,15 @@ class HTTPClient:
         proxy_auth: aiohttp.BasicAuth | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
         unsync_clock: bool = True,
+        transport: HTTPTransportConfig | None = None,
+        coalesce_requests: bool = True,
+        cache_ttl: float = 0.0,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = (
             asyncio.get_event_loop() if loop is None else loop
         )
         self.connector = connector
+        self.transport: HTTPTransportConfig | None = transport
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
         self._global_over: asyncio.Event = asyncio.Event()
@@ -188,6 +378,10 @@ class HTTPClient:
         self.proxy: str | None = proxy
         self.proxy_auth: aiohttp.BasicAuth | None = proxy_auth
         self.use_clock: bool = not unsync_clock
+        self.coalesce_requests: bool = coalesce_requests
+        self.cache_ttl: float = cache_ttl
+        self._inflight: dict[tuple[Any, ...], tuple[asyncio.Task, list[int]]] = {}
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
 
         user_agent = (
             "DiscordBot (https://pycord.dev, {0}) Python/{1[0]}.{1[1]} aiohttp/{2}"
@@ -196,12 +390,23 @@ class HTTPClient:
             __version__, sys.version_info, aiohttp.__version__
         )
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        if self.transport is not None and (
+            self.connector is None or self.connector.closed
+        ):
+            self.connector = self.transport.create_connector()
+        return aiohttp.ClientSession(
+            connector=self.connector,
+            ws_response_class=DiscordClientWebSocketResponse,
+        )
+
     def recreate(self) -> None:
         if self.__session.closed:
-            self.__session = aiohttp.ClientSession(
-                connector=self.connector,
-                ws_response_class=DiscordClientWebSocketResponse,
-            )
+            self.__session = self._create_session()
+
+    def pool_stats(self) -> HTTPPoolStats:
+        session = self.__session
+        return HTTPPoolStats(session.connector if session else None)
 
     async def ws_connect(self, url: str, *, compress: int = 0) -> Any:
         kwargs = {
@@ -218,6 +423,25 @@ class HTTPClient:
 
         return await self.__session.ws_connect(url, **kwargs)
 
+    # The maximum amount of responses kept when cache_ttl is set.
+    CACHE_SIZE: int = 1000
+
+    def _coalesce_key(
+        self, route: Route, kwargs: dict[str, Any]
+    ) -> tuple[Any, ...] | None:
+        if route.method != "GET" or not kwargs.keys() <= {"params", "locale"}:
+            return None
+
+        params = kwargs.get("params")
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        key = (route.url, params, kwargs.get("locale"))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     async def request(
         self,
         route: Route,
@@ -225,6 +449,72 @@ class HTTPClient:
         files: Sequence[File] | None = None,
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
+    ) -> Any:
+        key = None
+        if not files and not form and (self.coalesce_requests or self.cache_ttl):
+            key = self._coalesce_key(route, kwargs)
+        if key is None:
+            return await self._request(route, files=files, form=form, **kwargs)
+
+        if self.cache_ttl:
+            try:
+                expires, data = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                if expires > time.monotonic():
+                    return copy.deepcopy(data)
+                del self._cache[key]
+
+        if not self.coalesce_requests:
+            data = await self._request(route, **kwargs)
+            self._cache_response(key, data)
+            return data
+
+        # identical GET requests share a single request, that is
+        # shielded so that one caller being cancelled doesn't cancel it
+        try:
+            task, waiters = self._inflight[key]
+        except KeyError:
+            task = asyncio.create_task(self._request(route, **kwargs))
+            waiters = [0]
+            self._inflight[key] = (task, waiters)
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            _log.debug(
+                "Coalescing %s %s with an in-flight request", route.method, route.url
+            )
+
+        waiters[0] += 1
+        data = await asyncio.shield(task)
+        # shared responses are copied, so callers can't see each other's changes
+        return copy.deepcopy(data) if waiters[0] > 1 else data
+
+    def _finish_inflight(self, key: tuple[Any, ...], task: asyncio.Task) -> None:
+        if self._inflight.get(key, (None,))[0] is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._cache_response(key, task.result())
+
+    def _cache_response(self, key: tuple[Any, ...], data: Any) -> None:
+        if not self.cache_ttl:
+            return
+        cache = self._cache
+        cache[key] = (time.monotonic() + self.cache_ttl, copy.deepcopy(data))
+        cache.move_to_end(key)
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    async def _request(
+        self,
+        route: Route,
+        *,
+        files: Sequence[File] | None = None,
+        form: Iterable[dict[str, Any]] | None = None,
+        **kwargs: Any,
     ) -> Any:
         bucket = route.bucket
         method = route.method
@@ -273,12 +563,11 @@ class HTTPClient:
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
         await lock.acquire()
+        if form and files:
+            form = _streamed_form(form, files)
+
         with MaybeUnlock(lock) as maybe_lock:
             for tries in range(5):
-                if files:
-                    for f in files:
-                        f.reset(seek=tries)
-
                 if form:
                     form_data = aiohttp.FormData(quote_fields=False)
                     for params in form:
@@ -414,9 +703,7 @@ class HTTPClient:
 
     async def static_login(self, token: str) -> user.User:
         # Necessary to get aiohttp to stop complaining about session creation
-        self.__session = aiohttp.ClientSession(
-            connector=self.connector, ws_response_class=DiscordClientWebSocketResponse
-        )
+        self.__session = self._create_session()
         old_token = self.token
         self.token = token
 
@@ -25,8 +25,10 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import bisect
+import mmap
 import struct
-from typing import IO, TYPE_CHECKING, ClassVar, Generator
+from typing import IO, TYPE_CHECKING, ClassVar, Generator, Union
 
 from .errors import DiscordException
 
@@ -34,8 +36,12 @@ __all__ = (
     "OggError",
     "OggPage",
     "OggStream",
+    "OggBuffer",
+    "OggWriter",
 )
 
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
 
 class OggError(DiscordException):
     """An exception that is thrown for Ogg stream parsing errors."""
@@ -45,6 +51,34 @@ class OggError(DiscordException):
 # https://tools.ietf.org/html/rfc7845
 
 
+def packet_samples(packet: bytes) -> int:
+    """Gets the amount of 48kHz samples in an Opus packet from its TOC byte.
+
+    See :rfc:`6716#section-3.1`.
+    """
+    if not packet:
+        return 0
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:  # SILK, 10/20/40/60 ms
+        frame_size = (480, 960, 1920, 2880)[config & 3]
+    elif config < 16:  # Hybrid, 10/20 ms
+        frame_size = (480, 960)[config & 1]
+    else:  # CELT, 2.5/5/10/20 ms
+        frame_size = (120, 240, 480, 960)[config & 3]
+
+    code = toc & 3
+    if code == 0:
+        frames = 1
+    elif code < 3:
+        frames = 2
+    elif len(packet) > 1:
+        frames = packet[1] & 0x3F
+    else:
+        frames = 0
+    return frames * frame_size
+
+
 class OggPage:
     _header: ClassVar[struct.Struct] = struct.Struct("<xBQIIIB")
     if TYPE_CHECKING:
@@ -120,3 +154,280 @@ class OggStream:
                 if complete:
                     yield partial
                     partial = b""
+
+
+class OggBuffer:
+    """Parses an Ogg stream that is entirely in memory, or memory-mapped from a file.
+
+    Unlike :class:`OggStream`, packets are returned as :class:`memoryview` objects
+    of the underlying buffer, so they are not copied. The only exception are packets
+    that span multiple pages, which have to be joined.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    buffer: Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`, :class:`mmap.mmap`]
+        The buffer holding the stream.
+    """
+
+    _header: ClassVar[struct.Struct] = struct.Struct("<4sxBQIIIB")
+
+    def __init__(self, buffer: Buffer) -> None:
+        self.buffer: memoryview = memoryview(buffer).cast("B")
+        self._index: tuple[list[int], list[int]] | None = None
+        self._mmap: mmap.mmap | None = None
+        self._file: IO[bytes] | None = None
+
+    @classmethod
+    def from_file(cls, path: str) -> OggBuffer:
+        """Memory-maps an Ogg file for parsing.
+
+        The file stays open until :meth:`close` is called.
+        """
+        fp = open(path, "rb")
+        try:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            fp.close()
+            raise
+
+        self = cls(mapped)
+        self._mmap = mapped
+        self._file = fp
+        return self
+
+    def close(self) -> None:
+        """Releases the buffer, and closes the file if it was opened by :meth:`from_file`.
+
+        Packets previously returned must not be used anymore.
+        """
+        self.buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # packets are still referenced, the map is
+                # unmapped once they're garbage collected
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_page(self, offset: int) -> tuple[int, int, int, int]:
+        # returns the flag, granule position, segment table offset and segment count
+        try:
+            magic, flag, gran_pos, _, _, _, segnum = self._header.unpack_from(
+                self.buffer, offset
+            )
+        except struct.error:
+            raise OggError("bad data stream") from None
+        if magic != b"OggS":
+            raise OggError("invalid header magic")
+        return flag, gran_pos, offset + self._header.size, segnum
+
+    def iter_pages(self, offset: int = 0) -> Generator[tuple[int, int, int]]:
+        """Iterates over the pages starting at a byte offset.
+
+        Yields
+        ------
+        Tuple[:class:`int`, :class:`int`, :class:`int`]
+            The offset, header type flag and granule position of each page.
+        """
+        buffer = self.buffer
+        end = len(buffer)
+        while offset < end:
+            flag, gran_pos, segtable, segnum = self._read_page(offset)
+            yield offset, flag, gran_pos
+            offset = segtable + segnum + sum(buffer[segtable : segtable + segnum])
+
+    def iter_packets(self, offset: int = 0) -> Generator[memoryview]:
+        """Iterates over the packets starting at a byte offset, which has to be the
+        start of a page. Packets continued from a previous page are skipped.
+        """
+        buffer = self.buffer
+        end = len(buffer)
+        partial: list[memoryview] = []
+        first = True
+        skip = False
+
+        while offset < end:
+            flag, _, segtable, segnum = self._read_page(offset)
+            # a packet continued from before the first page can't be completed,
+            # so it is skipped until it ends, which may be several pages later
+            if first:
+                skip = bool(flag & 0x01)
+                first = False
+
+            start = body = segtable + segnum
+            for seg in buffer[segtable:body]:
+                body += seg
+                if seg == 255:
+                    continue
+
+                if skip:
+                    skip = False
+                elif partial:
+                    partial.append(buffer[start:body])
+                    yield memoryview(b"".join(partial))
+                    partial.clear()
+                else:
+                    yield buffer[start:body]
+                start = body
+
+            if start != body and not skip:
+                partial.append(buffer[start:body])
+            offset = body
+
+    @property
+    def index(self) -> list[tuple[int, int]]:
+        """The seek index of the stream, built on first access.
+
+        Each entry is a tuple of the granule position that the first packet starting
+        on a page begins at, and the offset of that page. Pages that don't start
+        any packet aren't included.
+        """
+        granules, offsets = self._build_index()
+        return list(zip(granules, offsets))
+
+    def _build_index(self) -> tuple[list[int], list[int]]:
+        if self._index is not None:
+            return self._index
+
+        granules: list[int] = []
+        offsets: list[int] = []
+        granule = 0
+
+        for offset, flag, gran_pos in self.iter_pages():
+            # the start of packets continued from a previous page isn't known
+            if not flag & 0x01:
+                granules.append(granule)
+                offsets.append(offset)
+            # -1 marks pages where no packet ends
+            if gran_pos != 0xFFFFFFFFFFFFFFFF:
+                granule = gran_pos
+
+        self._index = (granules, offsets)
+        return self._index
+
+    def seek(self, granule: int) -> tuple[int, int]:
+        """Finds the page to start reading from to reach a granule position.
+
+        Parameters
+        ----------
+        granule: :class:`int`
+            The granule position to seek to.
+
+        Returns
+        -------
+        Tuple[:class:`int`, :class:`int`]
+            The granule position that the first packet read from the returned offset
+            begins at, which is at most ``granule``, and the offset of the page to pass
+            to :meth:`iter_packets`.
+
+        Raises
+        ------
+        OggError
+            The stream has no pages to seek to.
+        """
+        granules, offsets = self._build_index()
+        if not offsets:
+            raise OggError("the stream has no pages to seek to")
+        i = max(bisect.bisect_right(granules, granule) - 1, 0)
+        return granules[i], offsets[i]
+
+
+def _crc_table() -> tuple[int, ...]:
+    table = []
+    for i in range(256):
+        r = i << 24
+        for _ in range(8):
+            r = (r << 1) ^ 0x04C11DB7 if r & 0x80000000 else r << 1
+        table.append(r & 0xFFFFFFFF)
+    return tuple(table)
+
+
+_crc_lookup = _crc_table()
+
+
+def _page_crc(data: bytes | bytearray) -> int:
+    crc = 0
+    lookup = _crc_lookup
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ lookup[(crc >> 24) ^ byte]
+    return crc
+
+
+class OggWriter:
+    """Writes packets of a single logical bitstream as Ogg pages.
+
+    .. versionadded:: 2.7
+    """
+
+    _header: ClassVar[struct.Struct] = struct.Struct("<4sBBqIIIB")
+    # Pages are flushed once their body reaches this size.
+    PAGE_SIZE: ClassVar[int] = 4096
+
+    def __init__(self, stream: IO[bytes], serial: int) -> None:
+        self.stream: IO[bytes] = stream
+        self.serial: int = serial
+        self.pagenum: int = 0
+        self.gran_pos: int = 0
+        self._segtable = bytearray()
+        self._body = bytearray()
+        self._closed = False
+
+    def write_packet(
+        self, packet: bytes, gran_pos: int, *, flush: bool = False
+    ) -> None:
+        """Adds a packet that ends at the given granule position."""
+        if self._closed:
+            raise OggError("the stream has already been closed")
+
+        size = len(packet)
+        lacing = b"\xff" * (size // 255) + bytes((size % 255,))
+        if len(lacing) > 255:
+            raise OggError("packet is too large")
+        if len(self._segtable) + len(lacing) > 255:
+            self._write_page()
+
+        self._segtable += lacing
+        self._body += packet
+        self.gran_pos = gran_pos
+        if flush or len(self._body) >= self.PAGE_SIZE:
+            self._write_page()
+
+    def _write_page(self, *, eos: bool = False) -> None:
+        flag = 0
+        if self.pagenum == 0:
+            flag |= 0x02  # beginning of stream
+        if eos:
+            flag |= 0x04
+
+        page = bytearray(
+            self._header.pack(
+                b"OggS",
+                0,
+                flag,
+                self.gran_pos,
+                self.serial,
+                self.pagenum,
+                0,
+                len(self._segtable),
+            )
+        )
+        page += self._segtable
+        page += self._body
+        struct.pack_into("<I", page, 22, _page_crc(page))
+
+        self.stream.write(page)
+        self.pagenum += 1
+        self._segtable.clear()
+        self._body.clear()
+
+    def close(self) -> None:
+        """Writes the remaining packets on a final page that marks the end of the stream."""
+        if not self._closed:
+            self._write_page(eos=True)
+            self._closed = True
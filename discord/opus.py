@@ -65,6 +65,7 @@ __all__ = (
     "Encoder",
     "Decoder",
     "DecodeManager",
+    "JitterBuffer",
     "OpusError",
     "OpusNotLoaded",
 )
@@ -518,7 +519,123 @@ class Decoder(_OpusStruct):
         return array.array("h", pcm[: ret * channel_count]).tobytes()
 
 
+class JitterBuffer:
+    """Reorders the received voice packets of a single SSRC by their RTP sequence number.
+
+    Packets are held back until every preceding sequence number has arrived, the
+    buffer holds ``depth`` packets or the oldest held packet has waited for more
+    than ``max_delay`` seconds. Sequence numbers that never arrived are reported
+    as lost so the decoder can conceal them.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    depth: :class:`int`
+        The amount of packets to hold back while waiting for a missing packet.
+    max_delay: :class:`float`
+        The maximum amount of seconds a packet is held back.
+
+    Attributes
+    ----------
+    received: :class:`int`
+        The amount of packets that were accepted into the buffer.
+    lost: :class:`int`
+        The amount of packets that never arrived.
+    late: :class:`int`
+        The amount of packets that arrived after they were already given up on,
+        including duplicates.
+    """
+
+    def __init__(self, *, depth: int = 5, max_delay: float = 0.1):
+        self.depth: int = depth
+        self.max_delay: float = max_delay
+        self.received: int = 0
+        self.lost: int = 0
+        self.late: int = 0
+        self._packets: dict[int, RawData] = {}
+        self._next_sequence: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._packets)
+
+    @staticmethod
+    def _sequence_diff(a: int, b: int) -> int:
+        # signed distance between two 16 bit sequence numbers
+        return ((a - b + 0x8000) & 0xFFFF) - 0x8000
+
+    def _oldest_sequence(self) -> int:
+        reference = self._next_sequence
+        if reference is None:
+            reference = next(iter(self._packets))
+        return min(self._packets, key=lambda s: self._sequence_diff(s, reference))
+
+    def push(self, packet: RawData) -> bool:
+        """Adds a received packet to the buffer.
+
+        Returns ``False`` if the packet was a duplicate or arrived too late to be used.
+        """
+        sequence = packet.sequence
+        if sequence in self._packets or (
+            self._next_sequence is not None
+            and self._sequence_diff(sequence, self._next_sequence) < 0
+        ):
+            self.late += 1
+            return False
+
+        self._packets[sequence] = packet
+        self.received += 1
+        return True
+
+    def pop(
+        self, *, now: float | None = None, flush: bool = False
+    ) -> list[tuple[int, RawData]]:
+        """Releases the packets that are ready to be decoded, in sequence order.
+
+        Each packet is paired with the amount of packets that were lost right before it.
+
+        Parameters
+        ----------
+        now: Optional[:class:`float`]
+            The current :func:`time.perf_counter` value, used to expire held back packets.
+        flush: :class:`bool`
+            Whether to release every packet regardless of missing predecessors.
+        """
+        ready = []
+        lost = 0
+        while self._packets:
+            if self._next_sequence is not None:
+                packet = self._packets.pop(self._next_sequence, None)
+                if packet is not None:
+                    ready.append((lost, packet))
+                    lost = 0
+                    self._next_sequence = (self._next_sequence + 1) & 0xFFFF
+                    continue
+
+            oldest = self._oldest_sequence()
+            if not (
+                flush
+                or len(self._packets) >= self.depth
+                or (
+                    now is not None
+                    and now - self._packets[oldest].receive_time >= self.max_delay
+                )
+            ):
+                break
+
+            if self._next_sequence is not None:
+                lost = self._sequence_diff(oldest, self._next_sequence)
+                self.lost += lost
+            self._next_sequence = oldest
+
+        return ready
+
+
 class DecodeManager(threading.Thread, _OpusStruct):
+    # The amount of consecutive lost frames that are concealed, longer gaps are
+    # filled with silence based on the RTP timestamps instead.
+    MAX_CONCEALED_FRAMES = 5
+
     def __init__(self, client):
         super().__init__(daemon=True, name="DecodeManager")
 
@@ -526,6 +643,8 @@ class DecodeManager(threading.Thread, _OpusStruct):
         self.decode_queue = []
 
         self.decoder = {}
+        self.jitter_buffers: dict[int, JitterBuffer] = {}
+        self._next_timestamps: dict[int, int] = {}
 
         self._end_thread = threading.Event()
 
@@ -539,28 +658,84 @@ class DecodeManager(threading.Thread, _OpusStruct):
             try:
                 data = self.decode_queue.pop(0)
             except IndexError:
+                self._release(now=time.perf_counter())
                 time.sleep(0.001)
                 continue
 
-            try:
-                if data.decrypted_data is None:
-                    continue
-                else:
-                    data.decoded_data = self.get_decoder(data.ssrc).decode(
-                        data.decrypted_data
-                    )
-            except OpusError:
-                print("Error occurred while decoding opus frame.")
-                continue
+            self.get_jitter_buffer(data.ssrc).push(data)
+            self._release(now=time.perf_counter())
+
+        # Hand over everything that is still buffered before the sink is cleaned up.
+        while self.decode_queue:
+            data = self.decode_queue.pop(0)
+            self.get_jitter_buffer(data.ssrc).push(data)
+        self._release(flush=True)
 
-            self.client.recv_decoded_audio(data)
+        self.decoder = {}
+        self.jitter_buffers = {}
+        gc.collect()
+
+    def _release(self, *, now=None, flush=False):
+        for buffer in list(self.jitter_buffers.values()):
+            for lost, data in buffer.pop(now=now, flush=flush):
+                self._decode_packet(lost, data)
+
+    def _decode_packet(self, lost, data):
+        if data.decrypted_data is None:
+            # packets are decrypted here rather than on the event loop,
+            # and only once the jitter buffer has let them through
+            try:
+                data.decrypt()
+            except Exception:
+                _log.warning(
+                    "Dropping a voice packet of SSRC %s that failed to decrypt.",
+                    data.ssrc,
+                    exc_info=True,
+                )
+                return
+
+        if self.client.sink.receive_opus:
+            # The sink stores the packets as they are, no need to decode them.
+            self.client.recv_opus_audio(data)
+            return
+
+        ssrc = data.ssrc
+        expected = self._next_timestamps.get(ssrc)
+        if data.decrypted_data == b"\xf8\xff\xfe":  # Frame of silence
+            self._next_timestamps[ssrc] = (
+                data.timestamp + self.SAMPLES_PER_FRAME
+            ) & 0xFFFFFFFF
+            return
+
+        decoder = self.get_decoder(ssrc)
+        try:
+            concealed = b""
+            if lost and expected is not None:
+                for _ in range(min(lost, self.MAX_CONCEALED_FRAMES) - 1):
+                    concealed += decoder.decode(None)
+                # The packet following a loss may carry FEC data for the lost frame.
+                concealed += decoder.decode(data.decrypted_data, fec=True)
+            decoded = decoder.decode(data.decrypted_data)
+        except OpusError:
+            print("Error occurred while decoding opus frame.")
+            return
+
+        silence = 0
+        if expected is not None:
+            gap = (data.timestamp - expected) & 0xFFFFFFFF
+            if gap < 0x80000000:  # not behind the previous packet
+                silence = max(0, gap - len(concealed) // self.SAMPLE_SIZE)
+
+        self._next_timestamps[ssrc] = (
+            data.timestamp + len(decoded) // self.SAMPLE_SIZE
+        ) & 0xFFFFFFFF
+        data.decoded_data = b"\x00" * (silence * self.SAMPLE_SIZE) + concealed + decoded
+        self.client.recv_decoded_audio(data)
 
     def stop(self):
-        while self.decoding:
-            time.sleep(0.1)
-            self.decoder = {}
-            gc.collect()
-            print("Decoder Process Killed")
+        # Only signals the thread, which then flushes its jitter buffers and
+        # exits. Waiting for it with join() must not happen on the event loop,
+        # since the flush may need the loop to map SSRCs to users.
         self._end_thread.set()
 
     def get_decoder(self, ssrc):
@@ -570,6 +745,20 @@ class DecodeManager(threading.Thread, _OpusStruct):
         self.decoder[ssrc] = Decoder()
         return self.decoder[ssrc]
 
+    def get_jitter_buffer(self, ssrc):
+        buffer = self.jitter_buffers.get(ssrc)
+        if buffer is not None:
+            return buffer
+        self.jitter_buffers[ssrc] = JitterBuffer()
+        return self.jitter_buffers[ssrc]
+
     @property
     def decoding(self):
-        return bool(self.decode_queue)
+        return bool(self.decode_queue) or any(self.jitter_buffers.values())
+
+    @property
+    def queue_depth(self) -> int:
+        """The amount of packets waiting to be decoded, including those held in jitter buffers."""
+        return len(self.decode_queue) + sum(
+            len(buffer) for buffer in list(self.jitter_buffers.values())
+        )
@@ -27,21 +27,33 @@ from __future__ import annotations
 
 import array
 import asyncio
+import collections
 import io
+import itertools
 import json
 import logging
 import re
 import shlex
+import struct
 import subprocess
 import sys
 import threading
 import time
 import traceback
 from math import floor
-from typing import IO, TYPE_CHECKING, Any, Callable, Generic, TypeVar
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    TypeVar,
+)
 
 from .errors import ClientException
-from .oggparse import OggStream
+from .oggparse import OggBuffer, OggError, OggStream, packet_samples
 from .opus import Encoder as OpusEncoder
 from .utils import MISSING
 
@@ -50,6 +62,7 @@ if TYPE_CHECKING:
 
 
 AT = TypeVar("AT", bound="AudioSource")
+FAT = TypeVar("FAT", bound="FFmpegAudio")
 FT = TypeVar("FT", bound="FFmpegOpusAudio")
 
 _log = logging.getLogger(__name__)
@@ -60,7 +73,9 @@ __all__ = (
     "FFmpegAudio",
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
+    "OggOpusAudio",
     "PCMVolumeTransformer",
+    "ReadAheadAudio",
 )
 
 CREATE_NO_WINDOW: int
@@ -106,6 +121,38 @@ class AudioSource:
         """Checks if the audio source is already encoded in Opus."""
         return False
 
+    def is_seekable(self) -> bool:
+        """Checks if the audio source supports :meth:`seek` and :meth:`tell`.
+
+        .. versionadded:: 2.7
+        """
+        return False
+
+    def seek(self, position: float) -> None:
+        """Moves the audio source to a position, so that the next :meth:`read`
+        returns the audio at that position.
+
+        Subclasses that return ``True`` from :meth:`is_seekable` must implement this.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        position: :class:`float`
+            The position to seek to, in seconds.
+        """
+        raise NotImplementedError
+
+    def tell(self) -> float:
+        """Gets the position of the audio source, that is the position of the
+        audio the next :meth:`read` returns, in seconds.
+
+        Subclasses that return ``True`` from :meth:`is_seekable` must implement this.
+
+        .. versionadded:: 2.7
+        """
+        raise NotImplementedError
+
     def cleanup(self) -> None:
         """Called when clean-up is needed to be done.
 
@@ -142,9 +189,18 @@ class FFmpegAudio(AudioSource):
     User created AudioSources using FFmpeg differently from how :class:`FFmpegPCMAudio` and
     :class:`FFmpegOpusAudio` work should subclass this.
 
+    Subclasses that want to support :meth:`prefetch` should implement
+    ``_read_frame`` instead of overriding :meth:`read`.
+
+    Sources reading from a file or URL are seekable, which restarts the
+    subprocess at the new position.
+
     .. versionadded:: 1.3
     """
 
+    #: The amount of frames :meth:`create` prefetches by default.
+    PREFETCH_FRAMES: int = 5
+
     def __init__(
         self,
         source: str | io.BufferedIOBase,
@@ -164,6 +220,13 @@ class FFmpegAudio(AudioSource):
         kwargs = {"stdout": subprocess.PIPE}
         kwargs.update(subprocess_kwargs)
 
+        self._prefetched: collections.deque[bytes] = collections.deque()
+        self._samples: int = 0
+        self._args: list[Any] | None = None
+        self._subprocess_kwargs: dict[str, Any] = kwargs
+        if not piping and "-i" in args:
+            self._args = args
+
         self._process: subprocess.Popen = self._spawn_process(args, **kwargs)
         self._stdout: IO[bytes] = self._process.stdout  # type: ignore
         self._stdin: IO[bytes] | None = None
@@ -177,6 +240,151 @@ class FFmpegAudio(AudioSource):
             )
             self._pipe_thread.start()
 
+    @classmethod
+    async def create(
+        cls: type[FAT], *args: Any, prefetch: int | None = None, **kwargs: Any
+    ) -> FAT:
+        r"""|coro|
+
+        A factory method that spawns the ffmpeg process in a background thread
+        and reads the first frames of audio ahead of time, so that neither the
+        event loop nor the voice thread block while ffmpeg starts up.
+
+        This can be used to prepare the next track while the current one is
+        still playing, allowing for gapless track transitions.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        \*args
+            The positional arguments passed to the constructor.
+        prefetch: Optional[:class:`int`]
+            The amount of 20ms frames to read ahead of time.
+            Defaults to :attr:`PREFETCH_FRAMES`.
+        \*\*kwargs
+            The keyword arguments passed to the constructor.
+
+        Returns
+        -------
+        :class:`FFmpegAudio`
+            An instance of this class.
+
+        Raises
+        ------
+        ClientException
+            The subprocess failed to be created.
+
+        Examples
+        --------
+
+        Preparing the next track of a queue: ::
+
+            next_source = asyncio.create_task(
+                discord.FFmpegPCMAudio.create("next_song.mp3")
+            )
+            ...
+            voice_client.play(await next_source)
+        """
+
+        if prefetch is None:
+            prefetch = cls.PREFETCH_FRAMES
+
+        loop = asyncio.get_event_loop()
+        source = await loop.run_in_executor(None, lambda: cls(*args, **kwargs))
+        if prefetch > 0:
+            try:
+                await loop.run_in_executor(None, source.prefetch, prefetch)
+            except BaseException:
+                source.cleanup()
+                raise
+        return source
+
+    def prefetch(self, frames: int) -> int:
+        """Reads frames of audio ahead of time, storing them until they are
+        returned by :meth:`read`.
+
+        This blocks until the frames are read, or the audio ends.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        frames: :class:`int`
+            The amount of frames to have buffered.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of frames that are buffered.
+        """
+        buffer = self._prefetched
+        while len(buffer) < frames:
+            data = self._read_frame()
+            if not data:
+                break
+            buffer.append(data)
+        return len(buffer)
+
+    def read(self) -> bytes:
+        if self._prefetched:
+            data = self._prefetched.popleft()
+        else:
+            data = self._read_frame()
+
+        if self.is_opus():
+            self._samples += packet_samples(data)
+        else:
+            self._samples += len(data) // 4
+        return data
+
+    def _read_frame(self) -> bytes:
+        raise NotImplementedError
+
+    def _on_spawn(self) -> None:
+        # called after the subprocess has been restarted by seek
+        pass
+
+    def is_seekable(self) -> bool:
+        return self._args is not None
+
+    def seek(self, position: float) -> None:
+        """Restarts the subprocess at a position of the input.
+
+        This keeps the arguments of the original subprocess, so for
+        :class:`FFmpegOpusAudio` the input is not probed again.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        position: :class:`float`
+            The position to seek to, in seconds.
+
+        Raises
+        ------
+        ClientException
+            The source is piped to the subprocess, so it can't be seeked, or the
+            subprocess failed to be created.
+        """
+        if self._args is None:
+            raise ClientException("Piped FFmpeg sources can't be seeked.")
+
+        position = max(position, 0.0)
+        args = list(self._args)
+        index = args.index("-i")
+        args[index:index] = ("-ss", f"{position:.3f}")
+
+        self._kill_process()
+        self._prefetched.clear()
+        self._process = self._spawn_process(args, **self._subprocess_kwargs)
+        self._stdout = self._process.stdout  # type: ignore
+        self._samples = round(position * 48000)
+        self._on_spawn()
+
+    def tell(self) -> float:
+        return self._samples / 48000
+
     def _spawn_process(self, args: Any, **subprocess_kwargs: Any) -> subprocess.Popen:
         try:
             process = subprocess.Popen(
@@ -246,6 +454,7 @@ class FFmpegAudio(AudioSource):
     def cleanup(self) -> None:
         self._kill_process()
         self._process = self._stdout = self._stdin = MISSING
+        self._prefetched.clear()
 
 
 class FFmpegPCMAudio(FFmpegAudio):
@@ -313,7 +522,7 @@ class FFmpegPCMAudio(FFmpegAudio):
 
         super().__init__(source, executable=executable, args=args, **subprocess_kwargs)
 
-    def read(self) -> bytes:
+    def _read_frame(self) -> bytes:
         ret = self._stdout.read(OpusEncoder.FRAME_SIZE)
         if len(ret) != OpusEncoder.FRAME_SIZE:
             return b""
@@ -385,6 +594,13 @@ class FFmpegOpusAudio(FFmpegAudio):
         The subprocess failed to be created.
     """
 
+    #: The amount of probe results kept by :meth:`probe`.
+    PROBE_CACHE_SIZE: int = 256
+
+    _probe_cache: collections.OrderedDict[
+        tuple[Any, str, Any], tuple[str | None, int | None]
+    ] = collections.OrderedDict()
+
     def __init__(
         self,
         source: str | io.BufferedIOBase,
@@ -445,7 +661,16 @@ class FFmpegOpusAudio(FFmpegAudio):
         args.append("pipe:1")
 
         super().__init__(source, executable=executable, args=args, **subprocess_kwargs)
-        self._packet_iter = OggStream(self._stdout).iter_packets()
+        self._on_spawn()
+
+    def _on_spawn(self) -> None:
+        self._packet_iter = self._iter_audio_packets()
+
+    def _iter_audio_packets(self) -> Generator[bytes]:
+        for packet in OggStream(self._stdout).iter_packets():
+            # the stream headers aren't audio
+            if packet[:8] not in (b"OpusHead", b"OpusTags"):
+                yield packet
 
     @classmethod
     async def from_probe(
@@ -472,7 +697,11 @@ class FFmpegOpusAudio(FFmpegAudio):
             ``executable`` will default to ``ffmpeg`` if not provided as a keyword argument.
         kwargs
             The remaining parameters to be passed to the :class:`FFmpegOpusAudio` constructor,
-            excluding ``bitrate`` and ``codec``.
+            excluding ``bitrate`` and ``codec``, or the ``prefetch`` parameter of :meth:`create`.
+
+            .. versionchanged:: 2.7
+                The source is created through :meth:`create`, so the subprocess is
+                spawned in the background and the first frames are prefetched.
 
         Returns
         -------
@@ -514,7 +743,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         codec, bitrate = await cls.probe(source, method=method, executable=executable)
         # only re-encode if the source isn't already opus, else directly copy the source audio stream
         codec = "copy" if codec in ("opus", "libopus") else "libopus"
-        return cls(source, bitrate=bitrate, codec=codec, **kwargs)  # type: ignore
+        return await cls.create(source, bitrate=bitrate, codec=codec, **kwargs)  # type: ignore
 
     @classmethod
     async def probe(
@@ -523,6 +752,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         *,
         method: str | Callable[[str, str], tuple[str | None, int | None]] | None = None,
         executable: str | None = None,
+        cache: bool = True,
     ) -> tuple[str | None, int | None]:
         """|coro|
 
@@ -536,6 +766,12 @@ class FFmpegOpusAudio(FFmpegAudio):
             Identical to the ``method`` parameter for :meth:`FFmpegOpusAudio.from_probe`.
         executable: :class:`str`
             Identical to the ``executable`` parameter for :class:`FFmpegOpusAudio`.
+        cache: :class:`bool`
+            Whether to reuse the result of a previous probe of the same source.
+            Results are kept for the :attr:`PROBE_CACHE_SIZE` most recently probed
+            sources. Defaults to ``True``.
+
+            .. versionadded:: 2.7
 
         Returns
         -------
@@ -571,6 +807,14 @@ class FFmpegOpusAudio(FFmpegAudio):
                 f"not '{method.__class__.__name__}'"
             )
 
+        key = (source, executable, method)
+        if cache:
+            try:
+                cls._probe_cache.move_to_end(key)
+                return cls._probe_cache[key]
+            except (KeyError, TypeError):
+                pass
+
         codec = bitrate = None
         loop = asyncio.get_event_loop()
         try:
@@ -592,8 +836,29 @@ class FFmpegOpusAudio(FFmpegAudio):
         else:
             _log.info("Probe found codec=%s, bitrate=%s", codec, bitrate)
         finally:
+            if cache and codec is not None:
+                cls._cache_probe(key, (codec, bitrate))
             return codec, bitrate
 
+    @classmethod
+    def _cache_probe(cls, key: Any, result: tuple[str | None, int | None]) -> None:
+        try:
+            cls._probe_cache[key] = result
+        except TypeError:
+            # unhashable source or method
+            return
+        cls._probe_cache.move_to_end(key)
+        while len(cls._probe_cache) > cls.PROBE_CACHE_SIZE:
+            cls._probe_cache.popitem(last=False)
+
+    @classmethod
+    def clear_probe_cache(cls) -> None:
+        """Clears the results cached by :meth:`probe`.
+
+        .. versionadded:: 2.7
+        """
+        cls._probe_cache.clear()
+
     @staticmethod
     def _probe_codec_native(
         source, executable: str = "ffmpeg"
@@ -653,13 +918,95 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         return codec, bitrate
 
-    def read(self) -> bytes:
+    def _read_frame(self) -> bytes:
         return next(self._packet_iter, b"")
 
     def is_opus(self) -> bool:
         return True
 
 
+class OggOpusAudio(AudioSource):
+    """An audio source from a local Ogg Opus file.
+
+    The file is memory-mapped and its packets are sent as they are, without
+    spawning a subprocess or re-encoding the audio. Seeking uses the granule
+    positions of the file, so it's instant and accurate to a single packet.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    source: :class:`str`
+        The path of the file.
+
+    Raises
+    ------
+    OggError
+        The file is not an Ogg Opus file.
+    """
+
+    _HEADERS: tuple[bytes, ...] = (b"OpusHead", b"OpusTags")
+
+    def __init__(self, source: str) -> None:
+        self._buffer: OggBuffer | None = None
+        self._buffer = buffer = OggBuffer.from_file(source)
+
+        try:
+            head = next(buffer.iter_packets(), b"")
+            if head[:8] != b"OpusHead" or len(head) < 19:
+                raise OggError("not an Ogg Opus stream")
+            # samples to discard from the start of the decoded audio
+            self._pre_skip: int = struct.unpack_from("<H", head, 10)[0]
+            del head
+        except BaseException:
+            buffer.close()
+            raise
+
+        self._granule: int = 0
+        self._packets: Iterator[memoryview] = self._iter_audio_packets(0)
+
+    def _iter_audio_packets(self, offset: int) -> Generator[memoryview]:
+        for packet in self._buffer.iter_packets(offset):  # type: ignore
+            if packet[:8] not in self._HEADERS:
+                yield packet
+
+    def read(self) -> bytes:
+        packet = next(self._packets, b"")
+        self._granule += packet_samples(packet)
+        return packet  # type: ignore
+
+    def is_opus(self) -> bool:
+        return True
+
+    def is_seekable(self) -> bool:
+        return True
+
+    def seek(self, position: float) -> None:
+        target = self._pre_skip + max(round(position * 48000), 0)
+        granule, offset = self._buffer.seek(target)  # type: ignore
+        packets = self._iter_audio_packets(offset)
+
+        # skip to the packet containing the target within the page
+        for packet in packets:
+            samples = packet_samples(packet)
+            if granule + samples > target:
+                packets = itertools.chain((packet,), packets)
+                break
+            granule += samples
+
+        self._granule = granule
+        self._packets = packets
+
+    def tell(self) -> float:
+        return max(self._granule - self._pre_skip, 0) / 48000
+
+    def cleanup(self) -> None:
+        self._packets = iter(())
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+
 class PCMVolumeTransformer(AudioSource, Generic[AT]):
     """Transforms a previous :class:`AudioSource` to have volume controls.
 
@@ -704,6 +1051,15 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
     def cleanup(self) -> None:
         self.original.cleanup()
 
+    def is_seekable(self) -> bool:
+        return self.original.is_seekable()
+
+    def seek(self, position: float) -> None:
+        self.original.seek(position)
+
+    def tell(self) -> float:
+        return self.original.tell()
+
     def read(self) -> bytes:
         maxval = 0x7FFF
         minval = -0x8000
@@ -718,6 +1074,170 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
         return samples.tobytes()
 
 
+class ReadAheadAudio(AudioSource, Generic[AT]):
+    """Wraps an :class:`AudioSource` to read its audio ahead of time.
+
+    A background thread reads frames from the original source into a fixed-size
+    ring buffer, so that stalls in the original source (such as a slow ffmpeg pipe
+    or network stream) are absorbed by the buffer instead of delaying packets.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    original: :class:`AudioSource`
+        The original AudioSource to read from.
+    buffer_ms: :class:`int`
+        The amount of audio to read ahead, in milliseconds.
+        This is rounded down to whole 20ms frames. Defaults to ``200``.
+
+    Attributes
+    ----------
+    original: :class:`AudioSource`
+        The original AudioSource.
+    underruns: :class:`int`
+        The amount of times :meth:`read` had to wait for the original
+        source because the buffer was empty.
+
+    Raises
+    ------
+    TypeError
+        Not an audio source.
+    ValueError
+        ``buffer_ms`` is shorter than a single frame.
+    """
+
+    def __init__(self, original: AT, *, buffer_ms: int = 200):
+        if not isinstance(original, AudioSource):
+            raise TypeError(f"expected AudioSource not {original.__class__.__name__}.")
+
+        capacity = buffer_ms // OpusEncoder.FRAME_LENGTH
+        if capacity < 1:
+            raise ValueError(
+                f"buffer_ms must be at least {OpusEncoder.FRAME_LENGTH}, not {buffer_ms}"
+            )
+
+        self.original: AT = original
+        self.underruns: int = 0
+
+        self._frames: list[bytes | None] = [None] * capacity
+        self._positions: list[float] = [0.0] * capacity
+        self._seekable: bool = original.is_seekable()
+        self._head: int = 0
+        self._size: int = 0
+        self._ended: bool = False
+        self._closed: bool = False
+        self._error: Exception | None = None
+        self._condition: threading.Condition = threading.Condition()
+        self._read_lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread = threading.Thread(
+            target=self._reader, daemon=True, name=f"audio-read-ahead:{id(self):#x}"
+        )
+        self._thread.start()
+
+    @property
+    def capacity(self) -> int:
+        """The amount of frames the buffer can hold."""
+        return len(self._frames)
+
+    @property
+    def buffered(self) -> int:
+        """The amount of frames currently buffered."""
+        return self._size
+
+    @property
+    def fill_level(self) -> float:
+        """How full the buffer is, from ``0.0`` to ``1.0``."""
+        return self._size / len(self._frames)
+
+    def _reader(self) -> None:
+        frames = self._frames
+        positions = self._positions
+        capacity = len(frames)
+        condition = self._condition
+
+        while True:
+            with condition:
+                while (self._size == capacity or self._ended) and not self._closed:
+                    condition.wait()
+                if self._closed:
+                    return
+
+            # held while reading so seek can't move the source under us
+            with self._read_lock:
+                position = self.original.tell() if self._seekable else 0.0
+                try:
+                    data = self.original.read()
+                except Exception as exc:
+                    data = b""
+                    self._error = exc
+
+                with condition:
+                    if not data:
+                        self._ended = True
+                    else:
+                        index = (self._head + self._size) % capacity
+                        frames[index] = data
+                        positions[index] = position
+                        self._size += 1
+                    condition.notify_all()
+
+    def read(self) -> bytes:
+        frames = self._frames
+        condition = self._condition
+
+        with condition:
+            if not self._size and not self._ended:
+                self.underruns += 1
+                _log.debug("Read-ahead buffer for %s ran empty", self.original)
+                while not self._size and not self._ended:
+                    condition.wait()
+
+            if not self._size:
+                if self._error is not None:
+                    raise self._error
+                return b""
+
+            data = frames[self._head]
+            frames[self._head] = None
+            self._head = (self._head + 1) % len(frames)
+            self._size -= 1
+            condition.notify_all()
+            return data  # type: ignore
+
+    def is_opus(self) -> bool:
+        return self.original.is_opus()
+
+    def is_seekable(self) -> bool:
+        return self._seekable
+
+    def seek(self, position: float) -> None:
+        """Seeks the original source and discards the buffered audio."""
+        with self._read_lock, self._condition:
+            self.original.seek(position)
+            for i in range(len(self._frames)):
+                self._frames[i] = None
+            self._head = self._size = 0
+            self._ended = False
+            self._error = None
+            self._condition.notify_all()
+
+    def tell(self) -> float:
+        with self._condition:
+            if self._size:
+                return self._positions[self._head]
+        return self.original.tell()
+
+    def cleanup(self) -> None:
+        # the constructor may have failed before the reader was set up
+        if not hasattr(self, "_thread"):
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self.original.cleanup()
+
+
 class AudioPlayer(threading.Thread):
     DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
 
@@ -748,6 +1268,7 @@ class AudioPlayer(threading.Thread):
 
         # getattr lookup speed ups
         play_audio = self.client.send_audio_packet
+        record_lateness = self.client._stats.record_lateness
         self._speak(True)
 
         while not self._end.is_set():
@@ -774,12 +1295,18 @@ class AudioPlayer(threading.Thread):
                 first_data = None
             # Else read the next bit from the source
             else:
-                data = self.source.read()
+                with self._lock:
+                    data = self.source.read()
 
             if not data:
                 self.stop()
                 break
 
+            # every frame but the first is scheduled a DELAY after the previous one
+            now = time.perf_counter()
+            if self.loops > 1:
+                record_lateness(now - (self._start + self.DELAY * self.loops))
+
             play_audio(data, encode=not self.source.is_opus())
             next_time = self._start + self.DELAY * self.loops
             delay = max(0, self.DELAY + (next_time - time.perf_counter()))
@@ -852,3 +1379,23 @@ class AudioPlayer(threading.Thread):
     def played_frames(self) -> int:
         """Gets the number of 20ms frames played since the start of the audio file."""
         return self._played_frames_offset + self.loops
+
+    def seek(self, position: float) -> None:
+        """Seeks the source to a position in seconds, blocking until the source is seeked."""
+        with self._lock:
+            if not self.source.is_seekable():
+                raise ClientException("The audio source is not seekable.")
+
+            self.source.seek(position)
+            self._played_frames_offset = round(self.source.tell() / self.DELAY)
+            self.loops = 0
+            self._start = time.perf_counter()
+
+    def position(self) -> float:
+        """Gets the position of the source in seconds, falling back
+        to the time played for sources that aren't seekable.
+        """
+        source = self.source
+        if source.is_seekable():
+            return source.tell()
+        return self.played_frames() * self.DELAY
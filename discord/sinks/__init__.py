@@ -15,6 +15,9 @@ from .mka import *
 from .mkv import *
 from .mp3 import *
 from .mp4 import *
+from .multitrack import *
 from .ogg import *
+from .oggopus import *
 from .pcm import *
+from .streaming import *
 from .wave import *
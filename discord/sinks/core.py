@@ -79,9 +79,9 @@ class Filters:
 
     @staticmethod
     def container(func):  # Contains all filters
-        def _filter(self, data, user):
+        def _filter(self, data, user, *args, **kwargs):
             if not self.filtered_users or user in self.filtered_users:
-                return func(self, data, user)
+                return func(self, data, user, *args, **kwargs)
 
         return _filter
 
@@ -101,25 +101,54 @@ class RawData:
     """Handles raw data from Discord so that it can be decrypted and decoded to be used.
 
     .. versionadded:: 2.0
+
+    .. versionchanged:: 2.7
+        Added the ``decrypt`` parameter.
+
+    Parameters
+    ----------
+    decrypt: :class:`bool`
+        Whether to decrypt the packet right away. Otherwise :attr:`decrypted_data`
+        is ``None`` until :meth:`decrypt` is called. Defaults to ``True``.
     """
 
-    def __init__(self, data, client):
-        self.data = bytearray(data)
+    _unpacker = struct.Struct(">xxHII")
+
+    def __init__(self, data, client, *, decrypt: bool = True):
+        # data may be a view of a reused receive buffer, so
+        # everything that's kept around has to be copied out.
+        data = memoryview(data)
         self.client = client
 
-        self.header = data[:12]
-        self.data = self.data[12:]
+        self.header = bytes(data[:12])
+        self.data = bytes(data[12:])
 
-        unpacker = struct.Struct(">xxHII")
-        self.sequence, self.timestamp, self.ssrc = unpacker.unpack_from(self.header)
-        self.decrypted_data = getattr(self.client, f"_decrypt_{self.client.mode}")(
-            self.header, self.data
+        self.sequence, self.timestamp, self.ssrc = self._unpacker.unpack_from(
+            self.header
         )
+        self.decrypted_data = None
+        if decrypt:
+            self.decrypt()
         self.decoded_data = None
 
         self.user_id = None
         self.receive_time = time.perf_counter()
 
+    def decrypt(self) -> bytes:
+        """Decrypts the payload of the packet into :attr:`decrypted_data`.
+
+        .. versionadded:: 2.7
+
+        Returns
+        -------
+        :class:`bytes`
+            The decrypted payload.
+        """
+        self.decrypted_data = self.client.packetizer.decrypt(
+            self.header, memoryview(self.data)
+        )
+        return self.decrypted_data
+
 
 class AudioData:
     """Handles data that's been completely decrypted and decoded and is ready to be saved to file.
@@ -199,6 +228,10 @@ class Sink(Filters):
         Audio may only be formatted after recording is finished.
     """
 
+    #: Whether the sink receives the Opus packets through :meth:`write_opus`
+    #: instead of decoded PCM audio through :meth:`write`.
+    receive_opus: bool = False
+
     def __init__(self, *, filters=None):
         if filters is None:
             filters = default_filters
@@ -220,6 +253,23 @@ class Sink(Filters):
         file = self.audio_data[user]
         file.write(data)
 
+    def write_opus(self, data: RawData, user, silence: int):
+        """Receives a decrypted Opus packet, for sinks that set :attr:`receive_opus`.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        data: :class:`RawData`
+            The received packet. Packets are passed in order of their sequence number.
+        user: :class:`int`
+            The ID of the user that sent the packet.
+        silence: :class:`int`
+            The amount of samples of silence that should precede the packet,
+            set for the first packet of a user when ``sync_start`` is used.
+        """
+        raise NotImplementedError
+
     def cleanup(self):
         self.finished = True
         for file in self.audio_data.values():
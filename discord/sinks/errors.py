@@ -87,3 +87,10 @@ class MKASinkError(SinkException):
 
     .. versionadded:: 2.0
     """
+
+
+class StreamSinkError(SinkException):
+    """Exception thrown when an exception occurs with a :class:`StreamSink`
+
+    .. versionadded:: 2.7
+    """
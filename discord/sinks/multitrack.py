@@ -0,0 +1,265 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import array
+import os
+import time
+import wave
+from typing import Literal
+
+from .core import Filters, Sink, default_filters
+from .errors import SinkException
+
+try:
+    import numpy
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+__all__ = (
+    "AudioTrack",
+    "MultiTrackSink",
+    "mix_pcm",
+)
+
+# 2 channels, 16 bit
+_SAMPLE_SIZE = 4
+_SAMPLING_RATE = 48000
+
+
+def _open_wave(path: str, channels: int = 2):
+    f = wave.open(path, "wb")
+    f.setnchannels(channels)
+    f.setsampwidth(2)
+    f.setframerate(_SAMPLING_RATE)
+    return f
+
+
+def mix_pcm(chunks: list[bytes], *, mono: bool = False) -> bytes:
+    """Mixes equally long chunks of 16 bit stereo PCM audio into one, clipping the result.
+    If ``mono`` is ``True``, both channels are averaged into a single one.
+
+    Uses numpy if it's installed.
+
+    .. versionadded:: 2.7
+    """
+    if HAS_NUMPY:
+        mixed = numpy.zeros(len(chunks[0]) // 2, dtype=numpy.int32)
+        for chunk in chunks:
+            mixed += numpy.frombuffer(chunk, dtype="<i2")
+        if mono:
+            mixed = mixed.reshape(-1, 2).sum(axis=1) // 2
+        return numpy.clip(mixed, -0x8000, 0x7FFF).astype("<i2").tobytes()
+
+    samples = [array.array("h", chunk) for chunk in chunks]
+    mixed = [sum(s) for s in zip(*samples)]
+    if mono:
+        mixed = [(left + right) // 2 for left, right in zip(mixed[::2], mixed[1::2])]
+    return array.array("h", (max(-0x8000, min(0x7FFF, s)) for s in mixed)).tobytes()
+
+
+class AudioTrack:
+    """The track of a single user in a :class:`MultiTrackSink`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The path of the file that is written.
+    flushed: :class:`int`
+        The amount of samples that have been written to the file.
+    dropped: :class:`int`
+        The amount of samples that arrived after their part of
+        the timeline was already written, and were discarded.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.flushed = 0
+        self.dropped = 0
+        self.finished = False
+        # position on the timeline of the next received sample
+        self._end = 0
+        # received audio starting at ``flushed``
+        self._pending = bytearray()
+        self._writer = _open_wave(path)
+
+    def write(self, data):
+        """Appends audio data to the track.
+
+        Raises
+        ------
+        SinkException
+            The AudioTrack is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioTrack is already finished writing.")
+
+        start = self._end
+        self._end += len(data) // _SAMPLE_SIZE
+        if start < self.flushed:
+            skip = min(self.flushed - start, len(data) // _SAMPLE_SIZE)
+            self.dropped += skip
+            data = data[skip * _SAMPLE_SIZE :]
+        self._pending += data
+
+    def flush(self, position: int) -> bytes:
+        """Writes the track up to ``position`` and returns the written audio,
+        padded with silence where nothing was received."""
+        size = (position - self.flushed) * _SAMPLE_SIZE
+        if size <= 0:
+            return b""
+        chunk = bytes(self._pending[:size])
+        del self._pending[:size]
+        if len(chunk) < size:
+            chunk += bytes(size - len(chunk))
+        self._writer.writeframesraw(chunk)
+        self.flushed = position
+        return chunk
+
+    def cleanup(self):
+        """Closes the file.
+
+        Raises
+        ------
+        SinkException
+            The AudioTrack is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioTrack is already finished writing.")
+        self._writer.close()
+        self.finished = True
+
+
+class MultiTrackSink(Sink):
+    """A sink that records every user on a shared 48kHz timeline, resulting
+    in one .wav file per user, all of equal length, and optionally a mixdown.
+
+    Tracks are written to disk while recording, lagging ``latency`` seconds
+    behind to account for packets that are still in transit or being decoded.
+    The recording is always aligned as if ``sync_start`` was passed to
+    :meth:`VoiceClient.start_recording`.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory the files are written to. Tracks are named
+        ``{user_id}-{session}.wav`` and the mixdown ``mix-{session}.wav``.
+    mixdown: Optional[:class:`str`]
+        Either ``"stereo"`` or ``"mono"`` to also write a mix of all tracks,
+        or ``None`` to skip it. Mixing uses numpy if it's installed.
+    latency: :class:`float`
+        The amount of seconds the written timeline lags behind.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str = ".",
+        mixdown: Literal["stereo", "mono"] | None = "stereo",
+        latency: float = 1.0,
+        filters=None,
+    ):
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        self.encoding = "wav"
+        self.directory = directory
+        self.mixdown = mixdown
+        self.latency = latency
+        self.session = int(time.time())
+        self.position = 0
+        self.mixdown_path = None
+        self._mix_writer = None
+        self.vc = None
+        self.audio_data = {}
+
+    def init(self, vc):
+        super().init(vc)
+        vc.sync_start = True
+        if self.mixdown is not None:
+            self.mixdown_path = os.path.join(
+                self.directory, f"mix-{self.session}.{self.encoding}"
+            )
+            self._mix_writer = _open_wave(
+                self.mixdown_path, 1 if self.mixdown == "mono" else 2
+            )
+
+    @Filters.container
+    def write(self, data, user):
+        if user not in self.audio_data:
+            path = os.path.join(
+                self.directory, f"{user}-{self.session}.{self.encoding}"
+            )
+            self.audio_data.update({user: AudioTrack(path)})
+
+        self.audio_data[user].write(data)
+
+        elapsed = time.perf_counter() - self.vc.first_packet_timestamp
+        self.flush(int((elapsed - self.latency) * _SAMPLING_RATE))
+
+    def flush(self, position: int):
+        """Writes every track up to ``position`` samples into the recording."""
+        if position <= self.position:
+            return
+
+        samples = position - self.position
+        chunks = []
+        for track in self.audio_data.values():
+            # a track that just started also catches up with the timeline
+            chunk = track.flush(position)
+            chunks.append(chunk[-samples * _SAMPLE_SIZE :])
+        if self._mix_writer is not None and chunks:
+            self._mix_writer.writeframesraw(
+                mix_pcm(chunks, mono=self.mixdown == "mono")
+            )
+        self.position = position
+
+    def cleanup(self):
+        self.finished = True
+        end = max((track._end for track in self.audio_data.values()), default=0)
+        self.flush(end)
+        for track in self.audio_data.values():
+            track.cleanup()
+        if self._mix_writer is not None:
+            self._mix_writer.close()
+
+    def get_all_audio(self):
+        """Gets the paths of all tracks, followed by the mixdown if there is one."""
+        paths = [x.path for x in self.audio_data.values()]
+        if self.mixdown_path is not None:
+            paths.append(self.mixdown_path)
+        return paths
+
+    def get_user_audio(self, user):
+        """Gets the path of the track of one specific user."""
+        return os.path.realpath(self.audio_data[user].path)
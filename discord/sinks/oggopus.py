@@ -0,0 +1,172 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import struct
+import time
+
+from ..oggparse import OggWriter, packet_samples
+from .core import Filters, RawData, Sink, default_filters
+from .errors import SinkException
+
+__all__ = (
+    "OggOpusStream",
+    "OggOpusSink",
+)
+
+# A 20ms frame of silence, as sent by Discord when a user stops speaking.
+SILENCE_FRAME = b"\xf8\xff\xfe"
+SILENCE_SAMPLES = 960
+
+
+class OggOpusStream:
+    """Writes the Opus packets of a single user into an Ogg Opus file.
+
+    Granule positions follow the RTP timestamps of the packets, gaps
+    between packets are filled with frames of silence.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The path of the file that is written.
+    finished: :class:`bool`
+        Whether the stream has been closed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.finished = False
+        self.file = open(path, "wb")
+        self.writer = OggWriter(self.file, random.getrandbits(32))
+        self.gran_pos = 0
+        self._next_timestamp: int | None = None
+
+        # https://www.rfc-editor.org/rfc/rfc7845#section-5
+        head = b"OpusHead" + struct.pack("<BBHIhB", 1, 2, 0, 48000, 0, 0)
+        vendor = b"pycord"
+        tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + bytes(4)
+        self.writer.write_packet(head, 0, flush=True)
+        self.writer.write_packet(tags, 0, flush=True)
+
+    def _write_silence(self, samples: int):
+        for _ in range(samples // SILENCE_SAMPLES):
+            self.gran_pos += SILENCE_SAMPLES
+            self.writer.write_packet(SILENCE_FRAME, self.gran_pos)
+
+    def write(self, data: RawData, silence: int = 0):
+        """Writes a packet.
+
+        Raises
+        ------
+        SinkException
+            The OggOpusStream is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The OggOpusStream is already finished writing.")
+
+        if self._next_timestamp is None:
+            self._write_silence(silence)
+        else:
+            gap = (data.timestamp - self._next_timestamp) & 0xFFFFFFFF
+            if gap >= 0x80000000:  # overlaps the previous packet
+                return
+            self._write_silence(gap)
+
+        packet = bytes(data.decrypted_data)
+        samples = packet_samples(packet)
+        self.gran_pos += samples
+        self.writer.write_packet(packet, self.gran_pos)
+        self._next_timestamp = (data.timestamp + samples) & 0xFFFFFFFF
+
+    def cleanup(self):
+        """Writes the final page and closes the file.
+
+        Raises
+        ------
+        SinkException
+            The OggOpusStream is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The OggOpusStream is already finished writing.")
+        self.writer.close()
+        self.file.close()
+        self.finished = True
+
+
+class OggOpusSink(Sink):
+    """A sink that stores the received Opus packets in .opus files, one per user,
+    without decoding and re-encoding them. Files are written while recording.
+
+    Neither ffmpeg nor libopus is needed to use this sink.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory the files are written to. Files are
+        named ``{user_id}-{session}.opus``.
+    """
+
+    receive_opus = True
+
+    def __init__(self, *, directory: str = ".", filters=None):
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        self.encoding = "opus"
+        self.directory = directory
+        self.session = int(time.time())
+        self.vc = None
+        self.audio_data = {}
+
+    @Filters.container
+    def write_opus(self, data, user, silence):
+        if user not in self.audio_data:
+            path = os.path.join(
+                self.directory, f"{user}-{self.session}.{self.encoding}"
+            )
+            self.audio_data.update({user: OggOpusStream(path)})
+
+        self.audio_data[user].write(data, silence)
+
+    def cleanup(self):
+        self.finished = True
+        for stream in self.audio_data.values():
+            stream.cleanup()
+
+    def get_all_audio(self):
+        """Gets the paths of all written files."""
+        return [x.path for x in self.audio_data.values()]
+
+    def get_user_audio(self, user):
+        """Gets the path of the file written for one specific user."""
+        return os.path.realpath(self.audio_data[user].path)
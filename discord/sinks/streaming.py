@@ -0,0 +1,277 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+import wave
+
+from .core import CREATE_NO_WINDOW, Filters, Sink, default_filters
+from .errors import SinkException, StreamSinkError
+
+__all__ = (
+    "AudioStream",
+    "StreamSink",
+    "WaveStreamSink",
+    "FFmpegStreamSink",
+)
+
+# 48kHz, 2 channels, 16 bit
+_BYTES_PER_SECOND = 48000 * 2 * 2
+
+
+class AudioStream:
+    """Handles the audio of a single user that is written to disk while recording.
+
+    Each time the current file exceeds the rotation limits of its sink,
+    it's closed and the audio continues in a new file.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    files: List[:class:`str`]
+        The paths of all files written so far, in order.
+    finished: :class:`bool`
+        Whether the stream has been closed.
+    """
+
+    def __init__(self, sink: StreamSink, user):
+        self.sink = sink
+        self.user = user
+        self.files: list[str] = []
+        self.finished = False
+        self._writer = None
+        self._written = 0
+
+    def _rotate(self):
+        if self._writer is not None:
+            self.sink.close_writer(self._writer)
+        path = os.path.join(
+            self.sink.directory,
+            f"{self.user}-{self.sink.session}-{len(self.files)}.{self.sink.encoding}",
+        )
+        self._writer = self.sink.open_writer(path)
+        self._written = 0
+        self.files.append(path)
+
+    def write(self, data):
+        """Writes audio data, starting a new file if needed.
+
+        Raises
+        ------
+        SinkException
+            The AudioStream is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioStream is already finished writing.")
+
+        rotate_size = self.sink.rotate_size
+        rotate_time = self.sink.rotate_time
+        if (
+            self._writer is None
+            or (rotate_size and self._written + len(data) > rotate_size)
+            or (rotate_time and self._written >= rotate_time * _BYTES_PER_SECOND)
+        ):
+            self._rotate()
+
+        self.sink.write_frames(self._writer, data)
+        self._written += len(data)
+
+    def cleanup(self):
+        """Closes the current file.
+
+        Raises
+        ------
+        SinkException
+            The AudioStream is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioStream is already finished writing.")
+        if self._writer is not None:
+            self.sink.close_writer(self._writer)
+            self._writer = None
+        self.finished = True
+
+
+class StreamSink(Sink):
+    """A sink that writes the recorded audio to disk as it arrives, instead
+    of keeping the whole recording in memory until it's finished.
+
+    Subclasses implement :meth:`open_writer`, :meth:`write_frames`
+    and :meth:`close_writer`.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory the files are written to. Files are named
+        ``{user_id}-{session}-{index}.{encoding}``.
+    rotate_size: :class:`int`
+        The amount of PCM bytes after which a new file is started.
+        ``0`` disables rotation by size.
+    rotate_time: :class:`float`
+        The amount of seconds of audio after which a new file is started.
+        ``0`` disables rotation by time.
+    """
+
+    encoding: str
+
+    def __init__(
+        self,
+        *,
+        directory: str = ".",
+        rotate_size: int = 0,
+        rotate_time: float = 0,
+        filters=None,
+    ):
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        self.directory = directory
+        self.rotate_size = rotate_size
+        self.rotate_time = rotate_time
+        self.session = int(time.time())
+        self.vc = None
+        self.audio_data = {}
+
+    def open_writer(self, path):
+        raise NotImplementedError
+
+    def write_frames(self, writer, data):
+        raise NotImplementedError
+
+    def close_writer(self, writer):
+        raise NotImplementedError
+
+    @Filters.container
+    def write(self, data, user):
+        if user not in self.audio_data:
+            self.audio_data.update({user: AudioStream(self, user)})
+
+        self.audio_data[user].write(data)
+
+    def cleanup(self):
+        self.finished = True
+        for stream in self.audio_data.values():
+            stream.cleanup()
+
+    def get_all_audio(self):
+        """Gets the paths of all written files."""
+        return [path for x in self.audio_data.values() for path in x.files]
+
+    def get_user_audio(self, user):
+        """Gets the paths of the files written for one specific user."""
+        return [os.path.realpath(path) for path in self.audio_data[user].files]
+
+
+class WaveStreamSink(StreamSink):
+    """A streaming sink for .wav(wave) files.
+
+    .. versionadded:: 2.7
+    """
+
+    encoding = "wav"
+
+    def open_writer(self, path):
+        f = wave.open(path, "wb")
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(48000)
+        return f
+
+    def write_frames(self, writer, data):
+        # the header is only patched when the file is closed
+        writer.writeframesraw(data)
+
+    def close_writer(self, writer):
+        writer.close()
+
+
+class FFmpegStreamSink(StreamSink):
+    """A streaming sink that encodes the audio through a long-lived
+    ffmpeg process per file, e.g. for .mp3 or .ogg files.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    encoding: :class:`str`
+        The ffmpeg output format, also used as the file extension.
+    options: Optional[:class:`str`]
+        Extra command line arguments to pass to ffmpeg after the input.
+    """
+
+    def __init__(self, *, encoding: str = "mp3", options: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.encoding = encoding
+        self.options = options
+
+    def open_writer(self, path):
+        args = [
+            "ffmpeg",
+            "-f",
+            "s16le",
+            "-ar",
+            "48000",
+            "-loglevel",
+            "error",
+            "-ac",
+            "2",
+            "-i",
+            "-",
+        ]
+        if self.options:
+            args.extend(self.options.split())
+        args.extend(("-f", self.encoding, "-y", path))
+        try:
+            return subprocess.Popen(
+                args, creationflags=CREATE_NO_WINDOW, stdin=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise StreamSinkError("ffmpeg was not found.") from None
+        except subprocess.SubprocessError as exc:
+            raise StreamSinkError(
+                "Popen failed: {0.__class__.__name__}: {0}".format(exc)
+            ) from exc
+
+    def write_frames(self, writer, data):
+        try:
+            writer.stdin.write(data)
+        except BrokenPipeError:
+            raise StreamSinkError(
+                f"ffmpeg exited with code {writer.poll()} while writing."
+            ) from None
+
+    def close_writer(self, writer):
+        try:
+            writer.stdin.close()
+        except BrokenPipeError:
+            pass
+        writer.wait()
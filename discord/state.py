@@ -111,6 +111,7 @@ class ChunkRequest:
         self.nonce: str = os.urandom(16).hex()
         self.buffer: list[Member] = []
         self.waiters: list[asyncio.Future[list[Member]]] = []
+        self.user_ids: set[int] = set()
 
     def add_members(self, members: list[Member]) -> None:
         self.buffer.extend(members)
@@ -142,6 +143,11 @@ class ChunkRequest:
             if not future.done():
                 future.set_result(self.buffer)
 
+    def fail(self, exc: BaseException) -> None:
+        for future in self.waiters:
+            if not future.done():
+                future.set_exception(exc)
+
 
 _log = logging.getLogger(__name__)
 
@@ -154,6 +160,9 @@ async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) ->
 
 
 class ConnectionState:
+    #: How long member queries by user ID are collected before being sent together.
+    MEMBER_QUERY_DELAY: float = 0.05
+
     if TYPE_CHECKING:
         _get_websocket: Callable[..., DiscordWebSocket]
         _get_client: Callable[..., Client]
@@ -196,7 +205,13 @@ class ConnectionState:
             raise TypeError("allowed_mentions parameter must be AllowedMentions")
 
         self.allowed_mentions: AllowedMentions | None = allowed_mentions
-        self._chunk_requests: dict[int | str, ChunkRequest] = {}
+        # pending chunk requests by nonce, and the ones for whole guilds by guild ID
+        self._chunk_requests: dict[str, ChunkRequest] = {}
+        self._guild_chunk_requests: dict[int, ChunkRequest] = {}
+        # member queries by user ID that are still collecting IDs to send,
+        # keyed by (guild_id, cache, presences)
+        self._member_queries: dict[tuple[int, bool, bool], ChunkRequest] = {}
+        self._member_query_tasks: set[asyncio.Task] = set()
 
         activity = options.get("activity", None)
         if activity:
@@ -252,6 +267,7 @@ class ConnectionState:
             self.deref_user = self.deref_user_no_intents  # type: ignore
 
         self.cache_app_emojis: bool = options.get("cache_app_emojis", False)
+        self.index_member_names: bool = options.get("index_member_names", False)
 
         self.parsers = parsers = {}
         for attr, func in inspect.getmembers(self):
@@ -296,16 +312,19 @@ class ConnectionState:
     def process_chunk_requests(
         self, guild_id: int, nonce: str | None, members: list[Member], complete: bool
     ) -> None:
-        removed = []
-        for key, request in self._chunk_requests.items():
-            if request.guild_id == guild_id and request.nonce == nonce:
-                request.add_members(members)
-                if complete:
-                    request.done()
-                    removed.append(key)
+        if nonce is None:
+            return
 
-        for key in removed:
-            del self._chunk_requests[key]
+        request = self._chunk_requests.get(nonce)
+        if request is None or request.guild_id != guild_id:
+            return
+
+        request.add_members(members)
+        if complete:
+            request.done()
+            del self._chunk_requests[nonce]
+            if self._guild_chunk_requests.get(guild_id) is request:
+                del self._guild_chunk_requests[guild_id]
 
     def call_handlers(self, key: str, *args: Any, **kwargs: Any) -> None:
         try:
@@ -575,21 +594,27 @@ class ConnectionState:
         if ws is None:
             raise RuntimeError("Somehow do not have a websocket for this guild_id")
 
-        request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
-        self._chunk_requests[request.nonce] = request
+        if user_ids:
+            request = self._batch_member_query(guild_id, user_ids, cache, presences)
+        else:
+            request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
+            self._chunk_requests[request.nonce] = request
 
         try:
-            # start the query operation
-            await ws.request_chunks(
-                guild_id,
-                query=query,
-                limit=limit,
-                user_ids=user_ids,
-                presences=presences,
-                nonce=request.nonce,
-            )
-            return await asyncio.wait_for(request.wait(), timeout=30.0)
+            if not user_ids:
+                # start the query operation
+                await ws.request_chunks(
+                    guild_id,
+                    query=query,
+                    limit=limit,
+                    user_ids=user_ids,
+                    presences=presences,
+                    nonce=request.nonce,
+                )
+            members = await asyncio.wait_for(request.wait(), timeout=30.0)
         except asyncio.TimeoutError:
+            if not request.waiters:
+                self._chunk_requests.pop(request.nonce, None)
             _log.warning(
                 (
                     "Timed out waiting for chunks with query %r and limit %d for"
@@ -601,6 +626,67 @@ class ConnectionState:
             )
             raise
 
+        if user_ids:
+            # the chunk may have members that other callers asked for
+            wanted = set(user_ids)
+            members = [member for member in members if member.id in wanted][:limit]
+        return members
+
+    def _batch_member_query(
+        self, guild_id: int, user_ids: list[int], cache: bool, presences: bool
+    ) -> ChunkRequest:
+        # Queries by user ID that come in within MEMBER_QUERY_DELAY of each other
+        # share a single REQUEST_GUILD_MEMBERS, for up to 100 user IDs.
+        key = (guild_id, cache, presences)
+        request = self._member_queries.get(key)
+        if request is None or len(request.user_ids.union(user_ids)) > 100:
+            request = ChunkRequest(guild_id, self.loop, self._get_guild, cache=cache)
+            self._chunk_requests[request.nonce] = request
+            self._member_queries[key] = request
+            task = asyncio.create_task(self._send_member_query(key, request, presences))
+            self._member_query_tasks.add(task)
+            task.add_done_callback(
+                lambda task: self._member_query_done(task, key, request)
+            )
+
+        request.user_ids.update(user_ids)
+        return request
+
+    async def _send_member_query(
+        self, key: tuple[int, bool, bool], request: ChunkRequest, presences: bool
+    ) -> None:
+        await asyncio.sleep(self.MEMBER_QUERY_DELAY)
+        if self._member_queries.get(key) is request:
+            del self._member_queries[key]
+
+        try:
+            ws = self._get_websocket(request.guild_id)
+            await ws.request_chunks(
+                request.guild_id,
+                limit=len(request.user_ids),
+                user_ids=list(request.user_ids),
+                presences=presences,
+                nonce=request.nonce,
+            )
+        except Exception as exc:
+            self._chunk_requests.pop(request.nonce, None)
+            request.fail(exc)
+
+    def _member_query_done(
+        self, task: asyncio.Task, key: tuple[int, bool, bool], request: ChunkRequest
+    ) -> None:
+        self._member_query_tasks.discard(task)
+        if task.cancelled():
+            exc: BaseException = asyncio.CancelledError()
+        elif (exc := task.exception()) is None:  # type: ignore
+            return
+
+        # the query was never sent, so nobody would answer its waiters
+        if self._member_queries.get(key) is request:
+            del self._member_queries[key]
+        self._chunk_requests.pop(request.nonce, None)
+        request.fail(exc)
+
     async def _delay_ready(self) -> None:
 
         if self.cache_app_emojis and self.application_id:
@@ -968,10 +1054,22 @@ class ConnectionState:
         old_member = Member._copy(member)
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self._update_member_names(member_id)
             self.dispatch("user_update", user_update[0], user_update[1])
 
         self.dispatch("presence_update", old_member, member)
 
+    def _update_member_names(self, user_id: int) -> None:
+        # the user object is shared between guilds, so a changed username or
+        # global name has to be re-indexed everywhere the user is a member
+        if not self.index_member_names:
+            return
+
+        for guild in self._guilds.values():
+            member = guild._members.get(user_id)
+            if member is not None:
+                guild._update_member_names(member)
+
     def parse_user_update(self, data) -> None:
         # self.user is *always* cached when this is called
         user: ClientUser = self.user  # type: ignore
@@ -979,6 +1077,7 @@ class ConnectionState:
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
+            self._update_member_names(user.id)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -1324,7 +1423,9 @@ class ConnectionState:
             old_member = Member._copy(member)
             member._update(data)
             user_update = member._update_inner_user(user)
+            guild._update_member_names(member)
             if user_update:
+                self._update_member_names(user_id)
                 self.dispatch("user_update", user_update[0], user_update[1])
 
             self.dispatch("member_update", old_member, member)
@@ -1398,11 +1499,12 @@ class ConnectionState:
         # Note: This method makes an API call without timeout, and should be used in
         #       conjunction with `asyncio.wait_for(..., timeout=...)`.
         cache = cache or self.member_cache_flags.joined
-        request = self._chunk_requests.get(guild.id)  # nosec B113
+        request = self._guild_chunk_requests.get(guild.id)  # nosec B113
         if request is None:
-            self._chunk_requests[guild.id] = request = ChunkRequest(
+            self._guild_chunk_requests[guild.id] = request = ChunkRequest(
                 guild.id, self.loop, self._get_guild, cache=cache
             )
+            self._chunk_requests[request.nonce] = request
             await self.chunker(guild.id, nonce=request.nonce)
 
         if wait:
@@ -68,6 +68,11 @@ class _PartialTemplateState:
     def member_cache_flags(self):
         return self.__state.member_cache_flags
 
+    @property
+    def index_member_names(self):
+        # the source guild of a template has no members
+        return False
+
     def store_emoji(self, guild, packet):
         return None
 
@@ -30,15 +30,18 @@ import asyncio
 import collections.abc
 import datetime
 import functools
+import heapq
 import itertools
 import json
 import re
 import sys
+import time
 import types
 import unicodedata
 import warnings
 from base64 import b64encode
 from bisect import bisect_left
+from collections import OrderedDict
 from inspect import isawaitable as _isawaitable
 from inspect import signature as _signature
 from operator import attrgetter
@@ -51,6 +54,7 @@ from typing import (
     Coroutine,
     ForwardRef,
     Generic,
+    Hashable,
     Iterable,
     Iterator,
     Literal,
@@ -1306,8 +1310,108 @@ AutocompleteFunc = Callable[[AutocompleteContext], AV]
 FilterFunc = Callable[[AutocompleteContext, Any], Union[bool, Awaitable[bool]]]
 
 
+def _autocomplete_key(value: Any) -> str:
+    return str(getattr(value, "name", value)).lower()
+
+
+class _AutocompleteIndex:
+    # The static values of a basic autocomplete, sorted by their lowercased
+    # string form so that the ones starting with a prefix are a contiguous
+    # range. Matches are still returned in the order the values were given.
+    # Mutable sources are compared with the indexed values on each lookup,
+    # which only compares identities until something was changed in place.
+
+    __slots__ = ("source", "length", "values", "keys", "order")
+
+    def __init__(self, source: Iterable[Any]) -> None:
+        values = list(source)
+        keyed = sorted((_autocomplete_key(value), i) for i, value in enumerate(values))
+        self.source = source
+        self.length = len(values)
+        self.values = values
+        self.keys = [key for key, _ in keyed]
+        self.order = [i for _, i in keyed]
+
+    def is_current(self, source: Iterable[Any]) -> bool:
+        if source is not self.source:
+            return False
+        if isinstance(source, (tuple, str, range, frozenset)):
+            return True
+        if isinstance(source, list):
+            return source == self.values
+        if isinstance(source, collections.abc.Collection):
+            return len(source) == self.length and list(source) == self.values
+        # one-shot iterables can't be read again, so keep what we have
+        return True
+
+    def startswith(self, prefix: str, limit: int = 25) -> list[Any]:
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return [self.values[i] for i in heapq.nsmallest(limit, self.order[lo:hi])]
+
+
+class _AutocompleteCache:
+    # Candidate values by (scope, lowercased prefix) with a TTL and LRU
+    # eviction, where the scope is the user and the other options they filled
+    # in. The candidates for a prefix include those of every longer prefix, so
+    # typing "abc" narrows down the entry for "ab" instead of producing the
+    # values again.
+
+    __slots__ = ("ttl", "maxsize", "entries")
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: OrderedDict[tuple[Hashable, str], tuple[float, list[Any]]] = (
+            OrderedDict()
+        )
+
+    def get(self, scope: Hashable, prefix: str) -> tuple[str, list[Any]] | None:
+        now = time.monotonic()
+        for end in range(len(prefix), -1, -1):
+            key = (scope, prefix[:end])
+            entry = self.entries.get(key)
+            if entry is None:
+                continue
+            if entry[0] <= now:
+                del self.entries[key]
+                continue
+            self.entries.move_to_end(key)
+            return key[1], entry[1]
+        return None
+
+    def set(self, scope: Hashable, prefix: str, candidates: list[Any]) -> None:
+        key = (scope, prefix)
+        self.entries[key] = (time.monotonic() + self.ttl, candidates)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+def _autocomplete_scope(ctx: AutocompleteContext) -> Hashable | None:
+    # What else the values may depend on besides what is being typed. None if
+    # an option value can't be part of a key.
+    focused = getattr(ctx.focused, "name", None)
+    scope = (
+        getattr(ctx.interaction.user, "id", None),
+        tuple(
+            (name, value)
+            for name, value in (ctx.options or {}).items()
+            if name != focused
+        ),
+    )
+    try:
+        hash(scope)
+    except TypeError:
+        return None
+    return scope
+
+
 def basic_autocomplete(
-    values: Values, *, filter: FilterFunc | None = None
+    values: Values,
+    *,
+    filter: FilterFunc | None = None,
+    cache_ttl: float | None = None,
 ) -> AutocompleteFunc:
     """A helper function to make a basic autocomplete for slash commands. This is a pretty standard autocomplete and
     will return any options that start with the value from the user, case-insensitive. If the ``values`` parameter is
@@ -1324,6 +1428,16 @@ def basic_autocomplete(
         An optional callable (sync or async) used to filter the autocomplete options. It accepts two arguments:
         the :class:`.AutocompleteContext` and an item from ``values`` iteration treated as callback parameters. If ``None`` is provided, a default filter is used that includes items whose string representation starts with the user's input value, case-insensitive.
 
+        .. versionadded:: 2.7
+    cache_ttl: Optional[:class:`float`]
+        If ``values`` is callable, how many seconds the values it returns are reused for the same user and the same
+        values of the other options. With the default filter, the values matching what the user typed are kept, so
+        the next keystroke only filters those instead of calling ``values`` again. Defaults to ``None``, which calls
+        ``values`` every time.
+
+        When ``values`` is an iterable and the default filter is used, it is indexed once instead of being filtered
+        in full on every keystroke, and is re-indexed whenever it changes.
+
         .. versionadded:: 2.7
 
     Returns
@@ -1360,23 +1474,47 @@ def basic_autocomplete(
     Autocomplete cannot be used for options that have specified choices.
     """
 
+    index: _AutocompleteIndex | None = None
+    cache = _AutocompleteCache(cache_ttl) if cache_ttl is not None else None
+
     async def autocomplete_callback(ctx: AutocompleteContext) -> V:
+        nonlocal index
         _values = values  # since we reassign later, python considers it local if we don't do this
+        prefix = str(ctx.value or "").lower()
 
-        if callable(_values):
-            _values = _values(ctx)
-        if asyncio.iscoroutine(_values):
-            _values = await _values
-
-        if filter is None:
+        if filter is None and not callable(_values) and not _isawaitable(_values):
+            if index is None or not index.is_current(_values):
+                index = _AutocompleteIndex(_values)
+            return iter(index.startswith(prefix))
 
-            def _filter(ctx: AutocompleteContext, item: Any) -> bool:
-                item = getattr(item, "name", item)
-                return str(item).lower().startswith(str(ctx.value or "").lower())
+        cached = None
+        scope = _autocomplete_scope(ctx) if cache is not None else None
+        if scope is not None:
+            cached = cache.get(scope, prefix if filter is None else "")
 
-            gen = (val for val in _values if _filter(ctx, val))
+        if cached is not None:
+            matched, _values = cached
+        else:
+            matched = ""
+            if callable(_values):
+                _values = _values(ctx)
+            if asyncio.iscoroutine(_values):
+                _values = await _values
 
-        elif asyncio.iscoroutinefunction(filter):
+        if filter is None:
+            if cached is None or matched != prefix:
+                _values = [
+                    val for val in _values if _autocomplete_key(val).startswith(prefix)
+                ]
+                if scope is not None:
+                    cache.set(scope, prefix, _values)
+            return iter(_values[:25])
+
+        if scope is not None and cached is None:
+            _values = list(_values)
+            cache.set(scope, "", _values)
+
+        if asyncio.iscoroutinefunction(filter):
             gen = (val for val in _values if await filter(ctx, val))
 
         elif callable(filter):
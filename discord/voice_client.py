@@ -53,9 +53,11 @@ from . import opus, utils
 from .backoff import ExponentialBackoff
 from .errors import ClientException, ConnectionClosed
 from .gateway import *
-from .player import AudioPlayer, AudioSource
+from .player import AudioPlayer, AudioSource, ReadAheadAudio
 from .sinks import RawData, RecordingException, Sink
 from .utils import MISSING
+from .voice_stats import VoiceStats
+from .voice_transport import VoiceTransport
 
 if TYPE_CHECKING:
     from . import abc
@@ -72,7 +74,9 @@ if TYPE_CHECKING:
 has_nacl: bool
 
 try:
+    import nacl.bindings  # type: ignore
     import nacl.secret  # type: ignore
+    import nacl.utils  # type: ignore
 
     has_nacl = True
 except ImportError:
@@ -197,6 +201,127 @@ class VoiceProtocol:
         self.client._connection._remove_voice_client(key_id)
 
 
+class VoicePacketizer:
+    """Builds, encrypts and decrypts the RTP packets of a single voice connection.
+
+    The key, the encryption method and the header and nonce buffers are set up once
+    and reused for every packet, as they only change when the connection does.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    mode: :class:`str`
+        The encryption mode of the connection.
+    secret_key: List[:class:`int`]
+        The secret key of the connection.
+    ssrc: :class:`int`
+        Our SSRC, used for outgoing packets.
+    """
+
+    _rtp_header = struct.Struct(">HI")
+
+    def __init__(self, mode: str, secret_key: list[int], ssrc: int):
+        self.mode: str = mode
+        self.secret_key: list[int] = secret_key
+        self.ssrc: int = ssrc
+        self._key: bytes = bytes(secret_key)
+        self._lite_nonce: int = 0
+        self._nonce = bytearray(24)
+        self._header = bytearray(12)
+        self._header[0] = 0x80
+        self._header[1] = 0x78
+        struct.pack_into(">I", self._header, 8, ssrc)
+
+        self.encrypt: Callable[[bytes, Any], bytes] = getattr(self, f"_encrypt_{mode}")
+        self.decrypt: Callable[[bytes, Any], bytes] = getattr(self, f"_decrypt_{mode}")
+
+    def packet(self, sequence: int, timestamp: int, data) -> bytes:
+        """Builds an encrypted packet containing ``data``."""
+        self._rtp_header.pack_into(self._header, 2, sequence, timestamp)
+        return self.encrypt(self._header, data)
+
+    def _next_lite_nonce(self) -> bytes:
+        nonce = self._lite_nonce
+        self._lite_nonce = 0 if nonce >= 4294967295 else nonce + 1
+        struct.pack_into(">I", self._nonce, 0, nonce)
+        return bytes(self._nonce)
+
+    def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
+        self._nonce[:12] = header
+        box = nacl.bindings.crypto_secretbox(bytes(data), bytes(self._nonce), self._key)
+
+        return header + box
+
+    def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
+        nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
+        box = nacl.bindings.crypto_secretbox(bytes(data), nonce, self._key)
+
+        return header + box + nonce
+
+    def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
+        nonce = self._next_lite_nonce()
+        box = nacl.bindings.crypto_secretbox(bytes(data), nonce, self._key)
+
+        return header + box + nonce[:4]
+
+    def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> bytes:
+        nonce = self._next_lite_nonce()
+        box = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_encrypt(
+            bytes(data), bytes(header), nonce, self._key
+        )
+
+        return header + box + nonce[:4]
+
+    def _decrypt_xsalsa20_poly1305(self, header, data):
+        nonce = bytearray(24)
+        nonce[:12] = header
+
+        return VoiceClient.strip_header_ext(
+            nacl.bindings.crypto_secretbox_open(bytes(data), bytes(nonce), self._key)
+        )
+
+    def _decrypt_xsalsa20_poly1305_suffix(self, header, data):
+        nonce_size = nacl.secret.SecretBox.NONCE_SIZE
+        nonce = bytes(data[-nonce_size:])
+
+        return VoiceClient.strip_header_ext(
+            nacl.bindings.crypto_secretbox_open(
+                bytes(data[:-nonce_size]), nonce, self._key
+            )
+        )
+
+    def _decrypt_xsalsa20_poly1305_lite(self, header, data):
+        nonce = bytearray(24)
+        nonce[:4] = data[-4:]
+
+        return VoiceClient.strip_header_ext(
+            nacl.bindings.crypto_secretbox_open(
+                bytes(data[:-4]), bytes(nonce), self._key
+            )
+        )
+
+    def _decrypt_aead_xchacha20_poly1305_rtpsize(self, header, data):
+        nonce = bytearray(24)
+        nonce[:4] = data[-4:]
+
+        # The CSRCs and the extension's own header are sent unencrypted,
+        # the extension's body is part of the encrypted payload.
+        offset = (header[0] & 0x0F) * 4
+        extension_length = 0
+        if header[0] & 0x10:
+            extension_length = struct.unpack_from(">H", data, offset + 2)[0] * 4
+            offset += 4
+
+        decrypted = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_decrypt(
+            bytes(data[offset:-4]),
+            bytes(header) + bytes(data[:offset]),
+            bytes(nonce),
+            self._key,
+        )
+        return decrypted[extension_length:]
+
+
 class VoiceClient(VoiceProtocol):
     """Represents a Discord voice connection.
 
@@ -256,7 +381,7 @@ class VoiceClient(VoiceProtocol):
         self._player: AudioPlayer | None = None
         self.encoder: Encoder = MISSING
         self.decoder = None
-        self._lite_nonce: int = 0
+        self._packetizer: VoicePacketizer | None = None
         self.ws: DiscordVoiceWebSocket = MISSING
 
         self.paused = False
@@ -265,9 +390,21 @@ class VoiceClient(VoiceProtocol):
         self.sink = None
         self.starting_time = None
         self.stopping_time = None
+        self._reader_socket = None
+        self._receiver = None
+        self._recording_callback = None
+        self._stats: VoiceStats = VoiceStats()
+
+    #: The transport every voice connection sends and receives packets with.
+    #: Can be replaced with e.g. a :class:`~discord.voice_transport.BatchedVoiceTransport`
+    #: before connecting.
+    #:
+    #: .. versionadded:: 2.7
+    transport: VoiceTransport = VoiceTransport()
 
     warn_nacl = not has_nacl
     supported_modes: tuple[SupportedModes, ...] = (
+        "aead_xchacha20_poly1305_rtpsize",
         "xsalsa20_poly1305_lite",
         "xsalsa20_poly1305_suffix",
         "xsalsa20_poly1305",
@@ -335,6 +472,10 @@ class VoiceClient(VoiceProtocol):
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setblocking(False)
+        if self._reader_socket is not None:
+            # Keep receiving on the new socket while recording.
+            self._remove_socket_reader()
+            self._add_socket_reader()
 
         if not self._handshaking:
             # If we're not handshaking then we need to terminate our previous connection in the websocket
@@ -461,6 +602,39 @@ class VoiceClient(VoiceProtocol):
         ws = self.ws
         return float("inf") if not ws else ws.average_latency
 
+    @property
+    def stats(self) -> VoiceStats:
+        """Statistics of the audio sent and received through this connection.
+
+        The same object is updated for the lifetime of the voice client, use
+        :meth:`~discord.voice_stats.VoiceStats.reset` to start over. These statistics are also
+        dispatched periodically through :func:`on_voice_stats`.
+
+        .. versionadded:: 2.7
+        """
+        stats = self._stats
+        self._collect_dropped()
+        stats.latency = self.latency
+        decoder = self.decoder
+        stats.decode_queue_depth = decoder.queue_depth if decoder else 0
+
+        ws = self.ws
+        if ws:
+            for ssrc, receive in stats.receive.items():
+                if receive.user_id is None and ssrc in ws.ssrc_map:
+                    receive.user_id = ws.ssrc_map[ssrc]["user_id"]
+        return stats
+
+    def _collect_dropped(self) -> None:
+        # Packets queued by a batching transport were counted as sent, but
+        # may have been dropped when the batch was sent.
+        if self.socket and (dropped := self.transport.collect_dropped(self.socket)):
+            self._stats.packets_sent -= dropped
+            self._stats.packets_dropped += dropped
+
+    def _dispatch_stats(self) -> None:
+        self.client.dispatch("voice_stats", self, self.stats)
+
     async def poll_voice_ws(self, reconnect: bool) -> None:
         backoff = ExponentialBackoff()
         while True:
@@ -530,7 +704,12 @@ class VoiceClient(VoiceProtocol):
             await self.voice_disconnect()
         finally:
             self.cleanup()
+            self._remove_socket_reader()
             if self.socket:
+                # sends whatever a batching transport still has queued and
+                # stops its thread until another connection sends again
+                await self.loop.run_in_executor(None, self.transport.close)
+                self._collect_dropped()
                 self.socket.close()
 
     async def move_to(self, channel: abc.Connectable) -> None:
@@ -551,65 +730,47 @@ class VoiceClient(VoiceProtocol):
 
     # audio related
 
-    def _get_voice_packet(self, data):
-        header = bytearray(12)
-
-        # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into(">H", header, 2, self.sequence)
-        struct.pack_into(">I", header, 4, self.timestamp)
-        struct.pack_into(">I", header, 8, self.ssrc)
+    @property
+    def packetizer(self) -> VoicePacketizer:
+        """The :class:`VoicePacketizer` for the current encryption mode and secret key."""
+        packetizer = self._packetizer
+        if (
+            packetizer is None
+            or packetizer.secret_key is not self.secret_key
+            or packetizer.mode != self.mode
+            or packetizer.ssrc != self.ssrc
+        ):
+            packetizer = self._packetizer = VoicePacketizer(
+                self.mode, self.secret_key, self.ssrc
+            )
+        return packetizer
 
-        encrypt_packet = getattr(self, f"_encrypt_{self.mode}")
-        return encrypt_packet(header, data)
+    def _get_voice_packet(self, data):
+        return self.packetizer.packet(self.sequence, self.timestamp, data)
 
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
+        return self.packetizer._encrypt_xsalsa20_poly1305(header, data)
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
-
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
+        return self.packetizer._encrypt_xsalsa20_poly1305_suffix(header, data)
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack(">I", self._lite_nonce)
-        self.checked_add("_lite_nonce", 1, 4294967295)
+        return self.packetizer._encrypt_xsalsa20_poly1305_lite(header, data)
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
+    def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> bytes:
+        return self.packetizer._encrypt_aead_xchacha20_poly1305_rtpsize(header, data)
 
     def _decrypt_xsalsa20_poly1305(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+        return self.packetizer._decrypt_xsalsa20_poly1305(header, data)
 
     def _decrypt_xsalsa20_poly1305_suffix(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce_size = nacl.secret.SecretBox.NONCE_SIZE
-        nonce = data[-nonce_size:]
-
-        return self.strip_header_ext(box.decrypt(bytes(data[:-nonce_size]), nonce))
+        return self.packetizer._decrypt_xsalsa20_poly1305_suffix(header, data)
 
     def _decrypt_xsalsa20_poly1305_lite(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        return self.packetizer._decrypt_xsalsa20_poly1305_lite(header, data)
 
-        nonce = bytearray(24)
-        nonce[:4] = data[-4:]
-        data = data[:-4]
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+    def _decrypt_aead_xchacha20_poly1305_rtpsize(self, header, data):
+        return self.packetizer._decrypt_aead_xchacha20_poly1305_rtpsize(header, data)
 
     @staticmethod
     def strip_header_ext(data):
@@ -631,6 +792,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: Literal[False] = False,
+        buffer_ms: int | None = None,
     ) -> None: ...
 
     @overload
@@ -640,6 +802,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: Literal[True],
+        buffer_ms: int | None = None,
     ) -> asyncio.Future: ...
 
     def play(
@@ -648,6 +811,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: bool = False,
+        buffer_ms: int | None = None,
     ) -> None | asyncio.Future:
         """Plays an :class:`AudioSource`.
 
@@ -674,6 +838,12 @@ class VoiceClient(VoiceProtocol):
             If False, None is returned and the function does not block.
 
             .. versionadded:: v2.5
+        buffer_ms: Optional[:class:`int`]
+            If given, the source is wrapped in a :class:`ReadAheadAudio` that reads
+            this many milliseconds of audio ahead of time, protecting playback from
+            stalls in the source. :attr:`source` then returns the wrapper.
+
+            .. versionadded:: 2.7
 
         Raises
         ------
@@ -683,6 +853,8 @@ class VoiceClient(VoiceProtocol):
             Source is not a :class:`AudioSource` or after is not a callable.
         OpusNotLoaded
             Source is not opus encoded and opus is not loaded.
+        ValueError
+            ``buffer_ms`` is shorter than a single frame.
         """
 
         if not self.is_connected():
@@ -699,6 +871,9 @@ class VoiceClient(VoiceProtocol):
         if not self.encoder and not source.is_opus():
             self.encoder = opus.Encoder()
 
+        if buffer_ms is not None:
+            source = ReadAheadAudio(source, buffer_ms=buffer_ms)
+
         future = None
         if wait_finish:
             future = asyncio.Future()
@@ -738,16 +913,19 @@ class VoiceClient(VoiceProtocol):
         if self.paused:
             return
 
-        data = RawData(data, self)
-
-        if data.decrypted_data == b"\xf8\xff\xfe":  # Frame of silence
-            return
-
+        # Frames of silence are passed on as well, so the decoder
+        # can tell them apart from lost packets. Decryption is left
+        # to the decoder thread, keeping it off the event loop.
+        data = RawData(data, self, decrypt=False)
+        self._stats.record_received(
+            data.ssrc, data.sequence, data.timestamp, data.receive_time
+        )
         self.decoder.decode(data)
 
     def start_recording(self, sink, callback, *args, sync_start: bool = False):
         """The bot will begin recording audio from the current voice channel it is in.
-        This function uses a thread so the current code line will not be stopped.
+        Packets are received by the event loop, or by a separate thread if the
+        event loop cannot watch sockets, so the current code line will not be stopped.
         Must be in a voice channel to use.
         Must not be already recording.
 
@@ -788,17 +966,26 @@ class VoiceClient(VoiceProtocol):
         self.recording = True
         self.sync_start = sync_start
         self.sink = sink
+        self.user_timestamps: dict[int, tuple[int, float]] = {}
+        self.starting_time = time.perf_counter()
+        self.first_packet_timestamp: float
         sink.init(self)
 
-        t = threading.Thread(
-            target=self.recv_audio,
-            args=(
-                sink,
-                callback,
-                *args,
-            ),
-        )
-        t.start()
+        try:
+            self._add_socket_reader()
+        except NotImplementedError:
+            # e.g. the proactor event loop on Windows
+            t = threading.Thread(
+                target=self.recv_audio,
+                args=(
+                    sink,
+                    callback,
+                    *args,
+                ),
+            )
+            t.start()
+        else:
+            self._recording_callback = (callback, args)
 
     def stop_recording(self):
         """Stops the recording.
@@ -813,10 +1000,18 @@ class VoiceClient(VoiceProtocol):
         """
         if not self.recording:
             raise RecordingException("Not currently recording audio.")
-        self.decoder.stop()
+        decoder = self.decoder
+        decoder.stop()
         self.recording = False
         self.paused = False
 
+        if self._recording_callback is not None:
+            callback, args = self._recording_callback
+            self._recording_callback = None
+            self.loop.call_soon_threadsafe(
+                self._finish_recording, decoder, self.sink, callback, *args
+            )
+
     def toggle_pause(self):
         """Pauses or unpauses the recording.
         Must be already recording.
@@ -840,14 +1035,56 @@ class VoiceClient(VoiceProtocol):
             for s in ready:
                 s.recv(4096)
 
+    def _add_socket_reader(self):
+        if self._receiver is None:
+            self._receiver = self.transport.receiver()
+        self.loop.add_reader(self.socket, self._recv_ready)
+        self._reader_socket = self.socket
+
+    def _remove_socket_reader(self):
+        if self._reader_socket is not None:
+            self.loop.remove_reader(self._reader_socket)
+            self._reader_socket = None
+
+    def _recv_ready(self):
+        # Called by the event loop whenever the socket is readable.
+        # Packets are read into buffers owned by the receiver, RawData
+        # copies out what it needs and decryption and decoding happen in
+        # the DecodeManager.
+        while self.recording:
+            try:
+                packets = self._receiver.recv(self._reader_socket)
+            except OSError:
+                self.stop_recording()
+                return
+
+            if not packets:
+                return
+            for data in packets:
+                self.unpack_audio(data)
+
+    def _finish_recording(self, decoder, sink, callback, *args):
+        self._remove_socket_reader()
+        self.stopping_time = time.perf_counter()
+
+        def finish():
+            # the decoder flushes its buffers into the sink before exiting
+            decoder.join()
+            sink.cleanup()
+
+        async def runner():
+            # formatting the audio may take a while, e.g. for ffmpeg based sinks
+            await self.loop.run_in_executor(None, finish)
+            result = await callback(sink, *args)
+            if result is not None:
+                print(result)
+
+        self.loop.create_task(runner())
+
     def recv_audio(self, sink, callback, *args):
         # Gets data from _recv_audio and sorts
         # it by user, handles pcm files and
         # silence that should be added.
-
-        self.user_timestamps: dict[int, tuple[int, float]] = {}
-        self.starting_time = time.perf_counter()
-        self.first_packet_timestamp: float
         while self.recording:
             ready, _, err = select.select([self.socket], [], [self.socket], 0.01)
             if not ready:
@@ -864,6 +1101,7 @@ class VoiceClient(VoiceProtocol):
             self.unpack_audio(data)
 
         self.stopping_time = time.perf_counter()
+        self.decoder.join()
         self.sink.cleanup()
         callback = asyncio.run_coroutine_threadsafe(callback(sink, *args), self.loop)
         result = callback.result()
@@ -871,43 +1109,43 @@ class VoiceClient(VoiceProtocol):
         if result is not None:
             print(result)
 
-    def recv_decoded_audio(self, data: RawData):
-        # Add silence when they were not being recorded.
+    def _get_leading_silence(self, data: RawData) -> int:
+        # Add silence when they were not being recorded. Gaps within a
+        # user's stream are already filled in by the decoder, based on
+        # the RTP timestamps of the packets.
+        silence = 0
         if data.ssrc not in self.user_timestamps:  # First packet from user
             if (
                 not self.user_timestamps or not self.sync_start
             ):  # First packet from anyone
                 self.first_packet_timestamp = data.receive_time
-                silence = 0
 
             else:  # Previously received a packet from someone else
                 silence = (
                     (data.receive_time - self.first_packet_timestamp) * 48000
                 ) - 960
 
-        else:  # Previously received a packet from user
-            dRT = (
-                data.receive_time - self.user_timestamps[data.ssrc][1]
-            ) * 48000  # delta receive time
-            dT = data.timestamp - self.user_timestamps[data.ssrc][0]  # delta timestamp
-            diff = abs(100 - dT * 100 / dRT)
-            if (
-                diff > 60 and dT != 960
-            ):  # If the difference in change is more than 60% threshold
-                silence = dRT - 960
-            else:
-                silence = dT - 960
-
         self.user_timestamps.update({data.ssrc: (data.timestamp, data.receive_time)})
+        return max(0, int(silence))
 
-        data.decoded_data = (
-            struct.pack("<h", 0) * max(0, int(silence)) * opus._OpusStruct.CHANNELS
-            + data.decoded_data
-        )
-
-        while data.ssrc not in self.ws.ssrc_map:
+    def _wait_for_user_id(self, ssrc: int) -> int:
+        while ssrc not in self.ws.ssrc_map:
             time.sleep(0.05)
-        self.sink.write(data.decoded_data, self.ws.ssrc_map[data.ssrc]["user_id"])
+        return self.ws.ssrc_map[ssrc]["user_id"]
+
+    def recv_decoded_audio(self, data: RawData):
+        silence = self._get_leading_silence(data)
+        if silence:
+            data.decoded_data = (
+                struct.pack("<h", 0) * silence * opus._OpusStruct.CHANNELS
+                + data.decoded_data
+            )
+
+        self.sink.write(data.decoded_data, self._wait_for_user_id(data.ssrc))
+
+    def recv_opus_audio(self, data: RawData):
+        silence = self._get_leading_silence(data)
+        self.sink.write_opus(data, self._wait_for_user_id(data.ssrc), silence)
 
     def is_playing(self) -> bool:
         """Indicates if we're currently playing audio."""
@@ -975,18 +1213,26 @@ class VoiceClient(VoiceProtocol):
         if encode:
             if not self.encoder:
                 self.encoder = opus.Encoder()
+            start = time.perf_counter()
             encoded_data = self.encoder.encode(data, self.encoder.SAMPLES_PER_FRAME)
+            self._stats.record_encode(time.perf_counter() - start)
         else:
             encoded_data = data
         packet = self._get_voice_packet(encoded_data)
         try:
-            self.socket.sendto(packet, (self.endpoint_ip, self.voice_port))
+            self.transport.send(
+                self.socket, (self.endpoint_ip, self.voice_port), packet
+            )
         except BlockingIOError:
+            self._stats.packets_dropped += 1
             _log.warning(
                 "A packet has been dropped (seq: %s, timestamp: %s)",
                 self.sequence,
                 self.timestamp,
             )
+        else:
+            self._stats.packets_sent += 1
+        self._collect_dropped()
 
         self.checked_add("timestamp", opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
 
@@ -995,3 +1241,45 @@ class VoiceClient(VoiceProtocol):
         if self._player:
             return datetime.timedelta(milliseconds=self._player.played_frames() * 20)
         return datetime.timedelta()
+
+    def position(self) -> datetime.timedelta:
+        """Returns the position in the playing audio.
+
+        This is the position reported by the source itself, while :meth:`elapsed`
+        counts the frames sent since the start or the last :meth:`seek`. For
+        sources that aren't seekable, this is the same as :meth:`elapsed`.
+
+        .. versionadded:: 2.7
+        """
+        if self._player:
+            return datetime.timedelta(seconds=self._player.position())
+        return datetime.timedelta()
+
+    async def seek(self, position: float | datetime.timedelta) -> None:
+        """|coro|
+
+        Seeks the audio being played to a position.
+
+        The audio source must be seekable, see :meth:`AudioSource.is_seekable`.
+        Seeking is done in a separate thread, as seeking some sources, such as
+        :class:`FFmpegPCMAudio`, restarts a subprocess.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        position: Union[:class:`float`, :class:`datetime.timedelta`]
+            The position to seek to, in seconds.
+
+        Raises
+        ------
+        ClientException
+            Not playing anything, or the audio source is not seekable.
+        """
+        if self._player is None:
+            raise ClientException("Not playing anything.")
+
+        if isinstance(position, datetime.timedelta):
+            position = position.total_seconds()
+
+        await self.loop.run_in_executor(None, self._player.seek, position)
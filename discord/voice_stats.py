@@ -0,0 +1,259 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+__all__ = (
+    "VoiceStats",
+    "ReceiveStats",
+)
+
+
+class ReceiveStats:
+    """Statistics of the audio received from a single SSRC.
+
+    Loss and jitter are calculated as described in :rfc:`3550#appendix-A.8`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    ssrc: :class:`int`
+        The SSRC the audio is received from.
+    user_id: Optional[:class:`int`]
+        The ID of the user the SSRC belongs to, if known.
+    packets_received: :class:`int`
+        The amount of packets received.
+    reordered: :class:`int`
+        The amount of packets received after a packet with a higher sequence number.
+    """
+
+    __slots__ = (
+        "ssrc",
+        "user_id",
+        "packets_received",
+        "reordered",
+        "_base_sequence",
+        "_max_sequence",
+        "_cycles",
+        "_transit",
+        "_jitter",
+    )
+
+    def __init__(self, ssrc: int) -> None:
+        self.ssrc: int = ssrc
+        self.user_id: int | None = None
+        self.packets_received: int = 0
+        self.reordered: int = 0
+        self._base_sequence: int = -1
+        self._max_sequence: int = 0
+        self._cycles: int = 0
+        self._transit: float | None = None
+        self._jitter: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReceiveStats ssrc={self.ssrc} user_id={self.user_id} "
+            f"received={self.packets_received} lost={self.lost} jitter={self.jitter:.4f}>"
+        )
+
+    def record(self, sequence: int, timestamp: int, arrival: float) -> None:
+        """Records a received packet.
+
+        Parameters
+        ----------
+        sequence: :class:`int`
+            The RTP sequence number of the packet.
+        timestamp: :class:`int`
+            The RTP timestamp of the packet.
+        arrival: :class:`float`
+            The :func:`time.perf_counter` time the packet was received at.
+        """
+        self.packets_received += 1
+
+        if self._base_sequence == -1:
+            self._base_sequence = self._max_sequence = sequence
+        else:
+            delta = (sequence - self._max_sequence) & 0xFFFF
+            if delta < 0x8000:
+                if sequence < self._max_sequence:
+                    self._cycles += 0x10000
+                self._max_sequence = sequence
+            else:
+                self.reordered += 1
+
+        # both in units of 48kHz samples
+        transit = arrival * 48000 - timestamp
+        if self._transit is not None:
+            # the timestamp wrapping around shows up as a jump of 2**32
+            d = abs(transit - self._transit) % 0x100000000
+            d = min(d, 0x100000000 - d)
+            self._jitter += (d - self._jitter) / 16
+        self._transit = transit
+
+    @property
+    def expected(self) -> int:
+        """:class:`int`: The amount of packets that should have been received."""
+        if self._base_sequence == -1:
+            return 0
+        return self._cycles + self._max_sequence - self._base_sequence + 1
+
+    @property
+    def lost(self) -> int:
+        """:class:`int`: The amount of packets that have been lost."""
+        return max(self.expected - self.packets_received, 0)
+
+    @property
+    def loss_ratio(self) -> float:
+        """:class:`float`: The ratio of packets that have been lost."""
+        expected = self.expected
+        return self.lost / expected if expected else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """:class:`float`: The interarrival jitter in seconds."""
+        return self._jitter / 48000
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ssrc": self.ssrc,
+            "user_id": self.user_id,
+            "packets_received": self.packets_received,
+            "packets_lost": self.lost,
+            "reordered": self.reordered,
+            "jitter": self.jitter,
+        }
+
+
+class VoiceStats:
+    """Statistics of a voice connection, as returned by :attr:`~discord.VoiceClient.stats`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    lateness: List[:class:`int`]
+        A histogram of how late audio packets were sent compared to their schedule.
+        Each item is the amount of packets at most as late as the bound at the
+        same index of :attr:`LATENESS_BUCKETS`, with the last item counting the
+        packets later than every bound.
+    max_lateness: :class:`float`
+        The latest a packet has been sent, in seconds.
+    packets_sent: :class:`int`
+        The amount of audio packets sent.
+    packets_dropped: :class:`int`
+        The amount of audio packets dropped because the socket wasn't ready to send.
+    frames_encoded: :class:`int`
+        The amount of frames encoded to Opus.
+    encode_time: :class:`float`
+        The total time spent encoding frames, in seconds.
+    max_encode_time: :class:`float`
+        The longest time spent encoding a single frame, in seconds.
+    decode_queue_depth: :class:`int`
+        The amount of received packets waiting to be decoded.
+    latency: :class:`float`
+        The latency of the voice websocket, see :attr:`~discord.VoiceClient.latency`.
+    receive: Dict[:class:`int`, :class:`ReceiveStats`]
+        The statistics of the received audio, by SSRC.
+    """
+
+    #: The upper bounds of the :attr:`lateness` histogram buckets, in seconds.
+    LATENESS_BUCKETS: tuple[float, ...] = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1)
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"<VoiceStats packets_sent={self.packets_sent} "
+            f"packets_dropped={self.packets_dropped} max_lateness={self.max_lateness:.4f}>"
+        )
+
+    def reset(self) -> None:
+        """Resets all statistics."""
+        self.lateness: list[int] = [0] * (len(self.LATENESS_BUCKETS) + 1)
+        self.max_lateness: float = 0.0
+        self.packets_sent: int = 0
+        self.packets_dropped: int = 0
+        self.frames_encoded: int = 0
+        self.encode_time: float = 0.0
+        self.max_encode_time: float = 0.0
+        self.decode_queue_depth: int = 0
+        self.latency: float = float("inf")
+        self.receive: dict[int, ReceiveStats] = {}
+
+    def record_lateness(self, lateness: float) -> None:
+        """Records how late a packet was sent, in seconds."""
+        lateness = max(lateness, 0.0)
+        self.lateness[bisect.bisect_left(self.LATENESS_BUCKETS, lateness)] += 1
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+
+    def record_encode(self, duration: float) -> None:
+        """Records the time spent encoding a frame, in seconds."""
+        self.frames_encoded += 1
+        self.encode_time += duration
+        if duration > self.max_encode_time:
+            self.max_encode_time = duration
+
+    def record_received(
+        self, ssrc: int, sequence: int, timestamp: int, arrival: float
+    ) -> None:
+        """Records a received packet, see :meth:`ReceiveStats.record`."""
+        try:
+            stats = self.receive[ssrc]
+        except KeyError:
+            stats = self.receive[ssrc] = ReceiveStats(ssrc)
+        stats.record(sequence, timestamp, arrival)
+
+    @property
+    def average_encode_time(self) -> float:
+        """:class:`float`: The average time spent encoding a frame, in seconds."""
+        if not self.frames_encoded:
+            return 0.0
+        return self.encode_time / self.frames_encoded
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the statistics into a :class:`dict`, e.g. to be exported as JSON."""
+        return {
+            "lateness": dict(
+                zip(
+                    [*map(str, self.LATENESS_BUCKETS), "inf"],
+                    self.lateness,
+                )
+            ),
+            "max_lateness": self.max_lateness,
+            "packets_sent": self.packets_sent,
+            "packets_dropped": self.packets_dropped,
+            "frames_encoded": self.frames_encoded,
+            "average_encode_time": self.average_encode_time,
+            "max_encode_time": self.max_encode_time,
+            "decode_queue_depth": self.decode_queue_depth,
+            "latency": self.latency,
+            "receive": [stats.to_dict() for stats in self.receive.values()],
+        }
@@ -0,0 +1,358 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import logging
+import os
+import socket
+import sys
+import threading
+from typing import Union
+
+__all__ = (
+    "VoiceTransport",
+    "BatchedVoiceTransport",
+)
+
+_log = logging.getLogger(__name__)
+
+Buffer = Union[bytes, bytearray]
+
+MSG_DONTWAIT = 0x40
+
+has_mmsg: bool = False
+_libc = None
+
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.sendmmsg
+        _libc.recvmmsg
+    except (OSError, AttributeError):
+        _libc = None
+    else:
+        has_mmsg = True
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _msghdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+class _sockaddr_in(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_ushort),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+if has_mmsg:
+    _libc.sendmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    _libc.sendmmsg.restype = ctypes.c_int
+    _libc.recvmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_mmsghdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+        ctypes.c_void_p,
+    ]
+    _libc.recvmmsg.restype = ctypes.c_int
+
+
+def _raise_errno() -> None:
+    code = ctypes.get_errno()
+    if code in (errno.EAGAIN, errno.EWOULDBLOCK):
+        raise BlockingIOError(code, os.strerror(code))
+    raise OSError(code, os.strerror(code))
+
+
+class _Receiver:
+    # Reads one packet per system call into a single reused buffer.
+
+    def __init__(self, size: int = 4096):
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+
+    def recv(self, sock: socket.socket) -> list[memoryview]:
+        try:
+            size = sock.recv_into(self._buffer)
+        except BlockingIOError:
+            return []
+        return [self._view[:size]]
+
+
+class _BatchedReceiver:
+    # Reads up to ``batch_size`` packets per recvmmsg call into reused buffers.
+
+    def __init__(self, batch_size: int, size: int = 4096):
+        self.batch_size = batch_size
+        self._buffers = [bytearray(size) for _ in range(batch_size)]
+        self._views = [memoryview(b) for b in self._buffers]
+        self._iovecs = (_iovec * batch_size)()
+        self._msgs = (_mmsghdr * batch_size)()
+        for i, buffer in enumerate(self._buffers):
+            self._iovecs[i].iov_base = ctypes.addressof(
+                (ctypes.c_char * size).from_buffer(buffer)
+            )
+            self._iovecs[i].iov_len = size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self, sock: socket.socket) -> list[memoryview]:
+        count = _libc.recvmmsg(
+            sock.fileno(), self._msgs, self.batch_size, MSG_DONTWAIT, None
+        )
+        if count < 0:
+            try:
+                _raise_errno()
+            except BlockingIOError:
+                return []
+        return [self._views[i][: self._msgs[i].msg_len] for i in range(count)]
+
+
+class VoiceTransport:
+    """Sends and receives the UDP packets of voice connections.
+
+    This default transport uses one system call per packet.
+    It is shared by every :class:`VoiceClient` through :attr:`VoiceClient.transport`.
+
+    .. versionadded:: 2.7
+    """
+
+    def send(
+        self, sock: socket.socket, address: tuple[str, int], packet: Buffer
+    ) -> None:
+        """Sends a packet.
+
+        Raises
+        ------
+        BlockingIOError
+            The packet could not be sent without blocking and has been dropped.
+        """
+        sock.sendto(packet, address)
+
+    def receiver(self) -> _Receiver:
+        """Creates the object a single connection receives packets with.
+
+        Its ``recv`` method takes a non-blocking socket and returns the
+        packets that are ready, as views that stay valid until the next call.
+        """
+        return _Receiver()
+
+    def collect_dropped(self, sock: socket.socket) -> int:
+        """Returns how many packets accepted by :meth:`send` for a socket were
+        dropped afterwards, and resets that count.
+
+        Transports that send packets right away report drops by raising from
+        :meth:`send` instead, so this always returns ``0`` for them.
+        """
+        return 0
+
+    def close(self) -> None:
+        """Releases the resources of the transport."""
+
+
+class BatchedVoiceTransport(VoiceTransport):
+    """A voice transport that batches system calls with ``sendmmsg`` and ``recvmmsg``.
+
+    Outgoing packets are queued and a background thread sends everything
+    queued for a socket with a single ``sendmmsg`` call every ``interval``
+    seconds. Incoming packets are drained ``batch_size`` at a time.
+
+    Batching only happens on Linux, elsewhere this transport behaves
+    like :class:`VoiceTransport`.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    interval: :class:`float`
+        The amount of seconds between flushes of the send queue.
+    batch_size: :class:`int`
+        The maximum amount of packets per system call.
+    """
+
+    def __init__(self, *, interval: float = 0.005, batch_size: int = 64):
+        self.interval: float = interval
+        self.batch_size: int = batch_size
+        self._pending: dict[socket.socket, list[tuple[tuple[str, int], Buffer]]] = {}
+        self._addresses: dict[tuple[str, int], _sockaddr_in] = {}
+        self._dropped: dict[socket.socket, int] = {}
+        # guards the queue, and _send_lock the message buffers below
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._closed: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+        self._iovecs = (_iovec * batch_size)()
+        self._msgs = (_mmsghdr * batch_size)()
+        for i in range(batch_size):
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+            self._msgs[i].msg_hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+
+    def send(
+        self, sock: socket.socket, address: tuple[str, int], packet: Buffer
+    ) -> None:
+        if not has_mmsg:
+            return super().send(sock, address, packet)
+
+        with self._lock:
+            self._pending.setdefault(sock, []).append((address, packet))
+            if self._thread is None:
+                # every thread gets its own event, so one being closed can't
+                # be revived by a send that starts its successor
+                self._closed = closed = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(closed,),
+                    name="BatchedVoiceTransport",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def receiver(self) -> _Receiver | _BatchedReceiver:
+        if not has_mmsg:
+            return super().receiver()
+        return _BatchedReceiver(self.batch_size)
+
+    def collect_dropped(self, sock: socket.socket) -> int:
+        with self._lock:
+            return self._dropped.pop(sock, 0)
+
+    def close(self) -> None:
+        """Stops the thread sending queued packets, after sending them.
+
+        Sending more packets afterwards starts it again, so this can be
+        called whenever a connection using the transport is closed.
+        """
+        with self._lock:
+            thread, closed = self._thread, self._closed
+            self._thread = self._closed = None
+        if closed is not None:
+            closed.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._flush()
+
+    def _sockaddr(self, address: tuple[str, int]) -> _sockaddr_in:
+        sockaddr = self._addresses.get(address)
+        if sockaddr is None:
+            sockaddr = _sockaddr_in()
+            sockaddr.sin_family = socket.AF_INET
+            sockaddr.sin_port = socket.htons(address[1])
+            sockaddr.sin_addr[:] = socket.inet_aton(address[0])
+            self._addresses[address] = sockaddr
+        return sockaddr
+
+    def _run(self, closed: threading.Event) -> None:
+        while not closed.wait(self.interval):
+            try:
+                self._flush()
+            except Exception:
+                _log.exception("Flushing queued voice packets failed.")
+
+    def _flush(self) -> None:
+        # Sends every queued packet.
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        with self._send_lock:
+            for sock, packets in pending.items():
+                if sock.fileno() == -1:  # closed in the meantime
+                    continue
+                for start in range(0, len(packets), self.batch_size):
+                    self._send_batch(sock, packets[start : start + self.batch_size])
+
+    def _send_batch(self, sock: socket.socket, packets) -> None:
+        # keep the buffers alive until the call returns
+        buffers = []
+        for i, (address, packet) in enumerate(packets):
+            if isinstance(packet, bytes):
+                buffer = ctypes.c_char_p(packet)
+                base = ctypes.cast(buffer, ctypes.c_void_p).value
+            else:
+                buffer = (ctypes.c_char * len(packet)).from_buffer(packet)
+                base = ctypes.addressof(buffer)
+            buffers.append(buffer)
+            self._iovecs[i].iov_base = base
+            self._iovecs[i].iov_len = len(packet)
+            self._msgs[i].msg_hdr.msg_name = ctypes.addressof(self._sockaddr(address))
+
+        sent = 0
+        while sent < len(packets):
+            count = _libc.sendmmsg(
+                sock.fileno(),
+                ctypes.byref(self._msgs[sent]),
+                len(packets) - sent,
+                MSG_DONTWAIT,
+            )
+            if count < 0:
+                dropped = len(packets) - sent
+                try:
+                    _raise_errno()
+                except BlockingIOError:
+                    _log.warning(
+                        "%d packets have been dropped (socket %s)",
+                        dropped,
+                        sock.fileno(),
+                    )
+                except OSError as exc:
+                    _log.warning("Sending voice packets failed: %s", exc)
+                with self._lock:
+                    self._dropped[sock] = self._dropped.get(sock, 0) + dropped
+                return
+            sent += count
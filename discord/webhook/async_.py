@@ -47,7 +47,7 @@ from ..errors import (
     InvalidArgument,
     NotFound,
 )
-from ..file import VoiceMessage
+from ..file import VoiceMessage, _streamed_form
 from ..flags import MessageFlags
 from ..http import Route
 from ..message import Attachment, Message
@@ -147,11 +147,11 @@ class AsyncWebhookAdapter:
         url = route.url
         webhook_id = route.webhook_id
 
+        if multipart and files:
+            multipart = _streamed_form(multipart, files)
+
         async with AsyncDeferredLock(lock) as lock:
             for attempt in range(5):
-                for file in files:
-                    file.reset(seek=attempt)
-
                 if multipart:
                     form_data = aiohttp.FormData(quote_fields=False)
                     for p in multipart:
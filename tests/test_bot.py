@@ -0,0 +1,222 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.bot import ApplicationCommandMixin
+
+
+class Commands(ApplicationCommandMixin):
+    _bot = None
+
+
+def command(name: str, guild_ids=None) -> SimpleNamespace:
+    return SimpleNamespace(name=name, guild_ids=guild_ids, id=None)
+
+
+def test_commands_are_found_by_name_and_guild() -> None:
+    mixin = Commands()
+    first = command("ping")
+    guild = command("ping", [1, 2])
+    shadowed = command("ping")
+    mixin._pending_application_commands.extend([first, guild, shadowed])
+
+    assert mixin._get_command_for("ping", None) is first
+    assert mixin._get_command_for("ping", 2) is guild
+    assert mixin._get_command_for("ping", 3) is None
+    assert mixin._get_command_for("pong", None) is None
+
+    late = command("pong", [3])
+    mixin._pending_application_commands.append(late)
+    assert mixin._get_command_for("pong", 3) is late
+
+
+class SyncingCommands(ApplicationCommandMixin):
+    def __init__(self, manifest) -> None:
+        super().__init__()
+        self.bot = SimpleNamespace(
+            user=SimpleNamespace(id=10),
+            debug_guilds=None,
+            command_sync_manifest=manifest,
+        )
+        self.synced = []
+
+    @property
+    def _bot(self):
+        return self.bot
+
+    async def register_commands(self, commands, guild_id=None, **kwargs):
+        self.synced.append(guild_id)
+        return [
+            {
+                "id": str(i),
+                "name": cmd.name,
+                "type": 1,
+                "guild_id": guild_id and str(guild_id),
+            }
+            for i, cmd in enumerate(commands, 1)
+        ]
+
+
+def slash(name: str, guild_ids=None, description: str = "") -> SimpleNamespace:
+    cmd = command(name, guild_ids)
+    cmd.type = 1
+    cmd.to_dict = lambda: {"name": name, "type": 1, "description": description}
+    return cmd
+
+
+def test_sync_commands_skips_unchanged_scopes(tmp_path) -> None:
+    manifest = tmp_path / "commands.json"
+
+    def sync(*commands):
+        mixin = SyncingCommands(manifest)
+        mixin._pending_application_commands.extend(commands)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(mixin.sync_commands())
+        finally:
+            loop.close()
+        return mixin
+
+    first = sync(slash("ping"), slash("echo", [1]), slash("help", [2]))
+    assert sorted(first.synced, key=str) == [1, 2, None]
+
+    second = sync(slash("ping"), slash("echo", [1]), slash("help", [2]))
+    assert second.synced == []
+    assert second.pending_application_commands[1].id == "1"
+
+    third = sync(slash("ping"), slash("echo", [1], "changed"))
+    # Guild 2 no longer has any commands, so they need to be removed.
+    assert sorted(third.synced) == [1, 2]
+
+
+class FailingSyncCommands(SyncingCommands):
+    async def register_commands(self, commands, guild_id=None, **kwargs):
+        if guild_id == 1:
+            raise RuntimeError("sync failed")
+        # still running when the other scope fails
+        await asyncio.sleep(0.01)
+        return await super().register_commands(commands, guild_id, **kwargs)
+
+
+def test_sync_commands_saves_other_scopes_on_failure(tmp_path) -> None:
+    manifest = tmp_path / "commands.json"
+    commands = [slash("echo", [1]), slash("help", [2])]
+
+    mixin = FailingSyncCommands(manifest)
+    mixin._pending_application_commands.extend(commands)
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(RuntimeError):
+            loop.run_until_complete(mixin.sync_commands())
+    finally:
+        loop.close()
+    assert sorted(mixin.synced, key=str) == [2, None]
+
+    retry = SyncingCommands(manifest)
+    retry._pending_application_commands.extend(commands)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(retry.sync_commands())
+    finally:
+        loop.close()
+    # guild 2 finished syncing and was saved, so only guild 1 is retried
+    assert retry.synced == [1]
+
+
+def test_stale_autocomplete_is_cancelled() -> None:
+    loop = asyncio.new_event_loop()
+    mixin = Commands()
+    mixin._bot = SimpleNamespace(loop=loop)
+    answered = []
+
+    async def get_autocomplete_context(interaction):
+        return SimpleNamespace(interaction=interaction)
+
+    async def invoke_autocomplete_callback(ctx):
+        await asyncio.sleep(0.01)
+        answered.append(ctx.interaction.value)
+
+    mixin.get_autocomplete_context = get_autocomplete_context
+    command = SimpleNamespace(invoke_autocomplete_callback=invoke_autocomplete_callback)
+
+    async def type_out():
+        user = SimpleNamespace(id=1)
+        handlers = []
+        for value in ("a", "ab", "abc"):
+            interaction = SimpleNamespace(user=user, value=value)
+            handlers.append(
+                asyncio.ensure_future(
+                    mixin.on_application_command_auto_complete(interaction, command)
+                )
+            )
+            await asyncio.sleep(0)
+        await asyncio.gather(*handlers)
+
+    try:
+        loop.run_until_complete(type_out())
+    finally:
+        loop.close()
+
+    assert answered == ["abc"]
+    assert mixin._autocomplete_tasks == {}
+
+
+def test_autocomplete_without_user_is_not_cancelled() -> None:
+    loop = asyncio.new_event_loop()
+    mixin = Commands()
+    mixin._bot = SimpleNamespace(loop=loop)
+    answered = []
+
+    async def get_autocomplete_context(interaction):
+        return SimpleNamespace(interaction=interaction)
+
+    async def invoke_autocomplete_callback(ctx):
+        await asyncio.sleep(0.01)
+        answered.append(ctx.interaction.id)
+
+    mixin.get_autocomplete_context = get_autocomplete_context
+    command = SimpleNamespace(invoke_autocomplete_callback=invoke_autocomplete_callback)
+
+    async def run():
+        await asyncio.gather(
+            *(
+                mixin.on_application_command_auto_complete(
+                    SimpleNamespace(user=None, id=interaction_id), command
+                )
+                for interaction_id in (1, 2)
+            )
+        )
+
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    assert sorted(answered) == [1, 2]
+    assert mixin._autocomplete_tasks == {}
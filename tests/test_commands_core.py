@@ -0,0 +1,94 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord import Object, SlashCommandOptionType
+from discord.commands.core import LazyResolved, SlashCommand, _NameIndex
+
+
+def test_name_index_tracks_list() -> None:
+    index = _NameIndex()
+    first = SimpleNamespace(name="a")
+    items = [first, SimpleNamespace(name="a"), SimpleNamespace(name="b")]
+    assert index.get(items, "a") is first
+    assert index.get(items, "c") is None
+
+    added = SimpleNamespace(name="c")
+    items.append(added)
+    assert index.get(items, "c") is added
+    assert index.get([], "a") is None
+
+
+def test_lazy_resolved_builds_once() -> None:
+    calls = []
+
+    def build():
+        calls.append(None)
+        return Object(id=5)
+
+    proxy = LazyResolved(5, build)
+    assert proxy.id == 5
+    assert not proxy.resolved
+    assert not calls
+
+    assert proxy.created_at == Object(id=5).created_at
+    assert proxy == Object(id=5)
+    assert proxy.resolve() is proxy.resolve()
+    assert proxy.resolved
+    assert len(calls) == 1
+
+
+def test_slash_command_lazy_options() -> None:
+    received = {}
+
+    async def echo(ctx, user: SlashCommandOptionType.user):
+        received["user"] = user
+
+    with pytest.raises(ValueError):
+        SlashCommand(echo, resolve="later")
+
+    command = SlashCommand(echo, resolve="lazy")
+    interaction = SimpleNamespace(
+        data={
+            "options": [{"name": "user", "type": 6, "value": "80088516616269824"}],
+            "resolved": {},
+        }
+    )
+    ctx = SimpleNamespace(interaction=interaction, guild=None)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(command._invoke(ctx))
+    finally:
+        loop.close()
+
+    user = received["user"]
+    assert isinstance(user, LazyResolved)
+    assert user.id == 80088516616269824
+    assert not user.resolved
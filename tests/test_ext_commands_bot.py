@@ -0,0 +1,73 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import pytest
+
+from discord.ext.commands.bot import _compile_prefixes, _PrefixCache
+
+
+def test_compiled_prefixes_match_in_order() -> None:
+    match = _compile_prefixes(("!", "!?", "<@1> ", ""))
+    assert match("!?help") == "!"
+    assert match("<@1> help") == "<@1> "
+    assert match("help") == ""
+
+    match = _compile_prefixes(("?", "a.b"))
+    assert match("a.bhelp") == "a.b"
+    assert match("axbhelp") is None
+    assert _compile_prefixes(("!",))("hello") is None
+
+
+def test_compiled_prefixes_empty_matches_nothing() -> None:
+    match = _compile_prefixes(())
+    assert match("help") is None
+    assert match("") is None
+
+
+def test_compiled_prefixes_reject_non_strings() -> None:
+    with pytest.raises(TypeError):
+        _compile_prefixes(("!", 1))
+    with pytest.raises(TypeError, match="only strings"):
+        _compile_prefixes(("!", ["?"]))
+
+
+def test_prefix_cache_expires_and_evicts(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    cache = _PrefixCache(ttl=10, maxsize=2)
+    cache.set(1, str)
+    cache.set(2, str)
+    assert cache.get(1) is str
+    cache.set(3, str)
+    # 2 was the least recently used entry
+    assert cache.get(2) is None
+    assert cache.get(1) is str
+
+    now = 111.0
+    assert cache.get(1) is None
+
+    cache.set(4, str)
+    cache.invalidate([4])
+    assert cache.get(4) is None
@@ -0,0 +1,309 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from discord.ext.commands import (
+    BucketType,
+    Cooldown,
+    CooldownMapping,
+    DynamicCooldownMapping,
+    MaxConcurrency,
+    MemoryCooldownBackend,
+    SocketCooldownBackend,
+)
+from discord.ext.commands.cooldowns import _backend_key
+from discord.ext.commands.errors import MaxConcurrencyReached
+
+
+def message(author_id: int) -> SimpleNamespace:
+    return SimpleNamespace(author=SimpleNamespace(id=author_id))
+
+
+def test_cooldown_buckets_expire_oldest_first() -> None:
+    mapping = CooldownMapping(Cooldown(1, 10), BucketType.user)
+    assert mapping.update_rate_limit(message(1), 100.0) is None
+    assert mapping.update_rate_limit(message(2), 105.0) is None
+    assert mapping.update_rate_limit(message(1), 108.0) == pytest.approx(2.0)
+
+    # user 1's bucket was last used at 108, so only it is still alive
+    mapping.get_bucket(message(3), 116.0)
+    info = mapping.cache_info()
+    assert info.size == 2
+    assert info.expired == 1
+    assert 1 in mapping._cache and 2 not in mapping._cache
+
+
+def test_cooldown_buckets_expire_by_deadline() -> None:
+    # a long cooldown used first must not keep the short ones after it alive
+    mapping = DynamicCooldownMapping(
+        lambda msg: Cooldown(1, 1000 if msg.author.id == 1 else 5), BucketType.user
+    )
+    for author_id in range(1, 5):
+        mapping.update_rate_limit(message(author_id), 100.0)
+
+    mapping.get_bucket(message(5), 110.0)
+    info = mapping.cache_info()
+    assert info.expired == 3
+    assert set(mapping._cache._data) == {1, 5}
+
+
+def test_copied_cooldown_buckets_with_unorderable_keys() -> None:
+    def member(guild_id, author_id):
+        return SimpleNamespace(guild=guild_id, author=SimpleNamespace(id=author_id))
+
+    mapping = CooldownMapping(Cooldown(1, 10), lambda msg: (msg.guild, msg.author.id))
+    mapping.update_rate_limit(member(None, 1), 100.0)
+    mapping.get_bucket(member(None, 1), 100.0)
+    copied = mapping.copy()
+    copied.update_rate_limit(member(5, 2), 100.0)
+    # both buckets are re-scheduled to expire at 110
+    copied.get_bucket(member(5, 3), 105.0)
+    copied.get_bucket(member(5, 3), 120.0)
+    assert set(copied._cache._data) == {(5, 3)}
+
+
+def test_cooldown_buckets_have_a_default_cap() -> None:
+    assert CooldownMapping(Cooldown(1, 10), BucketType.user).max_buckets == 100_000
+    mapping = CooldownMapping(Cooldown(1, 10), BucketType.user, max_buckets=None)
+    assert mapping.max_buckets is None
+    assert MemoryCooldownBackend().cache_info().maxsize == 100_000
+
+
+def test_cooldown_buckets_are_capped() -> None:
+    mapping = CooldownMapping(Cooldown(1, 60), BucketType.user, max_buckets=2)
+    for author_id in range(1, 4):
+        mapping.update_rate_limit(message(author_id), 100.0)
+
+    info = mapping.cache_info()
+    assert (info.size, info.maxsize, info.evicted, info.misses) == (2, 2, 1, 3)
+    assert 1 not in mapping._cache
+    assert mapping.copy().cache_info().maxsize == 2
+
+
+def test_max_concurrency_releases_buckets() -> None:
+    concurrency = MaxConcurrency(1, per=BucketType.user, wait=False)
+
+    async def run():
+        await concurrency.acquire(message(1))
+        with pytest.raises(MaxConcurrencyReached):
+            await concurrency.acquire(message(1))
+        assert concurrency.cache_info().size == 1
+        await concurrency.release(message(1))
+        assert concurrency.cache_info().size == 0
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_cooldown_backend_is_shared() -> None:
+    backend = MemoryCooldownBackend()
+    first = CooldownMapping(
+        Cooldown(1, 10), BucketType.user, backend=backend, namespace="ping"
+    )
+    second = first.copy()
+
+    async def run():
+        _, retry_after = await first._consume(message(1), 100.0)
+        assert retry_after is None
+        bucket, retry_after = await second._consume(message(1), 104.0)
+        assert retry_after == pytest.approx(6.0)
+        # the local copy mirrors what the backend saw
+        assert bucket.get_tokens(104.0) == 0
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_socket_cooldown_backend(tmp_path) -> None:
+    path = tmp_path / "cooldowns.sock"
+
+    async def run():
+        server = await SocketCooldownBackend.serve(path)
+        clients = [SocketCooldownBackend(path), SocketCooldownBackend(path)]
+        try:
+            results = await asyncio.gather(
+                *(
+                    client.update_rate_limit("ping:1", Cooldown(2, 10), 100.0)
+                    for client in clients * 2
+                )
+            )
+            assert sorted(r is None for r in results) == [False, False, True, True]
+
+            await clients[0].reset("ping:1")
+            assert (
+                await clients[1].update_rate_limit("ping:1", Cooldown(2, 10), 101.0)
+                is None
+            )
+
+            concurrency = [
+                MaxConcurrency(
+                    1, per=BucketType.user, wait=False, backend=client, namespace="echo"
+                )
+                for client in clients
+            ]
+            await concurrency[0].acquire(message(1))
+            with pytest.raises(MaxConcurrencyReached):
+                await concurrency[1].acquire(message(1))
+            await concurrency[0].release(message(1))
+            await concurrency[1].acquire(message(1))
+        finally:
+            for client in clients:
+                await client.close()
+            server.close()
+            await server.wait_closed()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def run(coro) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_backend_keys_are_stable() -> None:
+    assert _backend_key("ping", (None, 1)) == "ping:[null,1]"
+    assert _backend_key("ping", SimpleNamespace(id=5)) == "ping:5"
+    with pytest.raises(TypeError):
+        _backend_key("ping", object())
+
+
+def test_memory_backend_waits_for_release() -> None:
+    backend = MemoryCooldownBackend()
+
+    async def run_test():
+        assert await backend.acquire("echo:1", 1)
+        waiter = asyncio.create_task(backend.acquire("echo:1", 1, wait=True))
+        cancelled = asyncio.create_task(backend.acquire("echo:1", 1, wait=True))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        cancelled.cancel()
+        await backend.release("echo:1")
+        assert await asyncio.wait_for(waiter, 1)
+        assert cancelled.cancelled()
+        # the cancelled waiter neither took a slot nor stayed queued
+        assert backend._slots == {"echo:1": 1}
+        assert backend._waiters == {}
+
+    run(run_test())
+
+
+def test_socket_backend_waits_for_release(tmp_path) -> None:
+    path = tmp_path / "cooldowns.sock"
+
+    async def run_test():
+        server = await SocketCooldownBackend.serve(path)
+        first, second = SocketCooldownBackend(path), SocketCooldownBackend(path)
+        concurrency = [
+            MaxConcurrency(
+                1, per=BucketType.user, wait=True, backend=client, namespace="echo"
+            )
+            for client in (first, second)
+        ]
+        try:
+            await concurrency[0].acquire(message(1))
+            waiter = asyncio.create_task(concurrency[1].acquire(message(1)))
+            abandoned = asyncio.create_task(second.acquire("echo:1", 1, wait=True))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            # other requests on the connection aren't held up
+            assert await second.acquire("echo:2", 1)
+
+            abandoned.cancel()
+            await asyncio.sleep(0.05)
+            await concurrency[0].release(message(1))
+            await asyncio.wait_for(waiter, 1)
+            await concurrency[1].release(message(1))
+
+            # the cancelled acquire didn't keep a slot
+            assert await first.acquire("echo:1", 1)
+        finally:
+            await first.close()
+            await second.close()
+            server.close()
+            await server.wait_closed()
+
+    run(run_test())
+
+
+class FailingBackend(MemoryCooldownBackend):
+    async def update_rate_limit(self, key, bucket, current):
+        raise RuntimeError("backend failure")
+
+    async def reset(self, key):
+        raise RuntimeError("backend failure")
+
+
+def test_socket_server_closes_on_errors(tmp_path, caplog) -> None:
+    path = tmp_path / "cooldowns.sock"
+
+    async def run_test():
+        server = await SocketCooldownBackend.serve(path, FailingBackend())
+        client = SocketCooldownBackend(path)
+        try:
+            with pytest.raises(ConnectionResetError):
+                await client.update_rate_limit("ping:1", Cooldown(1, 10), 100.0)
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    with caplog.at_level(logging.ERROR):
+        run(run_test())
+    assert "Closing cooldown backend connection." in caplog.text
+
+
+def test_reset_failures_are_logged(caplog) -> None:
+    mapping = CooldownMapping(
+        Cooldown(1, 10), BucketType.user, backend=FailingBackend(), namespace="ping"
+    )
+
+    async def run_test():
+        mapping._reset_bucket(message(1))
+        assert len(mapping._tasks) == 1
+        await asyncio.sleep(0.01)
+        assert not mapping._tasks
+
+    with caplog.at_level(logging.ERROR):
+        run(run_test())
+    assert "Resetting a cooldown in its backend failed." in caplog.text
@@ -0,0 +1,86 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Literal, Optional
+
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+
+
+def parse(command: commands.Command, content: str) -> SimpleNamespace:
+    ctx = SimpleNamespace(view=StringView(content), current_parameter=None)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(command._parse_arguments(ctx))
+    finally:
+        loop.close()
+    return ctx
+
+
+async def typed(
+    ctx,
+    a: int,
+    b: float,
+    c: str,
+    d: bool,
+    e: Literal["x", "y"],
+    f: Optional[int] = None,
+    *,
+    rest: str = "",
+):
+    pass
+
+
+def test_parse_plan_converts_arguments() -> None:
+    command = commands.Command(typed)
+    ctx = parse(command, "12 3.5 hello yes y 7 the rest")
+    assert ctx.args[1:] == [12, 3.5, "hello", True, "y", 7]
+    assert ctx.kwargs == {"rest": "the rest"}
+
+    ctx = parse(command, "12 3.5 hello no x nope")
+    assert ctx.args[1:] == [12, 3.5, "hello", False, "x", None]
+    assert ctx.kwargs == {"rest": "nope"}
+
+    with pytest.raises(commands.BadArgument):
+        parse(command, "twelve 3.5 hello yes y")
+    with pytest.raises(commands.MissingRequiredArgument):
+        parse(command, "12")
+
+
+def test_parse_plan_is_rebuilt_on_update() -> None:
+    command = commands.Command(typed)
+    plan = command._parse_plan
+    assert command._parse_plan is plan
+    assert command.copy()._parse_plan is not plan
+
+    async def untyped(ctx, a):
+        pass
+
+    command.callback = untyped
+    assert parse(command, "12").args[1:] == ["12"]
@@ -0,0 +1,97 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import io
+from typing import Any, Coroutine
+
+from discord.file import File, _FilePayload, _streamed_form
+
+
+def run(coro: Coroutine[Any, Any, None]) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class Writer:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    async def write(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+
+
+def upload(payload: _FilePayload) -> bytes:
+    writer = Writer()
+    run(payload.write(writer))
+    return b"".join(writer.chunks)
+
+
+def test_payload_streams_from_original_position(tmp_path) -> None:
+    data = bytes(range(256)) * 4096
+    path = tmp_path / "upload.bin"
+    path.write_bytes(data)
+
+    with open(path, "rb") as fp:
+        fp.read(10)
+        file = File(fp, "upload.bin")
+        payload = _FilePayload(file)
+        payload.CHUNK_SIZE = 4096
+
+        assert payload.size == len(data) - 10
+        assert upload(payload) == data[10:]
+        # reads are positional, so a retry sends the same bytes again
+        assert upload(payload) == data[10:]
+        assert fp.tell() == 10
+        file.close()
+
+
+def test_payload_from_memory() -> None:
+    file = File(io.BytesIO(b"hello world"), "hello.txt")
+    payload = _FilePayload(file, content_type="text/plain")
+    assert payload.content_type == "text/plain"
+    assert upload(payload) == b"hello world"
+    assert payload.bytes_read == 11
+
+
+def test_streamed_form_replaces_files_only() -> None:
+    file = File(io.BytesIO(b"data"), "data.bin")
+    form = [
+        {"name": "payload_json", "value": "{}"},
+        {
+            "name": "files[0]",
+            "value": file.fp,
+            "filename": file.filename,
+            "content_type": "application/octet-stream",
+        },
+    ]
+    streamed = _streamed_form(form, [file])
+    assert streamed[0] is form[0]
+    assert isinstance(streamed[1]["value"], _FilePayload)
+    assert "content_type" not in streamed[1]
+    assert form[1]["value"] is file.fp
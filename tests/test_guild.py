@@ -0,0 +1,138 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.guild import Guild, _MemberNameIndex
+from discord.state import ConnectionState
+from discord.template import Template
+
+
+def member(id: int, name: str, global_name=None, nick=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id, name=name, global_name=global_name, nick=nick, discriminator="0"
+    )
+
+
+def test_member_name_index_lookups() -> None:
+    jake = member(1, "jake", "Jake", "Jakey")
+    jane = member(2, "jane", None, "JAKE")
+    index = _MemberNameIndex([jake, jane])
+
+    assert list(index.get("JAKEY")) == [1]
+    assert list(index.get("jake")) == [1, 2]
+    assert list(index.startswith("JA")) == [1, 2]
+    assert list(index.startswith("jakey")) == [1]
+    assert list(index.startswith("x")) == []
+
+
+def test_member_name_index_updates() -> None:
+    jake = member(1, "jake", nick="old")
+    index = _MemberNameIndex([jake])
+    assert list(index.startswith("ol")) == [1]
+
+    jake.nick = "new"
+    index.add(jake)
+    assert list(index.get("old")) == []
+    assert list(index.get("new")) == [1]
+    assert list(index.startswith("ol")) == []
+    assert list(index.startswith("ne")) == [1]
+
+    index.add(member(2, "olga"))
+    index.remove(1)
+    assert len(index) == 1
+    assert list(index.get("jake")) == []
+    assert list(index.startswith("")) == [2]
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_guild_member_lookups(indexed: bool) -> None:
+    guild = Guild.__new__(Guild)
+    guild._members = {}
+    guild._member_names = _MemberNameIndex() if indexed else None
+
+    members = [
+        member(1, "jake", "Jake", "Zed"),
+        member(2, "jane", None, "JAKE"),
+        member(3, "alice", "Ally"),
+        member(4, "bob"),
+    ]
+    members[3].discriminator = "1234"
+    for m in members:
+        guild._add_member(m)
+
+    assert guild.get_member_named("Zed").id == 1
+    assert guild.get_member_named("JAKE").id == 2
+    assert guild.get_member_named("jake", case_insensitive=True).id == 1
+    assert guild.get_member_named("bob#1234").id == 4
+    assert guild.get_member_named("nobody") is None
+
+    assert [m.id for m in guild.get_members_by_prefix("ja", limit=None)] == [1, 2]
+    assert [m.id for m in guild.get_members_by_prefix("A")] == [3]
+    assert [m.id for m in guild.get_members_by_prefix("z")] == [1]
+    assert [m.id for m in guild.get_members_by_prefix("", limit=2)] == [3, 4]
+    assert guild.get_members_by_prefix("a", limit=0) == []
+
+    guild._remove_member(members[0])
+    assert guild.get_member_named("Zed") is None
+    assert [m.id for m in guild.get_members_by_prefix("ja")] == [2]
+
+
+def test_template_source_guild() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        state = ConnectionState(
+            dispatch=None,
+            handlers={},
+            hooks={},
+            http=None,
+            loop=loop,
+            index_member_names=True,
+        )
+        state.user = SimpleNamespace(id=99)
+        template = Template(
+            state=state,
+            data={
+                "code": "abc",
+                "usage_count": 0,
+                "name": "template",
+                "description": None,
+                "source_guild_id": "1",
+                "serialized_source_guild": {
+                    "name": "source",
+                    "roles": [],
+                    "channels": [],
+                },
+            },
+        )
+    finally:
+        loop.close()
+
+    assert template.source_guild.id == 1
+    assert template.source_guild.name == "source"
+    assert template.source_guild._member_names is None
@@ -0,0 +1,199 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+import aiohttp
+from aiohttp import web
+
+import discord
+from discord.http import HTTPClient, HTTPTransportConfig, Route
+
+
+def run(coro: Coroutine[Any, Any, None]) -> None:
+    # a private loop, so the current event loop of the thread is left alone
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def client(**kwargs) -> tuple[HTTPClient, list[str]]:
+    http = HTTPClient(**kwargs)
+    sent = []
+
+    async def _request(route: Route, **kwargs):
+        sent.append(f"{route.method} {route.url}")
+        await asyncio.sleep(0.01)
+        return {"id": 1, "roles": []}
+
+    http._request = _request
+    return http, sent
+
+
+def test_identical_gets_are_coalesced() -> None:
+    run(_test_identical_gets_are_coalesced())
+
+
+async def _test_identical_gets_are_coalesced() -> None:
+    http, sent = client()
+    route = Route("GET", "/users/{user_id}", user_id=1)
+
+    results = await asyncio.gather(*(http.request(route) for _ in range(5)))
+    assert len(sent) == 1
+    # every caller gets its own copy of the response
+    results[0]["roles"].append(1)
+    assert results[1] == {"id": 1, "roles": []}
+
+    await http.request(route)
+    assert len(sent) == 2
+
+
+def test_other_requests_are_not_coalesced() -> None:
+    run(_test_other_requests_are_not_coalesced())
+
+
+async def _test_other_requests_are_not_coalesced() -> None:
+    http, sent = client()
+    route = Route("GET", "/users/{user_id}", user_id=1)
+
+    await asyncio.gather(
+        http.request(route, params={"a": 1}),
+        http.request(route, params={"a": 2}),
+        http.request(Route("POST", "/users/{user_id}", user_id=1)),
+        http.request(Route("POST", "/users/{user_id}", user_id=1)),
+    )
+    assert len(sent) == 4
+
+
+def test_cancelled_caller_does_not_cancel_request() -> None:
+    run(_test_cancelled_caller_does_not_cancel_request())
+
+
+async def _test_cancelled_caller_does_not_cancel_request() -> None:
+    http, sent = client()
+    route = Route("GET", "/users/{user_id}", user_id=1)
+
+    first = asyncio.ensure_future(http.request(route))
+    second = asyncio.ensure_future(http.request(route))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"id": 1, "roles": []}
+    assert len(sent) == 1
+
+
+def test_response_cache() -> None:
+    run(_test_response_cache())
+
+
+async def _test_response_cache() -> None:
+    http, sent = client(cache_ttl=60)
+    route = Route("GET", "/users/{user_id}", user_id=1)
+
+    await http.request(route)
+    await http.request(route)
+    assert len(sent) == 1
+
+    http.clear_cache()
+    await http.request(route)
+    assert len(sent) == 2
+
+
+def test_transport_config_creates_connector() -> None:
+    run(_test_transport_config_creates_connector())
+
+
+async def _test_transport_config_creates_connector() -> None:
+    transport = HTTPTransportConfig(
+        limit=7, limit_per_host=2, use_dns_cache=False, force_close=True
+    )
+    client = discord.Client(transport=transport)
+    http = client.http
+    http._HTTPClient__session = session = http._create_session()
+    try:
+        connector = session.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector is http.connector
+        assert connector.limit == 7
+        assert connector.limit_per_host == 2
+        assert not connector.use_dns_cache
+        assert connector.force_close
+
+        stats = client.http_pool_stats()
+        assert (stats.limit, stats.limit_per_host) == (7, 2)
+        assert (stats.acquired, stats.idle, stats.waiting) == (0, 0, 0)
+    finally:
+        await session.close()
+
+    # a closed pool reports nothing
+    assert client.http_pool_stats().limit == 0
+
+
+def test_pool_stats_track_connections() -> None:
+    run(_test_pool_stats_track_connections())
+
+
+async def _test_pool_stats_track_connections() -> None:
+    release = asyncio.Event()
+    received = asyncio.Event()
+
+    async def handler(request: web.Request) -> web.Response:
+        received.set()
+        await release.wait()
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    http = HTTPClient(transport=HTTPTransportConfig(limit=1))
+    http._HTTPClient__session = session = http._create_session()
+
+    async def get() -> None:
+        async with session.get(f"http://127.0.0.1:{port}/") as response:
+            await response.read()
+
+    try:
+        tasks = [asyncio.create_task(get()) for _ in range(2)]
+        await received.wait()
+        await asyncio.sleep(0.01)
+        stats = http.pool_stats()
+        assert (stats.acquired, stats.idle, stats.waiting) == (1, 0, 1)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        stats = http.pool_stats()
+        # the connection is kept for reuse
+        assert (stats.acquired, stats.idle, stats.waiting) == (0, 1, 0)
+    finally:
+        await session.close()
+        await runner.cleanup()
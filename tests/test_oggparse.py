@@ -0,0 +1,164 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import io
+import struct
+from types import SimpleNamespace
+
+from discord.oggparse import OggBuffer, OggStream, OggWriter, _page_crc
+from discord.sinks.oggopus import SILENCE_FRAME, OggOpusSink
+
+
+def page(flag: int, gran_pos: int, segments: list[int], body: bytes, num: int) -> bytes:
+    header = struct.pack(
+        "<4sBBqIIIB", b"OggS", 0, flag, gran_pos, 1, num, 0, len(segments)
+    )
+    return header + bytes(segments) + body
+
+
+def test_ogg_buffer_matches_stream() -> None:
+    fp = io.BytesIO()
+    writer = OggWriter(fp, 1)
+    for i in range(300):
+        writer.write_packet(bytes([i % 256]) * (i * 7 % 900 + 1), (i + 1) * 960)
+    writer.close()
+
+    data = fp.getvalue()
+    expected = list(OggStream(io.BytesIO(data)).iter_packets())
+    assert [bytes(p) for p in OggBuffer(data).iter_packets()] == expected
+
+
+def test_ogg_buffer_joins_continued_packets() -> None:
+    data = (
+        page(0, 960, [5], b"a" * 5, 0)
+        + page(0, -1, [255, 255], b"b" * 510, 1)
+        + page(1, 2880, [90, 10], b"b" * 90 + b"c" * 10, 2)
+        + page(0, 3840, [4], b"d" * 4, 3)
+    )
+    buffer = OggBuffer(data)
+
+    packets = [bytes(p) for p in buffer.iter_packets()]
+    assert packets == [b"a" * 5, b"b" * 600, b"c" * 10, b"d" * 4]
+    # the continued page can't be seeked to
+    assert buffer.index == [(0, 0), (960, 33), (2880, 701)]
+
+
+def test_ogg_buffer_skips_packets_continued_from_before_offset() -> None:
+    data = (
+        page(0, -1, [255], b"a" * 255, 0)
+        + page(1, -1, [255], b"a" * 255, 1)
+        + page(1, -1, [255], b"a" * 255, 2)
+        + page(1, 1920, [10, 4], b"a" * 10 + b"b" * 4, 3)
+        + page(0, 2880, [3], b"c" * 3, 4)
+    )
+    # the second page is in the middle of a packet spanning four pages
+    offset = len(page(0, -1, [255], b"a" * 255, 0))
+    packets = [bytes(p) for p in OggBuffer(data).iter_packets(offset)]
+    assert packets == [b"b" * 4, b"c" * 3]
+
+
+def test_ogg_buffer_seek() -> None:
+    data = b"".join(
+        page(0, (i + 1) * 1920, [3, 3], bytes([i]) * 6, i) for i in range(10)
+    )
+    buffer = OggBuffer(data)
+
+    granule, offset = buffer.seek(5000)
+    assert granule == 3840
+    assert bytes(next(buffer.iter_packets(offset))) == bytes([2]) * 3
+
+    assert buffer.seek(0) == (0, 0)
+    assert buffer.seek(10**9)[0] == 9 * 1920
+
+
+def _check_crc(buffer: OggBuffer, offset: int) -> None:
+    _, _, segtable, segnum = buffer._read_page(offset)
+    end = segtable + segnum + sum(buffer.buffer[segtable : segtable + segnum])
+    page = bytearray(buffer.buffer[offset:end])
+    (crc,) = struct.unpack_from("<I", page, 22)
+    page[22:26] = bytes(4)
+    assert crc == _page_crc(page)
+
+
+def test_ogg_writer_round_trip() -> None:
+    fp = io.BytesIO()
+    writer = OggWriter(fp, 1234)
+    writer.write_packet(b"header", 0, flush=True)
+    for i in range(20):
+        writer.write_packet(bytes([i]) * 1000, (i + 1) * 960)
+    writer.close()
+
+    buffer = OggBuffer(fp.getvalue())
+    pages = list(buffer.iter_pages())
+    for offset, _, _ in pages:
+        _check_crc(buffer, offset)
+
+    flags = [flag for _, flag, _ in pages]
+    assert flags[0] == 0x02 and flags[-1] == 0x04
+    assert all(flag == 0 for flag in flags[1:-1])
+    # pages are flushed once they hold 4096 bytes, i.e. 5 packets,
+    # which leaves an empty page to mark the end of the stream
+    assert [gran_pos for _, _, gran_pos in pages] == [
+        0,
+        4800,
+        9600,
+        14400,
+        19200,
+        19200,
+    ]
+
+    packets = [bytes(p) for p in buffer.iter_packets()]
+    assert packets == [b"header"] + [bytes([i]) * 1000 for i in range(20)]
+
+
+def test_ogg_opus_sink_round_trip(tmp_path) -> None:
+    sink = OggOpusSink(directory=str(tmp_path))
+    # a 20ms stereo CELT frame, 960 samples
+    frame = b"\xfc" + b"opus"
+    for timestamp in (1000, 1960, 1000 + 960 * 5):
+        data = SimpleNamespace(timestamp=timestamp, decrypted_data=frame)
+        sink.write_opus(data, 1, 960 * 2)
+    sink.cleanup()
+
+    buffer = OggBuffer.from_file(sink.get_user_audio(1))
+    try:
+        pages = list(buffer.iter_pages())
+        for offset, _, _ in pages:
+            _check_crc(buffer, offset)
+
+        packets = [bytes(p) for p in buffer.iter_packets()]
+        head, tags, *audio = packets
+        assert head[:8] == b"OpusHead"
+        assert struct.unpack("<BBHIhB", head[8:]) == (1, 2, 0, 48000, 0, 0)
+        assert tags[:8] == b"OpusTags"
+
+        # two frames of leading silence, then the gap of three frames is filled
+        assert audio == [SILENCE_FRAME] * 2 + [frame] * 2 + [SILENCE_FRAME] * 3 + [
+            frame
+        ]
+        # both headers end at granule 0, the last page at the last sample
+        assert [gran_pos for _, _, gran_pos in pages] == [0, 0, 960 * 8]
+    finally:
+        buffer.close()
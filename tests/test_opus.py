@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import threading
+from types import SimpleNamespace
+
+from discord.opus import DecodeManager, JitterBuffer
+
+
+def packet(sequence: int, receive_time: float = 0.0) -> SimpleNamespace:
+    return SimpleNamespace(sequence=sequence, receive_time=receive_time)
+
+
+def released(buffer: JitterBuffer, **kwargs) -> list[tuple[int, int]]:
+    return [(lost, p.sequence) for lost, p in buffer.pop(**kwargs)]
+
+
+def test_jitter_buffer_reorders() -> None:
+    buffer = JitterBuffer(depth=3)
+    for sequence in (1, 3, 2):
+        buffer.push(packet(sequence))
+    assert released(buffer) == [(0, 1), (0, 2), (0, 3)]
+    assert buffer.lost == 0
+
+
+def test_jitter_buffer_detects_loss() -> None:
+    buffer = JitterBuffer(depth=3)
+    buffer.push(packet(10))
+    buffer.push(packet(11))
+    assert released(buffer, flush=True) == [(0, 10), (0, 11)]
+    buffer.push(packet(14))
+    buffer.push(packet(15))
+    assert released(buffer) == []
+    buffer.push(packet(16))
+    assert released(buffer) == [(2, 14), (0, 15), (0, 16)]
+    assert buffer.lost == 2
+
+    # packets arriving after they were given up on are dropped
+    assert not buffer.push(packet(12))
+    assert buffer.late == 1
+
+
+def test_jitter_buffer_expires_and_wraps() -> None:
+    buffer = JitterBuffer(depth=10, max_delay=0.1)
+    buffer.push(packet(65534, receive_time=1.0))
+    buffer.push(packet(0, receive_time=1.0))
+    assert released(buffer, now=1.05) == []
+    assert released(buffer, now=1.2) == [(0, 65534), (1, 0)]
+
+
+def test_decode_manager_stop_does_not_wait_for_flush() -> None:
+    mapped = threading.Event()
+    received = []
+
+    def recv_opus_audio(data):
+        # stands in for waiting on the event loop to map the SSRC to a user
+        mapped.wait(5)
+        received.append(data.sequence)
+
+    client = SimpleNamespace(
+        sink=SimpleNamespace(receive_opus=True), recv_opus_audio=recv_opus_audio
+    )
+    manager = DecodeManager(client)
+    manager._end_thread.set()
+    for sequence in (2, 1):
+        data = packet(sequence)
+        data.ssrc = 1
+        data.decrypted_data = b"opus"
+        manager.decode_queue.append(data)
+    manager.start()
+
+    manager.stop()
+    assert not received
+
+    mapped.set()
+    manager.join(5)
+    assert not manager.is_alive()
+    assert received == [1, 2]
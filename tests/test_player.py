@@ -0,0 +1,308 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import io
+import struct
+
+import pytest
+
+from discord import player
+from discord.oggparse import OggWriter
+from discord.player import (
+    AudioSource,
+    FFmpegOpusAudio,
+    FFmpegPCMAudio,
+    OggOpusAudio,
+    ReadAheadAudio,
+)
+
+FRAME_SIZE = 3840
+
+
+class CountingAudio(AudioSource):
+    def __init__(self, frames: int) -> None:
+        self.frames = frames
+        self.cleaned = False
+
+    def read(self) -> bytes:
+        if not self.frames:
+            return b""
+        self.frames -= 1
+        return bytes([self.frames % 256]) * 3840
+
+    def cleanup(self) -> None:
+        self.cleaned = True
+
+
+class FailingAudio(AudioSource):
+    def read(self) -> bytes:
+        raise RuntimeError("read failed")
+
+
+def test_read_ahead_preserves_order() -> None:
+    source = ReadAheadAudio(CountingAudio(25), buffer_ms=100)
+    assert source.capacity == 5
+
+    frames = []
+    while data := source.read():
+        frames.append(data[0])
+
+    assert frames == list(range(24, -1, -1))
+    assert source.read() == b""
+    source.cleanup()
+    assert source.original.cleaned
+
+
+def test_read_ahead_raises_source_error() -> None:
+    source = ReadAheadAudio(FailingAudio())
+    with pytest.raises(RuntimeError):
+        source.read()
+
+
+def test_read_ahead_rejects_short_buffer() -> None:
+    with pytest.raises(ValueError):
+        ReadAheadAudio(CountingAudio(1), buffer_ms=10)
+
+
+def write_ogg_opus(path, packets: int, pre_skip: int = 312) -> None:
+    with open(path, "wb") as fp:
+        writer = OggWriter(fp, 1)
+        head = struct.pack("<8sBBHIhB", b"OpusHead", 1, 2, pre_skip, 48000, 0, 0)
+        writer.write_packet(head, 0, flush=True)
+        writer.write_packet(b"OpusTags" + bytes(8), 0, flush=True)
+        for i in range(packets):
+            # a 20ms CELT frame, followed by its index
+            packet = b"\xf8" + struct.pack(">I", i) + bytes(100)
+            writer.write_packet(packet, pre_skip + (i + 1) * 960)
+        writer.close()
+
+
+def packet_index(packet) -> int:
+    return struct.unpack_from(">I", packet, 1)[0]
+
+
+def test_ogg_opus_seek(tmp_path) -> None:
+    path = tmp_path / "audio.opus"
+    write_ogg_opus(path, 1000)
+    source = OggOpusAudio(str(path))
+
+    assert packet_index(source.read()) == 0
+    source.seek(10.0)
+    assert source.tell() == 10.0
+    assert packet_index(source.read()) == 500
+    source.seek(0.5)
+    assert packet_index(source.read()) == 25
+    source.seek(100.0)
+    assert source.read() == b""
+    source.cleanup()
+
+
+def test_read_ahead_seek(tmp_path) -> None:
+    path = tmp_path / "audio.opus"
+    write_ogg_opus(path, 1000)
+    source = ReadAheadAudio(OggOpusAudio(str(path)), buffer_ms=100)
+
+    assert source.is_seekable()
+    assert packet_index(source.read()) == 0
+    source.seek(4.0)
+    assert source.tell() == 4.0
+    assert packet_index(source.read()) == 200
+    source.cleanup()
+
+
+class FakeProcess:
+    # Stands in for ffmpeg, its output being ``FakeProcess.output``.
+
+    output = b""
+    spawned: list = []
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.pid = len(FakeProcess.spawned)
+        self.returncode = None
+        self.stdout = io.BytesIO(self.output)
+        self.stdin = None
+        FakeProcess.spawned.append(self)
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+    def poll(self):
+        return self.returncode
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    FakeProcess.spawned = []
+    monkeypatch.setattr(player.subprocess, "Popen", FakeProcess)
+    return FakeProcess
+
+
+def pcm_frames(count: int) -> bytes:
+    return b"".join(bytes([i]) * FRAME_SIZE for i in range(count))
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_ffmpeg_create_prefetches(fake_ffmpeg) -> None:
+    fake_ffmpeg.output = pcm_frames(8)
+    source = run(FFmpegPCMAudio.create("song.mp3"))
+
+    (process,) = fake_ffmpeg.spawned
+    assert process.args[:3] == ["ffmpeg", "-i", "song.mp3"]
+    # the first frames are read before the source is returned
+    assert process.stdout.tell() == FFmpegPCMAudio.PREFETCH_FRAMES * FRAME_SIZE
+    assert source.prefetch(3) == FFmpegPCMAudio.PREFETCH_FRAMES
+
+    frames = []
+    while data := source.read():
+        frames.append(data[0])
+    assert frames == list(range(8))
+    assert source.tell() == 8 * FRAME_SIZE / 4 / 48000
+    source.cleanup()
+    assert process.returncode == -9
+
+
+def test_ffmpeg_prefetch_stops_at_end(fake_ffmpeg) -> None:
+    fake_ffmpeg.output = pcm_frames(2) + bytes(100)
+    source = run(FFmpegPCMAudio.create("song.mp3", prefetch=0))
+    assert fake_ffmpeg.spawned[0].stdout.tell() == 0
+
+    assert source.prefetch(5) == 2
+    assert [source.read()[0], source.read()[0]] == [0, 1]
+    assert source.read() == b""
+
+
+def test_ffmpeg_create_cleans_up_on_error(fake_ffmpeg) -> None:
+    class BrokenAudio(FFmpegPCMAudio):
+        def _read_frame(self) -> bytes:
+            raise OSError("broken pipe")
+
+    with pytest.raises(OSError):
+        run(BrokenAudio.create("song.mp3"))
+    assert fake_ffmpeg.spawned[0].returncode == -9
+
+
+def test_ffmpeg_seek_drops_prefetched_frames(fake_ffmpeg) -> None:
+    fake_ffmpeg.output = pcm_frames(8)
+    source = run(FFmpegPCMAudio.create("song.mp3"))
+
+    fake_ffmpeg.output = pcm_frames(1)
+    source.seek(2.5)
+    first, second = fake_ffmpeg.spawned
+    assert first.returncode == -9
+    assert second.args[1:5] == ["-ss", "2.500", "-i", "song.mp3"]
+    assert source.read()[0] == 0
+    assert source.read() == b""
+
+
+def test_ffmpeg_opus_create_skips_headers(fake_ffmpeg, tmp_path) -> None:
+    path = tmp_path / "audio.opus"
+    write_ogg_opus(path, 10)
+    fake_ffmpeg.output = path.read_bytes()
+
+    source = run(FFmpegOpusAudio.create("song.opus", codec="copy", prefetch=3))
+    assert source.prefetch(0) == 3
+    assert [packet_index(source.read()) for _ in range(10)] == list(range(10))
+    assert source.read() == b""
+
+
+@pytest.fixture
+def probe_cache():
+    FFmpegOpusAudio.clear_probe_cache()
+    yield
+    FFmpegOpusAudio.clear_probe_cache()
+
+
+def test_probe_cache_hit_and_miss(probe_cache) -> None:
+    calls = []
+
+    def method(source, executable):
+        calls.append(source)
+        return "opus", 96
+
+    async def probe():
+        results = [
+            await FFmpegOpusAudio.probe("a.webm", method=method),
+            await FFmpegOpusAudio.probe("a.webm", method=method),
+            await FFmpegOpusAudio.probe("b.webm", method=method),
+            await FFmpegOpusAudio.probe("a.webm", method=method, cache=False),
+            # a different executable is a different key
+            await FFmpegOpusAudio.probe("a.webm", method=method, executable="avconv"),
+        ]
+        return results
+
+    assert run(probe()) == [("opus", 96)] * 5
+    assert calls == ["a.webm", "b.webm", "a.webm", "a.webm"]
+
+
+def test_probe_cache_evicts_least_recently_used(probe_cache, monkeypatch) -> None:
+    monkeypatch.setattr(FFmpegOpusAudio, "PROBE_CACHE_SIZE", 2)
+    calls = []
+
+    def method(source, executable):
+        calls.append(source)
+        return "vorbis", 128
+
+    async def probe():
+        for source in ("a", "b", "a", "c", "a", "b"):
+            await FFmpegOpusAudio.probe(source, method=method)
+
+    run(probe())
+    # "b" was evicted by "c", while "a" stayed in use
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_probe_cache_skips_failures(probe_cache) -> None:
+    calls = []
+
+    def method(source, executable):
+        calls.append(source)
+        return None, None
+
+    async def probe():
+        await FFmpegOpusAudio.probe("a", method=method)
+        await FFmpegOpusAudio.probe("a", method=method)
+
+    run(probe())
+    assert calls == ["a", "a"]
+
+
+def test_from_probe_copies_opus(probe_cache, fake_ffmpeg) -> None:
+    async def from_probe():
+        return await FFmpegOpusAudio.from_probe(
+            "song.webm", method=lambda source, executable: ("opus", 96), prefetch=0
+        )
+
+    run(from_probe())
+    args = fake_ffmpeg.spawned[0].args
+    assert args[args.index("-c:a") + 1] == "copy"
@@ -0,0 +1,118 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import array
+import time
+import wave
+from types import SimpleNamespace
+
+from discord.sinks import multitrack
+from discord.sinks.multitrack import MultiTrackSink, mix_pcm
+from discord.voice_client import VoiceClient
+
+
+def _pcm(value: int, samples: int) -> bytes:
+    return array.array("h", [value] * samples * 2).tobytes()
+
+
+def _read(path: str) -> list[int]:
+    with wave.open(path, "rb") as f:
+        return list(array.array("h", f.readframes(f.getnframes())))
+
+
+def _voice_client(sink: MultiTrackSink) -> VoiceClient:
+    vc = VoiceClient.__new__(VoiceClient)
+    vc.user_timestamps = {}
+    vc.ws = SimpleNamespace(
+        ssrc_map={1: {"user_id": 10}, 2: {"user_id": 20}},
+    )
+    vc.sink = sink
+    sink.init(vc)
+    return vc
+
+
+def _receive(vc: VoiceClient, ssrc: int, receive_time: float, pcm: bytes) -> None:
+    data = SimpleNamespace(
+        ssrc=ssrc, timestamp=0, receive_time=receive_time, decoded_data=pcm
+    )
+    vc.recv_decoded_audio(data)
+
+
+def test_multitrack_aligns_and_mixes_tracks(tmp_path) -> None:
+    # keep everything pending until cleanup
+    sink = MultiTrackSink(directory=str(tmp_path), latency=10**6)
+    vc = _voice_client(sink)
+    assert vc.sync_start
+
+    now = time.perf_counter()
+    _receive(vc, 1, now, _pcm(1000, 4800))
+    # the second user starts speaking half a second later
+    _receive(vc, 2, now + 0.5, _pcm(2000, 4800))
+    sink.cleanup()
+
+    # the first packet of a user is assumed to end at its receive time
+    offset = 24000 - 960
+    end = offset + 4800
+    first = _read(sink.get_user_audio(10))
+    second = _read(sink.get_user_audio(20))
+    assert first == [1000] * 4800 * 2 + [0] * (end - 4800) * 2
+    assert second == [0] * offset * 2 + [2000] * 4800 * 2
+
+    mixed = _read(sink.mixdown_path)
+    assert mixed == [a + b for a, b in zip(first, second)]
+    assert sink.get_all_audio()[-1] == sink.mixdown_path
+
+
+def test_multitrack_flushes_while_recording(tmp_path) -> None:
+    sink = MultiTrackSink(directory=str(tmp_path), mixdown="mono")
+    vc = _voice_client(sink)
+    vc.first_packet_timestamp = 0
+    sink.audio_data[10] = multitrack.AudioTrack(str(tmp_path / "10.wav"))
+    sink.audio_data[20] = multitrack.AudioTrack(str(tmp_path / "20.wav"))
+
+    sink.audio_data[10].write(_pcm(100, 960) + _pcm(300, 960))
+    sink.flush(960)
+    assert sink.position == 960
+    assert sink.audio_data[20].flushed == 960
+
+    # audio for the part of the timeline that is already written is dropped
+    sink.audio_data[20].write(_pcm(500, 1920))
+    sink.cleanup()
+    assert sink.audio_data[20].dropped == 960
+
+    assert _read(str(tmp_path / "20.wav")) == [0] * 960 * 2 + [500] * 960 * 2
+    assert _read(sink.mixdown_path) == [100] * 960 + [800] * 960
+
+
+def test_mix_pcm_clips(monkeypatch) -> None:
+    chunks = [_pcm(30000, 2), _pcm(10000, 2), _pcm(-20000, 2)]
+    assert mix_pcm(chunks[:2]) == _pcm(0x7FFF, 2)
+    assert mix_pcm([_pcm(-30000, 2), _pcm(-10000, 2)]) == _pcm(-0x8000, 2)
+    assert mix_pcm(chunks, mono=True) == array.array("h", [20000] * 2).tobytes()
+
+    # the fallback without numpy gives the same results
+    monkeypatch.setattr(multitrack, "HAS_NUMPY", False)
+    assert mix_pcm(chunks[:2]) == _pcm(0x7FFF, 2)
+    assert mix_pcm(chunks, mono=True) == array.array("h", [20000] * 2).tobytes()
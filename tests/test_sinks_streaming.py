@@ -0,0 +1,178 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import io
+import os
+import wave
+
+import pytest
+
+from discord.sinks import streaming
+from discord.sinks.errors import SinkException, StreamSinkError
+from discord.sinks.streaming import FFmpegStreamSink, WaveStreamSink
+
+# 20ms of stereo 16 bit audio at 48kHz
+FRAME = 3840
+
+
+def _frame(value: int) -> bytes:
+    return bytes([value]) * FRAME
+
+
+def _read_wave(path: str) -> bytes:
+    with wave.open(path, "rb") as f:
+        assert f.getnchannels() == 2
+        assert f.getsampwidth() == 2
+        assert f.getframerate() == 48000
+        return f.readframes(f.getnframes())
+
+
+def test_wave_stream_sink_writes_each_user(tmp_path) -> None:
+    sink = WaveStreamSink(directory=str(tmp_path))
+    sink.write(_frame(1), 1)
+    sink.write(_frame(2), 2)
+    sink.write(_frame(3), 1)
+    sink.cleanup()
+
+    (first,) = sink.get_user_audio(1)
+    (second,) = sink.get_user_audio(2)
+    assert os.path.basename(first) == f"1-{sink.session}-0.wav"
+    assert _read_wave(first) == _frame(1) + _frame(3)
+    assert _read_wave(second) == _frame(2)
+    assert len(sink.get_all_audio()) == 2
+
+
+def test_wave_stream_sink_rotates_by_size(tmp_path) -> None:
+    sink = WaveStreamSink(directory=str(tmp_path), rotate_size=FRAME * 2)
+    for i in range(5):
+        sink.write(_frame(i), 1)
+    sink.cleanup()
+
+    files = sink.get_user_audio(1)
+    assert [_read_wave(path) for path in files] == [
+        _frame(0) + _frame(1),
+        _frame(2) + _frame(3),
+        _frame(4),
+    ]
+
+
+def test_wave_stream_sink_rotates_by_time(tmp_path) -> None:
+    # a file holds at least 0.04 seconds, i.e. two frames
+    sink = WaveStreamSink(directory=str(tmp_path), rotate_time=0.04)
+    for i in range(3):
+        sink.write(_frame(i), 1)
+    sink.cleanup()
+
+    files = sink.get_user_audio(1)
+    assert [_read_wave(path) for path in files] == [
+        _frame(0) + _frame(1),
+        _frame(2),
+    ]
+
+
+def test_stream_sink_filters_users(tmp_path) -> None:
+    sink = WaveStreamSink(directory=str(tmp_path), filters={"users": [2]})
+    sink.write(_frame(1), 1)
+    sink.write(_frame(2), 2)
+    sink.cleanup()
+
+    assert list(sink.audio_data) == [2]
+
+
+def test_stream_sink_rejects_writes_after_cleanup(tmp_path) -> None:
+    sink = WaveStreamSink(directory=str(tmp_path))
+    sink.write(_frame(1), 1)
+    sink.cleanup()
+
+    with pytest.raises(SinkException):
+        sink.audio_data[1].write(_frame(2))
+
+
+class _Stdin(io.BytesIO):
+    # Keeps its contents readable after being closed.
+
+    def close(self):
+        self.data = self.getvalue()
+        super().close()
+
+
+class _FakeProcess:
+    # Stands in for an ffmpeg process, keeping what was written to it.
+
+    instances: list = []
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.stdin = _Stdin()
+        self.waited = False
+        _FakeProcess.instances.append(self)
+
+    def wait(self):
+        self.waited = True
+
+    def poll(self):
+        return 1
+
+
+def test_ffmpeg_stream_sink_pipes_frames(monkeypatch, tmp_path) -> None:
+    _FakeProcess.instances = []
+    monkeypatch.setattr(streaming.subprocess, "Popen", _FakeProcess)
+
+    sink = FFmpegStreamSink(
+        directory=str(tmp_path), encoding="ogg", options="-b:a 64k", rotate_size=FRAME
+    )
+    sink.write(_frame(1), 1)
+    sink.write(_frame(2), 1)
+    sink.cleanup()
+
+    first, second = _FakeProcess.instances
+    assert [first.stdin.data, second.stdin.data] == [_frame(1), _frame(2)]
+    assert first.stdin.closed and first.waited
+    assert second.stdin.closed and second.waited
+    assert first.args[-6:] == [
+        "-b:a",
+        "64k",
+        "-f",
+        "ogg",
+        "-y",
+        sink.get_all_audio()[0],
+    ]
+
+
+def test_ffmpeg_stream_sink_reports_broken_pipe(monkeypatch, tmp_path) -> None:
+    class _BrokenStdin(_Stdin):
+        def write(self, data):
+            raise BrokenPipeError
+
+    class _ExitedProcess(_FakeProcess):
+        def __init__(self, args, **kwargs):
+            super().__init__(args, **kwargs)
+            self.stdin = _BrokenStdin()
+
+    monkeypatch.setattr(streaming.subprocess, "Popen", _ExitedProcess)
+    sink = FFmpegStreamSink(directory=str(tmp_path))
+
+    with pytest.raises(StreamSinkError, match="exited with code 1"):
+        sink.write(_frame(1), 1)
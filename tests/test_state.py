@@ -0,0 +1,124 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from discord.state import ConnectionState
+
+
+class WebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def request_chunks(self, guild_id, query=None, **kwargs) -> None:
+        self.sent.append(kwargs)
+
+
+def test_member_queries_by_id_are_batched() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        state = ConnectionState(
+            dispatch=None, handlers={}, hooks={}, http=None, loop=loop
+        )
+        ws = WebSocket()
+        state._get_websocket = lambda *args, **kwargs: ws
+        guild = SimpleNamespace(id=1)
+
+        async def query(user_id: int):
+            return await state.query_members(
+                guild, None, 1, [user_id], cache=False, presences=False
+            )
+
+        async def main():
+            tasks = [asyncio.ensure_future(query(i)) for i in (10, 20, 30)]
+            while not ws.sent:
+                await asyncio.sleep(0.01)
+
+            (sent,) = ws.sent
+            assert sorted(sent["user_ids"]) == [10, 20, 30]
+            members = [SimpleNamespace(id=20), SimpleNamespace(id=30)]
+            state.process_chunk_requests(1, sent["nonce"], members, True)
+            return await asyncio.gather(*tasks)
+
+        missing, second, third = loop.run_until_complete(main())
+        assert missing == []
+        assert [m.id for m in second] == [20]
+        assert [m.id for m in third] == [30]
+        assert not state._chunk_requests
+    finally:
+        loop.close()
+
+
+def test_member_names_are_only_updated_when_indexed() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        state = ConnectionState(
+            dispatch=None, handlers={}, hooks={}, http=None, loop=loop
+        )
+    finally:
+        loop.close()
+
+    updated = []
+    guild = SimpleNamespace(
+        _members={1: SimpleNamespace(id=1)}, _update_member_names=updated.append
+    )
+    state._guilds = {10: guild}
+    state._update_member_names(1)
+    assert updated == []
+
+    state.index_member_names = True
+    state._update_member_names(1)
+    assert [m.id for m in updated] == [1]
+
+
+def test_cancelled_member_query_fails_waiters() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        state = ConnectionState(
+            dispatch=None, handlers={}, hooks={}, http=None, loop=loop
+        )
+        state._get_websocket = lambda *args, **kwargs: WebSocket()
+
+        async def main():
+            query = asyncio.ensure_future(
+                state.query_members(
+                    SimpleNamespace(id=1), None, 1, [10], cache=False, presences=False
+                )
+            )
+            await asyncio.sleep(0)
+            (task,) = state._member_query_tasks
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(query, timeout=1.0)
+
+        loop.run_until_complete(main())
+        assert not state._member_query_tasks
+        assert not state._member_queries
+        assert not state._chunk_requests
+    finally:
+        loop.close()
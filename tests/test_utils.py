@@ -24,6 +24,8 @@ DEALINGS IN THE SOFTWARE.
 """
 
 # mypy: implicit-reexport=True
+import asyncio
+from types import SimpleNamespace
 from typing import TypeVar
 
 import pytest
@@ -34,6 +36,7 @@ from discord.utils import (
     _parse_ratelimit_header,
     _unique,
     async_all,
+    basic_autocomplete,
     copy_doc,
     find,
     get,
@@ -160,3 +163,58 @@ def test_temporary():
 #         values.append(coroutine(value) if random.choice((True, False)) else value)
 #
 #     assert all(raw_values) == await async_all(values)
+
+
+def _complete(callback, value, user_id=1, **options):
+    ctx = SimpleNamespace(
+        value=value,
+        interaction=SimpleNamespace(user=SimpleNamespace(id=user_id)),
+        focused=SimpleNamespace(name="value"),
+        options={"value": value, **options},
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        return list(loop.run_until_complete(callback(ctx)))
+    finally:
+        loop.close()
+
+
+def test_basic_autocomplete_static_values() -> None:
+    values = ["beta", "Alpha", "alps", "gamma", "al"]
+    callback = basic_autocomplete(values)
+    assert _complete(callback, "al") == ["Alpha", "alps", "al"]
+    assert _complete(callback, None) == values
+    assert _complete(callback, "z") == []
+
+    values.append("Alto")
+    assert _complete(callback, "alt") == ["Alto"]
+
+    values[0] = "alpine"
+    assert _complete(callback, "alp") == ["alpine", "Alpha", "alps"]
+
+
+def test_basic_autocomplete_cache_narrows() -> None:
+    calls = []
+
+    def values(ctx):
+        calls.append(ctx.value)
+        return ["apple", "apricot", "banana"]
+
+    callback = basic_autocomplete(values, cache_ttl=60)
+    assert _complete(callback, "a") == ["apple", "apricot"]
+    assert _complete(callback, "apr") == ["apricot"]
+    assert _complete(callback, "b") == ["banana"]
+    assert calls == ["a", "b"]
+
+    assert _complete(callback, "apr", user_id=2) == ["apricot"]
+    assert len(calls) == 3
+
+
+def test_basic_autocomplete_cache_depends_on_options() -> None:
+    def values(ctx):
+        return [f"{ctx.options['kind']}-{i}" for i in range(3)]
+
+    callback = basic_autocomplete(values, cache_ttl=60)
+    assert _complete(callback, "", kind="cat") == ["cat-0", "cat-1", "cat-2"]
+    assert _complete(callback, "", kind="dog") == ["dog-0", "dog-1", "dog-2"]
+    assert _complete(callback, "cat", kind=[]) == []
@@ -0,0 +1,203 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import socket
+import struct
+import threading
+from types import SimpleNamespace
+
+import nacl.bindings
+import nacl.exceptions
+import pytest
+
+from discord.opus import DecodeManager
+from discord.sinks.core import RawData
+from discord.voice_client import VoiceClient, VoicePacketizer
+from discord.voice_stats import VoiceStats
+from discord.voice_transport import BatchedVoiceTransport, VoiceTransport
+
+KEY = list(range(32))
+
+
+@pytest.mark.parametrize("mode", VoiceClient.supported_modes)
+def test_packetizer_round_trip(mode: str) -> None:
+    sender = VoicePacketizer(mode, KEY, 1234)
+    receiver = SimpleNamespace(packetizer=VoicePacketizer(mode, KEY, 5678))
+
+    for sequence in range(3):
+        payload = bytes([sequence]) * 50
+        packet = sender.packet(sequence, sequence * 960, payload)
+        data = RawData(packet, receiver)
+
+        assert data.sequence == sequence
+        assert data.timestamp == sequence * 960
+        assert data.ssrc == 1234
+        assert bytes(data.decrypted_data) == payload
+
+
+@pytest.mark.parametrize(
+    "mode", ["xsalsa20_poly1305_lite", "aead_xchacha20_poly1305_rtpsize"]
+)
+def test_packetizer_nonces_increase(mode: str) -> None:
+    packetizer = VoicePacketizer(mode, KEY, 1)
+    nonces = [packetizer.packet(0, 0, b"data")[-4:] for _ in range(3)]
+    assert nonces == [struct.pack(">I", i) for i in range(3)]
+
+
+def test_packetizer_rejects_tampered_packets() -> None:
+    packetizer = VoicePacketizer("aead_xchacha20_poly1305_rtpsize", KEY, 1)
+    packet = bytearray(packetizer.packet(1, 960, b"data"))
+    # the header is authenticated too
+    packet[3] ^= 0xFF
+
+    with pytest.raises(nacl.exceptions.CryptoError):
+        RawData(packet, SimpleNamespace(packetizer=packetizer))
+
+
+def test_rtpsize_decrypts_header_extension() -> None:
+    packetizer = VoicePacketizer("aead_xchacha20_poly1305_rtpsize", KEY, 1)
+    header = bytearray(struct.pack(">BBHII", 0x90, 0x78, 1, 960, 1234))
+    # the extension's header is sent in the clear, its body is encrypted
+    extension = struct.pack(">HH", 0xBEDE, 1)
+    body = b"\x10\xff\x00\x00" + b"opus"
+    nonce = bytes(24)
+    box = nacl.bindings.crypto_aead_xchacha20poly1305_ietf_encrypt(
+        body, bytes(header) + extension, nonce, bytes(KEY)
+    )
+    packet = bytes(header) + extension + box + nonce[:4]
+
+    data = RawData(packet, SimpleNamespace(packetizer=packetizer))
+    assert bytes(data.decrypted_data) == b"opus"
+
+
+def _receiving_client(loop, transport: VoiceTransport):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.setblocking(False)
+
+    vc = VoiceClient.__new__(VoiceClient)
+    vc.loop = loop
+    vc.socket = sock
+    vc.transport = transport
+    vc.mode = "aead_xchacha20_poly1305_rtpsize"
+    vc.secret_key = KEY
+    vc.ssrc = 1
+    vc._packetizer = None
+    vc.recording = True
+    vc.paused = False
+    vc._receiver = None
+    vc._reader_socket = None
+    vc._stats = VoiceStats()
+    vc.decoder = SimpleNamespace(decoded=[])
+    vc.decoder.decode = vc.decoder.decoded.append
+    return vc
+
+
+@pytest.mark.parametrize("transport", [VoiceTransport, BatchedVoiceTransport])
+def test_recv_ready_reads_every_packet(transport) -> None:
+    loop = asyncio.new_event_loop()
+    vc = _receiving_client(loop, transport())
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    packetizer = VoicePacketizer("aead_xchacha20_poly1305_rtpsize", KEY, 1234)
+
+    async def receive() -> None:
+        vc._add_socket_reader()
+        address = vc.socket.getsockname()
+        for sequence in range(100):
+            sender.sendto(packetizer.packet(sequence, sequence * 960, b"opus"), address)
+        # an RTCP packet is ignored
+        sender.sendto(bytes([0x80, 201]) + bytes(30), address)
+        while len(vc.decoder.decoded) < 100:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.01)
+
+    try:
+        loop.run_until_complete(asyncio.wait_for(receive(), 5))
+    finally:
+        vc._remove_socket_reader()
+        loop.close()
+        vc.socket.close()
+        sender.close()
+
+    decoded = vc.decoder.decoded
+    assert [data.sequence for data in decoded] == list(range(100))
+    # decryption is left to the decoder thread
+    assert all(data.decrypted_data is None for data in decoded)
+    assert {data.decrypt() for data in decoded} == {b"opus"}
+    assert vc._stats.receive[1234].packets_received == 100
+
+
+def test_recv_ready_ignores_packets_while_paused() -> None:
+    loop = asyncio.new_event_loop()
+    vc = _receiving_client(loop, VoiceTransport())
+    vc.paused = True
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    async def receive() -> None:
+        vc._add_socket_reader()
+        sender.sendto(bytes(40), vc.socket.getsockname())
+        await asyncio.sleep(0.05)
+
+    try:
+        loop.run_until_complete(receive())
+        # the packet was read from the socket nonetheless
+        with pytest.raises(BlockingIOError):
+            vc.socket.recv(4096)
+    finally:
+        vc._remove_socket_reader()
+        loop.close()
+        vc.socket.close()
+        sender.close()
+
+    assert vc.decoder.decoded == []
+
+
+def test_decode_manager_decrypts_packets() -> None:
+    received = []
+    done = threading.Event()
+
+    def recv_opus_audio(data):
+        received.append(bytes(data.decrypted_data))
+        done.set()
+
+    receiver = SimpleNamespace(
+        packetizer=VoicePacketizer("aead_xchacha20_poly1305_rtpsize", KEY, 1),
+        sink=SimpleNamespace(receive_opus=True),
+        recv_opus_audio=recv_opus_audio,
+    )
+    sender = VoicePacketizer("aead_xchacha20_poly1305_rtpsize", KEY, 1234)
+    tampered = bytearray(sender.packet(0, 0, b"lost"))
+    tampered[-5] ^= 0xFF
+
+    manager = DecodeManager(receiver)
+    manager.decode(RawData(tampered, receiver, decrypt=False))
+    manager.decode(RawData(sender.packet(1, 960, b"opus"), receiver, decrypt=False))
+    manager.start()
+    manager.stop()
+    manager.join(5)
+
+    # the packet that failed to decrypt is dropped
+    assert received == [b"opus"]
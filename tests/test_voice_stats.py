@@ -0,0 +1,62 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from discord.voice_stats import ReceiveStats, VoiceStats
+
+
+def test_receive_stats_loss_and_reordering() -> None:
+    stats = ReceiveStats(1)
+    for sequence in (65533, 65534, 0, 65535, 3):
+        stats.record(sequence, sequence * 960, 0.0)
+
+    assert stats.expected == 7
+    assert stats.packets_received == 5
+    assert stats.lost == 2
+    assert stats.reordered == 1
+
+
+def test_receive_stats_jitter() -> None:
+    stats = ReceiveStats(1)
+    for i in range(100):
+        stats.record(i, (i * 960) & 0xFFFFFFFF, i * 0.02)
+    assert stats.jitter < 1e-6
+
+    stats = ReceiveStats(1)
+    for i in range(200):
+        # every other packet arrives 10ms late
+        stats.record(i, i * 960, i * 0.02 + (i % 2) * 0.01)
+    assert 0.009 < stats.jitter < 0.011
+
+
+def test_voice_stats_lateness_histogram() -> None:
+    stats = VoiceStats()
+    for lateness in (-0.001, 0.0005, 0.003, 0.5):
+        stats.record_lateness(lateness)
+
+    assert stats.lateness[0] == 2
+    assert stats.lateness[2] == 1
+    assert stats.lateness[-1] == 1
+    assert stats.max_lateness == 0.5
+    assert stats.to_dict()["lateness"]["inf"] == 1
@@ -0,0 +1,156 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import ctypes
+import errno
+import socket
+import time
+
+import pytest
+
+from discord import voice_transport
+from discord.voice_client import VoiceClient
+from discord.voice_stats import VoiceStats
+from discord.voice_transport import BatchedVoiceTransport, VoiceTransport
+
+pytestmark = pytest.mark.skipif(
+    not voice_transport.has_mmsg, reason="sendmmsg is not available"
+)
+
+
+def _udp_pair() -> tuple[socket.socket, socket.socket]:
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.setblocking(False)
+    return sender, receiver
+
+
+def _drain(transport: VoiceTransport, sock: socket.socket, count: int) -> list[bytes]:
+    sock.setblocking(False)
+    receiver = transport.receiver()
+    packets: list[bytes] = []
+    deadline = time.monotonic() + 2
+    while len(packets) < count and time.monotonic() < deadline:
+        packets.extend(bytes(view) for view in receiver.recv(sock))
+        if len(packets) < count:
+            time.sleep(0.001)
+    return packets
+
+
+def test_batched_transport_sends_and_receives() -> None:
+    sender, receiver = _udp_pair()
+    transport = BatchedVoiceTransport(interval=0.001, batch_size=4)
+    try:
+        address = receiver.getsockname()
+        sent = [bytes([i]) * 20 for i in range(10)]
+        for packet in sent[:5]:
+            transport.send(sender, address, packet)
+        for packet in sent[5:]:
+            transport.send(sender, address, bytearray(packet))
+
+        assert _drain(transport, receiver, 10) == sent
+        assert transport.collect_dropped(sender) == 0
+    finally:
+        transport.close()
+        sender.close()
+        receiver.close()
+
+
+def test_batched_transport_close_flushes_and_stops_thread() -> None:
+    sender, receiver = _udp_pair()
+    transport = BatchedVoiceTransport(interval=60)
+    try:
+        address = receiver.getsockname()
+        transport.send(sender, address, b"first")
+        thread = transport._thread
+        assert thread is not None and thread.is_alive()
+
+        transport.close()
+        assert not thread.is_alive()
+        assert transport._thread is None
+        assert _drain(transport, receiver, 1) == [b"first"]
+
+        # sending again starts a new thread
+        transport.send(sender, address, b"second")
+        assert transport._thread is not None and transport._thread is not thread
+        transport.close()
+        assert _drain(transport, receiver, 1) == [b"second"]
+    finally:
+        transport.close()
+        sender.close()
+        receiver.close()
+
+
+class _FullLibc:
+    # Accepts the first ``accept`` packets, then fails like a full socket buffer.
+
+    def __init__(self, accept: int):
+        self.accept = accept
+
+    def sendmmsg(self, fd, msgs, count, flags) -> int:
+        if self.accept:
+            sent = min(count, self.accept)
+            self.accept -= sent
+            return sent
+        ctypes.set_errno(errno.EAGAIN)
+        return -1
+
+
+def test_batched_transport_reports_drops(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(voice_transport, "_libc", _FullLibc(accept=3))
+    sender, receiver = _udp_pair()
+    transport = BatchedVoiceTransport(interval=60)
+    try:
+        for _ in range(5):
+            transport.send(sender, receiver.getsockname(), b"packet")
+        transport.close()
+
+        assert transport.collect_dropped(sender) == 2
+        assert transport.collect_dropped(sender) == 0
+    finally:
+        sender.close()
+        receiver.close()
+
+
+def test_voice_client_counts_batched_drops() -> None:
+    sender, receiver = _udp_pair()
+
+    class _Transport(VoiceTransport):
+        def collect_dropped(self, sock: socket.socket) -> int:
+            return 2 if sock is sender else 0
+
+    client = VoiceClient.__new__(VoiceClient)
+    client.socket = sender
+    client.transport = _Transport()
+    client._stats = VoiceStats()
+    client._stats.packets_sent = 5
+    try:
+        client._collect_dropped()
+        assert client._stats.packets_sent == 3
+        assert client._stats.packets_dropped == 2
+    finally:
+        sender.close()
+        receiver.close()